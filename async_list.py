@@ -0,0 +1,172 @@
+import asyncio
+from collections import deque
+
+from doubly_linked_list import DoublyLinkedList
+
+
+# ------------------------------
+# asyncio Doubly LinkedList queue
+# ------------------------------
+class AsyncDoublyLinkedList:
+    """DoublyLinkedList with awaitable additions and removals for asyncio.
+
+    Like ``asyncio.Queue`` this uses no thread locks and is meant for a
+    single event loop. A Future is only created for a coroutine that has to
+    wait: ``pop``/``pop_first`` on an empty list, or an addition to a list
+    that is at ``capacity``. Waiters are woken in arrival order, whichever
+    end they take from.
+
+    Cancelling a waiting call removes it without losing a value: if a value
+    was already handed to a cancelled waiter, the next waiter is woken
+    instead.
+
+    The ``*_nowait`` methods never wait: removals return None on an empty
+    list and additions return False on a full one.
+    """
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+        self._capacity = capacity
+        self._list = DoublyLinkedList()
+        self._getters = deque()
+        self._putters = deque()
+
+    # -------------------------------
+    # Properties: length, capacity
+    # -------------------------------
+    @property
+    def length(self):
+        return self._list.length
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def __len__(self):
+        return self._list.length
+
+    def __iter__(self):
+        return iter(self._list)
+
+    def validate(self):
+        """Check the underlying list and the capacity; return True or raise ValueError"""
+        self._list.validate()
+        if self._capacity is not None and self._list.length > self._capacity:
+            raise ValueError("List holds more values than its capacity.")
+        return True
+
+    def empty(self):
+        return self._list.length == 0
+
+    def full(self):
+        return self._capacity is not None and self._list.length >= self._capacity
+
+    # -------------------------------
+    # Waiters
+    # -------------------------------
+    @staticmethod
+    def _wakeup_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters, blocked):
+        """Wait until blocked() is False, leaving the queue as found on cancel"""
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not blocked() and not waiter.cancelled():
+                    # We were woken but will not use our turn; pass it on
+                    self._wakeup_next(waiters)
+                raise
+
+    def _added(self):
+        self._wakeup_next(self._getters)
+        return True
+
+    def _removed(self, node):
+        self._wakeup_next(self._putters)
+        return node
+
+    # -------------------------------
+    # Additions
+    # -------------------------------
+    def put_nowait(self, value):
+        """Add a value at the end; False if the list is full"""
+        if self.full():
+            return False
+        self._list.append(value)
+        return self._added()
+
+    def put_first_nowait(self, value):
+        """Add a value at the beginning; False if the list is full"""
+        if self.full():
+            return False
+        self._list.prepend(value)
+        return self._added()
+
+    def insert_nowait(self, index, value):
+        """Insert a value at index; False if the list is full or index is out of range"""
+        if self.full() or not self._list.insert(index, value):
+            return False
+        return self._added()
+
+    async def put(self, value):
+        """Add a value at the end, waiting for room if the list is full"""
+        if self.full():
+            await self._wait(self._putters, self.full)
+        return self.put_nowait(value)
+
+    async def put_first(self, value):
+        """Add a value at the beginning, waiting for room if the list is full"""
+        if self.full():
+            await self._wait(self._putters, self.full)
+        return self.put_first_nowait(value)
+
+    async def insert(self, index, value):
+        """Insert a value at index (0 jumps the queue), waiting for room"""
+        if self.full():
+            await self._wait(self._putters, self.full)
+        return self.insert_nowait(index, value)
+
+    # -------------------------------
+    # Removals
+    # -------------------------------
+    def pop_nowait(self):
+        """Remove and return the last node, or None if the list is empty"""
+        if self.empty():
+            return None
+        return self._removed(self._list.pop())
+
+    def pop_first_nowait(self):
+        """Remove and return the first node, or None if the list is empty"""
+        if self.empty():
+            return None
+        return self._removed(self._list.pop_first())
+
+    async def pop(self):
+        """Remove and return the last node, waiting for one if the list is empty"""
+        if self.empty():
+            await self._wait(self._getters, self.empty)
+        return self.pop_nowait()
+
+    async def pop_first(self):
+        """Remove and return the first node, waiting for one if the list is empty"""
+        if self.empty():
+            await self._wait(self._getters, self.empty)
+        return self.pop_first_nowait()
+
+    def print_list(self):
+        """Print the linked list in a readable format."""
+        self._list.print_list()
@@ -0,0 +1,353 @@
+"""Reproducible benchmark suite for every documented DoublyLinkedList method.
+
+Run all methods across sizes and save the results:
+
+    python3 bench_suite.py run --out results.json
+    python3 bench_suite.py run --sizes 10 1000 100000 --methods get insert
+
+Compare two runs and flag regressions (exit status 1 if any):
+
+    python3 bench_suite.py compare baseline.json results.json --threshold 0.1
+
+For every method and size the suite records operations per second (best of
+--repeat runs), the peak memory allocated while the operation runs
+(tracemalloc, measured in a separate untimed pass), and per method the
+scaling exponent k in time-per-op ~ n**k, fitted over all sizes.
+"""
+import argparse
+import contextlib
+import datetime
+import gc
+import io
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from doubly_linked_list import DoublyLinkedList
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+SEED = 1234
+
+# ------------------------------
+# Data and batch sizes
+# ------------------------------
+
+def shuffled(n, rng):
+    values = list(range(n))
+    rng.shuffle(values)
+    return values
+
+
+def build_list(n, rng):
+    return DoublyLinkedList.from_iterable(shuffled(n, rng))
+
+
+def build_palindrome(n, rng):
+    half = [rng.randrange(100) for _ in range(n // 2)]
+    return DoublyLinkedList.from_iterable(half + [0] * (n % 2) + half[::-1])
+
+
+def build_duplicates(n, rng):
+    return DoublyLinkedList.from_iterable(rng.randrange(n // 2 + 1) for _ in range(n))
+
+
+def build_zeros(n, rng):
+    # All-zero bits: random bits would make binary_to_decimal's big-int
+    # arithmetic, not the list walk, dominate at large n
+    return DoublyLinkedList.from_iterable([0] * n)
+
+
+def constant_batch(n):
+    """Operations per run for O(1) methods."""
+    return min(n, 10_000)
+
+
+def linear_batch(n):
+    """Operations per run for methods that walk up to n nodes."""
+    return max(3, min(1_000, 1_000_000 // n))
+
+
+def copies(n):
+    """Lists timed together per run, so tiny sizes are not lost in timer noise."""
+    return max(1, min(1_000, 100_000 // n))
+
+# ------------------------------
+# One case per documented method: run(dll, n, rng) -> operations done
+# ------------------------------
+
+def run_append(dll, n, rng):
+    k = constant_batch(n)
+    for value in range(k):
+        dll.append(value)
+    return k
+
+
+def run_prepend(dll, n, rng):
+    k = constant_batch(n)
+    for value in range(k):
+        dll.prepend(value)
+    return k
+
+
+def run_pop(dll, n, rng):
+    k = constant_batch(n)
+    for _ in range(k):
+        dll.pop()
+    return k
+
+
+def run_pop_first(dll, n, rng):
+    k = constant_batch(n)
+    for _ in range(k):
+        dll.pop_first()
+    return k
+
+
+def run_get(dll, n, rng):
+    indexes = [rng.randrange(n) for _ in range(linear_batch(n))]
+    for index in indexes:
+        dll.get(index)
+    return len(indexes)
+
+
+def run_set_value(dll, n, rng):
+    indexes = [rng.randrange(n) for _ in range(linear_batch(n))]
+    for index in indexes:
+        dll.set_value(index, -1)
+    return len(indexes)
+
+
+def run_insert(dll, n, rng):
+    indexes = [rng.randrange(n) for _ in range(linear_batch(n))]
+    for index in indexes:
+        dll.insert(index, -1)
+    return len(indexes)
+
+
+def run_remove(dll, n, rng):
+    k = min(linear_batch(n), n)
+    indexes = [rng.randrange(n - i) for i in range(k)]
+    for index in indexes:
+        dll.remove(index)
+    return k
+
+
+def run_reverse(dll, n, rng):
+    dll.reverse()
+    return 1
+
+
+def run_reverse_between(dll, n, rng):
+    dll.reverse_between(n // 4, n - 1 - n // 4)
+    return 1
+
+
+def run_partition_list(dll, n, rng):
+    dll.partition_list(n // 2)
+    return 1
+
+
+def run_swap_pairs(dll, n, rng):
+    dll.swap_pairs()
+    return 1
+
+
+def run_is_palindrome(dll, n, rng):
+    dll.is_palindrome()
+    return 1
+
+
+def run_find_middle_node(dll, n, rng):
+    dll.find_middle_node()
+    return 1
+
+
+def run_find_kth_from_end(dll, n, rng):
+    dll.find_kth_from_end(n // 3 + 1)
+    return 1
+
+
+def run_has_loop(dll, n, rng):
+    dll.has_loop()
+    return 1
+
+
+def run_remove_duplicates(dll, n, rng):
+    dll.remove_duplicates()
+    return 1
+
+
+def run_binary_to_decimal(dll, n, rng):
+    dll.binary_to_decimal()
+    return 1
+
+
+def run_make_empty(dll, n, rng):
+    dll.make_empty()
+    return 1
+
+
+def run_print_list(dll, n, rng):
+    with contextlib.redirect_stdout(io.StringIO()):
+        dll.print_list()
+    return 1
+
+
+CASES = {
+    "append": (build_list, run_append),
+    "prepend": (build_list, run_prepend),
+    "pop": (build_list, run_pop),
+    "pop_first": (build_list, run_pop_first),
+    "insert": (build_list, run_insert),
+    "remove": (build_list, run_remove),
+    "get": (build_list, run_get),
+    "set_value": (build_list, run_set_value),
+    "reverse": (build_list, run_reverse),
+    "reverse_between": (build_list, run_reverse_between),
+    "partition_list": (build_list, run_partition_list),
+    "swap_pairs": (build_list, run_swap_pairs),
+    "is_palindrome": (build_palindrome, run_is_palindrome),
+    "find_middle_node": (build_list, run_find_middle_node),
+    "find_kth_from_end": (build_list, run_find_kth_from_end),
+    "has_loop": (build_list, run_has_loop),
+    "remove_duplicates": (build_duplicates, run_remove_duplicates),
+    "binary_to_decimal": (build_zeros, run_binary_to_decimal),
+    "make_empty": (build_list, run_make_empty),
+    "print_list": (build_list, run_print_list),
+}
+
+# ------------------------------
+# Measurement
+# ------------------------------
+
+def measure(name, n, repeat=3, memory=True):
+    """Benchmark one method at one size; the list is rebuilt for every run."""
+    build, run = CASES[name]
+    best = math.inf
+    for attempt in range(repeat):
+        rng = random.Random(SEED + attempt)
+        # Small sizes run on several lists so each timing spans enough work
+        lists = [build(n, rng) for _ in range(copies(n))]
+        # Keep collector passes over large lists out of the timed region
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            ops = sum(run(dll, n, rng) for dll in lists)
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = min(best, elapsed / ops)
+        del lists
+    result = {"ops_per_sec": 1 / best if best else math.inf, "seconds_per_op": best}
+    if memory:
+        rng = random.Random(SEED)
+        dll = build(n, rng)
+        tracemalloc.start()
+        run(dll, n, rng)
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def scaling_exponent(by_size):
+    """Least-squares slope of log(seconds per op) against log(n)."""
+    points = [(math.log(int(n)), math.log(r["seconds_per_op"]))
+              for n, r in by_size.items() if r["seconds_per_op"] > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def run_suite(methods, sizes, repeat=3, memory=True, log=print):
+    results = {}
+    exponents = {}
+    for name in methods:
+        by_size = {}
+        for n in sizes:
+            by_size[str(n)] = measure(name, n, repeat, memory)
+            r = by_size[str(n)]
+            peak = f"{r['peak_bytes'] / 1024:10.1f} KiB" if memory else ""
+            log(f"{name:<18} n={n:<10,} {r['ops_per_sec']:14,.0f} ops/s {peak}")
+        results[name] = by_size
+        exponents[name] = scaling_exponent(by_size)
+        if exponents[name] is not None:
+            log(f"{name:<18} scaling exponent {exponents[name]:.2f}")
+    return {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": SEED,
+            "repeat": repeat,
+        },
+        "results": results,
+        "exponents": exponents,
+    }
+
+
+def compare(old, new, threshold=0.1):
+    """Return (method, size, ratio) for every slowdown beyond threshold."""
+    regressions = []
+    for name, by_size in new["results"].items():
+        for n, result in by_size.items():
+            before = old["results"].get(name, {}).get(n)
+            if before is None:
+                continue
+            ratio = result["ops_per_sec"] / before["ops_per_sec"]
+            if ratio < 1 - threshold:
+                regressions.append((name, int(n), ratio))
+    return regressions
+
+# ------------------------------
+# Command line
+# ------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DoublyLinkedList benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    run_parser.add_argument("--methods", nargs="+", default=list(CASES),
+                            choices=list(CASES), metavar="METHOD")
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--no-memory", action="store_true",
+                            help="skip the tracemalloc peak-memory pass")
+    run_parser.add_argument("--out", default="bench_results.json")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="allowed slowdown as a fraction (default 0.1)")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        report = run_suite(args.methods, args.sizes, args.repeat, not args.no_memory)
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved results to {args.out}")
+        return 0
+
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    regressions = compare(old, new, args.threshold)
+    for name, n, ratio in regressions:
+        print(f"REGRESSION {name:<18} n={n:<10,} {ratio:6.2f}x of baseline speed")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,488 @@
+import asyncio
+import concurrent.futures
+import gc
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+from async_list import AsyncDoublyLinkedList
+from concurrent_list import ConcurrentDoublyLinkedList
+import doubly_linked_list
+from doubly_linked_list import DoublyLinkedList
+from helpers import print_title
+from intrusive_list import IntrusiveDoublyLinkedList, IntrusiveNode
+from lazy_reverse_list import LazyReverseDoublyLinkedList
+from persistent_list import PersistentList
+from pooled_list import PooledDoublyLinkedList
+from unrolled_list import UnrolledDoublyLinkedList
+
+# ------------------------------
+# Benchmark helpers
+# ------------------------------
+
+class DictNode:
+    """The original Node layout, with a per-instance __dict__."""
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+        self.prev = None
+
+
+def build_dict_chain(n):
+    """Build a chain of DictNode objects (the pre-__slots__ layout)."""
+    head = tail = DictNode(0)
+    for _ in range(n - 1):
+        node = DictNode(0)
+        tail.next = node
+        node.prev = tail
+        tail = node
+    return head
+
+
+def build_slotted_list(n):
+    dll = DoublyLinkedList(0)
+    for _ in range(n - 1):
+        dll.append(0)
+    return dll
+
+
+def build_pooled_list(n):
+    dll = PooledDoublyLinkedList(0)
+    for _ in range(n - 1):
+        dll.append(0)
+    return dll
+
+
+def timed(func):
+    """Return the seconds taken by one call of func()."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def walk_nodes(dll):
+    node = dll.head
+    while node:
+        node = node.next
+
+
+def walk_blocks(dll):
+    block = dll._head
+    while block:
+        for _ in block.values:
+            pass
+        block = block.next
+
+
+class LockedDoublyLinkedList:
+    """A DoublyLinkedList behind one lock: the usual way to share it."""
+    def __init__(self):
+        self._list = DoublyLinkedList()
+        self._ready = threading.Condition()
+
+    def append(self, value, timeout=0):
+        with self._ready:
+            self._list.append(value)
+            self._ready.notify()
+        return True
+
+    def pop_first(self, timeout=0):
+        with self._ready:
+            self._ready.wait_for(lambda: self._list.length, timeout)
+            return self._list.pop_first()
+
+
+def run_producers_consumers(dll, threads, n):
+    """Move n values from `threads` producers to as many consumers."""
+    def produce():
+        for value in range(n // threads):
+            dll.append(value, timeout=None)
+
+    def consume():
+        for _ in range(n // threads):
+            dll.pop_first(timeout=None)
+
+    workers = [threading.Thread(target=target)
+               for _ in range(threads) for target in (produce, consume)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+async def run_async_queue(put, get, n):
+    """Move n values from one producer task to one consumer task."""
+    async def produce():
+        for value in range(n):
+            await put(value)
+
+    async def consume():
+        for _ in range(n):
+            await get()
+
+    await asyncio.gather(produce(), consume())
+
+
+def measure_bytes(build, n):
+    """Return bytes allocated (and still alive) by build(n)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = build(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return after - before
+
+# ------------------------------
+# Benchmarks
+# ------------------------------
+
+def bench_node_memory(n=100_000):
+    """Compare per-element bytes of the three node layouts."""
+    print_title(f"NODE MEMORY ({n:,} elements, shared payload)")
+    layouts = [
+        ("dict Node", build_dict_chain),
+        ("slotted Node", build_slotted_list),
+        ("array pool", build_pooled_list),
+    ]
+    for name, build in layouts:
+        per_element = measure_bytes(build, n) / n
+        print(f"{name:<14} {per_element:8.1f} bytes/element")
+
+
+def bench_bulk_load(n=10_000_000):
+    """Compare an append loop against from_iterable for loading n ints."""
+    print_title(f"BULK LOAD ({n:,} integers)")
+    gc.collect()
+    start = time.perf_counter()
+    dll = DoublyLinkedList()
+    for value in range(n):
+        dll.append(value)
+    append_time = time.perf_counter() - start
+    del dll
+    gc.collect()
+    start = time.perf_counter()
+    dll = DoublyLinkedList.from_iterable(range(n))
+    bulk_time = time.perf_counter() - start
+    del dll
+    print(f"append loop    {append_time:8.2f} s")
+    print(f"from_iterable  {bulk_time:8.2f} s")
+    print(f"speedup        {append_time / bulk_time:8.2f} x")
+
+
+def bench_unrolled(n=1_000_000):
+    """Compare scans and memory of the unrolled list against Node chains."""
+    print_title(f"UNROLLED VS NODE LIST ({n:,} elements)")
+    zeros = [0] * n
+    node_bytes = measure_bytes(lambda k: DoublyLinkedList.from_iterable(zeros[:k]), n)
+    block_bytes = measure_bytes(lambda k: UnrolledDoublyLinkedList.from_iterable(zeros[:k]), n)
+    print(f"{'memory':<20} {node_bytes / n:8.1f} {block_bytes / n:8.1f} bytes/element")
+
+    node_list = DoublyLinkedList.from_iterable(zeros)
+    block_list = UnrolledDoublyLinkedList.from_iterable(zeros)
+    scans = [
+        ("iteration", walk_nodes, walk_blocks),
+        ("is_palindrome", DoublyLinkedList.is_palindrome,
+         UnrolledDoublyLinkedList.is_palindrome),
+        ("binary_to_decimal", DoublyLinkedList.binary_to_decimal,
+         UnrolledDoublyLinkedList.binary_to_decimal),
+        ("remove_duplicates", DoublyLinkedList.remove_duplicates,
+         UnrolledDoublyLinkedList.remove_duplicates),
+    ]
+    print(f"{'':<20} {'Node':>8} {'unrolled':>8}")
+    for name, node_scan, block_scan in scans:
+        node_time = timed(lambda: node_scan(node_list))
+        block_time = timed(lambda: block_scan(block_list))
+        print(f"{name:<20} {node_time:8.3f} {block_time:8.3f} s"
+              f"   ({node_time / block_time:.1f}x)")
+
+
+def bench_concurrent(n=400_000):
+    """Producer/consumer throughput: two-lock list against one global lock."""
+    print_title(f"CONCURRENT THROUGHPUT ({n:,} values)")
+    print(f"{'threads':<8} {'one lock':>10} {'two locks':>10}")
+    for threads in (1, 2, 4):
+        single = timed(lambda: run_producers_consumers(
+            LockedDoublyLinkedList(), threads, n))
+        double = timed(lambda: run_producers_consumers(
+            ConcurrentDoublyLinkedList(), threads, n))
+        print(f"{threads:<8} {n / single:10,.0f} {n / double:10,.0f} values/s"
+              f"   ({single / double:.2f}x)")
+
+
+def bench_async(n=1_000_000):
+    """Producer/consumer throughput: AsyncDoublyLinkedList against asyncio.Queue."""
+    print_title(f"ASYNC THROUGHPUT ({n:,} values)")
+    for capacity in (None, 1_000):
+        queue = asyncio.Queue(capacity or 0)
+        dll = AsyncDoublyLinkedList(capacity)
+        queue_time = timed(lambda: asyncio.run(
+            run_async_queue(queue.put, queue.get, n)))
+        dll_time = timed(lambda: asyncio.run(
+            run_async_queue(dll.put, dll.pop_first, n)))
+        print(f"capacity {str(capacity):<6} asyncio.Queue {n / queue_time:12,.0f}"
+              f"   list {n / dll_time:12,.0f} values/s"
+              f"   ({queue_time / dll_time:.2f}x)")
+
+
+def end_operations(n, cls=DoublyLinkedList):
+    dll = cls()
+    for value in range(n):
+        dll.append(value)
+    for _ in range(n):
+        dll.pop()
+    for value in range(n):
+        dll.prepend(value)
+    for _ in range(n):
+        dll.pop_first()
+
+
+def bench_hot_paths(n=200_000):
+    """Time append/pop/prepend/pop_first loops, and the same with DEBUG checks."""
+    print_title(f"HOT PATHS ({n:,} values)")
+    print(f"append/pop/prepend/pop_first loop: {timed(lambda: end_operations(n)):.3f} s")
+    dll = DoublyLinkedList(0)
+    start = time.perf_counter()
+    for _ in range(n):
+        dll.length, dll.head, dll.tail
+    print(f"{n:,} reads of length/head/tail:   {time.perf_counter() - start:.3f} s")
+    small = 2_000
+    doubly_linked_list.set_debug(True)
+    try:
+        checked = timed(lambda: end_operations(small))
+    finally:
+        doubly_linked_list.set_debug(False)
+    print(f"same loop with set_debug(True), {small:,} values: {checked:.3f} s"
+          f" (unchecked: {timed(lambda: end_operations(small)):.4f} s)")
+
+
+def bench_numeric(n=1_000_000):
+    """Compare whole-list methods of NumericDoublyLinkedList against Node chains."""
+    print_title(f"NUMERIC VS NODE LIST ({n:,} bits)")
+    try:
+        import numpy as np
+        from numeric_list import NumericDoublyLinkedList
+    except ImportError:
+        print("NumPy is not installed; skipped.")
+        return
+    bits = [0, 1] * (n // 4)
+    bits += bits[::-1]
+    node_list = DoublyLinkedList.from_iterable(bits)
+    print(f"to_numpy(int64):    {timed(lambda: node_list.to_numpy(np.int64)):.3f} s")
+    array = node_list.to_numpy(np.int64)
+    print(f"from_numpy:         {timed(lambda: DoublyLinkedList.from_numpy(array)):.3f} s")
+
+    def partitioned(cls):
+        dll = cls.from_numpy(array)
+        return timed(lambda: dll.partition_list(1))
+
+    def deduplicated(cls):
+        dll = cls.from_numpy(array)
+        return timed(dll.remove_duplicates)
+
+    numeric_list = NumericDoublyLinkedList.from_numpy(array)
+    short_list = DoublyLinkedList.from_numpy(array[:50_000])
+    short_numeric = NumericDoublyLinkedList.from_numpy(array[:50_000])
+    scans = [
+        ("is_palindrome", lambda: timed(node_list.is_palindrome),
+         lambda: timed(numeric_list.is_palindrome)),
+        # Big-int arithmetic makes the per-node loop quadratic, so use 50,000 bits
+        ("binary_to_decimal", lambda: timed(short_list.binary_to_decimal),
+         lambda: timed(short_numeric.binary_to_decimal)),
+        ("sum", lambda: timed(lambda: sum(node_list)), lambda: timed(numeric_list.sum)),
+        ("partition_list", lambda: partitioned(DoublyLinkedList),
+         lambda: partitioned(NumericDoublyLinkedList)),
+        ("remove_duplicates", lambda: deduplicated(DoublyLinkedList),
+         lambda: deduplicated(NumericDoublyLinkedList)),
+    ]
+    print(f"{'':<20} {'Node':>8} {'numeric':>8}")
+    for name, node_scan, numeric_scan in scans:
+        node_time = node_scan()
+        numeric_time = numeric_scan()
+        print(f"{name:<20} {node_time:8.3f} {numeric_time:8.3f} s"
+              f"   ({node_time / numeric_time:.0f}x)")
+
+
+def bench_lazy_reverse(n=1_000_000):
+    """Time reverse() and end operations: DoublyLinkedList against the lazy-reverse list."""
+    print_title(f"LAZY REVERSE ({n:,} values)")
+    print(f"{'':<24} {'Node':>10} {'lazy':>10}")
+    lists = [cls.from_iterable(range(n))
+             for cls in (DoublyLinkedList, LazyReverseDoublyLinkedList)]
+    times = [timed(lambda: [dll.reverse() for _ in range(10)]) / 10 for dll in lists]
+    print(f"{'reverse()':<24} {times[0]:10.6f} {times[1]:10.6f} s")
+    gc.disable()
+    try:
+        times = [timed(lambda: end_operations(n // 5, type(dll))) for dll in lists]
+    finally:
+        gc.enable()
+    print(f"{'end operations':<24} {times[0]:10.3f} {times[1]:10.3f} s")
+
+
+def bench_persistent(n=1_000_000, updates=1_000):
+    """Point-in-time copies: copying a DoublyLinkedList against PersistentList.snapshot()."""
+    print_title(f"SNAPSHOTS ({n:,} values)")
+    dll = DoublyLinkedList.from_iterable(range(n))
+    persistent = PersistentList(range(n))
+    print(f"{'':<28} {'Node copy':>10} {'persistent':>10}")
+    copy_time = timed(lambda: DoublyLinkedList.from_iterable(dll))
+    snapshot_time = timed(persistent.snapshot)
+    print(f"{'copy / snapshot':<28} {copy_time:10.3f} {snapshot_time:10.6f} s")
+    rng = random.Random(0)
+    indexes = [rng.randrange(n) for _ in range(updates)]
+
+    def update_dll():
+        for index in indexes:
+            dll.set_value(index, -1)
+
+    def update_persistent():
+        snapshot = persistent.snapshot()
+        for index in indexes:
+            persistent.set_value(index, -1)
+        return snapshot
+
+    gc.disable()
+    try:
+        times = timed(update_dll), timed(update_persistent)
+    finally:
+        gc.enable()
+    print(f"{f'{updates:,} set_value at random':<28} {times[0]:10.3f} {times[1]:10.3f} s")
+
+
+def _walk_values(dll):
+    """The unchecked head-to-tail walk __iter__ did before it checked versions"""
+    node = dll.head
+    while node is not None:
+        yield node.value
+        node = node.next
+
+
+def bench_snapshot_view(n=1_000_000, updates=10_000):
+    """Read-only snapshot views: cost of taking one, reading it, and editing under it."""
+    print_title(f"SNAPSHOT VIEWS ({n:,} values)")
+    dll = DoublyLinkedList.from_iterable(range(n))
+    copy_time = timed(lambda: DoublyLinkedList.from_iterable(dll))
+    snapshot_time = timed(dll.snapshot)
+    print(f"{'copy / snapshot()':<34} {copy_time:10.3f} {snapshot_time:10.6f} s")
+    plain = timed(lambda: sum(_walk_values(dll)))
+    checked = timed(lambda: sum(dll))
+    view = timed(lambda: sum(dll.snapshot()))
+    print(f"{'sum: unchecked walk':<34} {plain:10.3f} s")
+    print(f"{'sum: version-checked __iter__':<34} {checked:10.3f} s  ({checked / plain - 1:+.0%})")
+    print(f"{'sum: snapshot view':<34} {view:10.3f} s")
+
+    def queue_edits():
+        for value in range(updates):
+            dll.pop_first()
+            dll.append(value)
+
+    gc.disable()
+    try:
+        alone = timed(queue_edits)
+        view = dll.snapshot()
+        shared = timed(queue_edits)
+    finally:
+        gc.enable()
+    print(f"{f'{updates:,} pop_first + append':<34} {alone:10.3f} s alone, "
+          f"{shared:.3f} s under a snapshot ({view.shared:,} nodes still shared)")
+
+
+def _parse_payload(text):
+    """A per-value transform heavy enough to be worth shipping to a worker"""
+    record = json.loads(text)
+    return sum(len(tag) for tag in record["tags"]) * record["score"]
+
+
+def bench_parallel(n=200_000, worker_counts=(1, 2, 4, 8, 16)):
+    """parallel_map over JSON payloads, serial against a process pool of growing size."""
+    print_title(f"PARALLEL MAP ({n:,} JSON payloads, {os.cpu_count()} CPUs)")
+    dll = DoublyLinkedList.from_iterable(
+        json.dumps({"id": i, "tags": [f"tag{j}" for j in range(i % 20)], "score": i % 7})
+        for i in range(n))
+    serial = timed(lambda: DoublyLinkedList.from_iterable(_parse_payload(v) for v in dll))
+    print(f"{'serial walk':<12} {serial:8.3f} s")
+    for workers in worker_counts:
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            # Start the workers first, so the timing leaves out process startup
+            list(pool.map(abs, range(workers)))
+            elapsed = timed(lambda: dll.parallel_map(_parse_payload, executor=pool,
+                                                     max_workers=workers))
+        print(f"{f'{workers} workers':<12} {elapsed:8.3f} s  ({serial / elapsed:.2f}x)")
+
+
+class _Record:
+    __slots__ = ("key", "payload")
+
+    def __init__(self, key):
+        self.key = key
+        self.payload = None
+
+
+class _LinkedRecord(IntrusiveNode):
+    __slots__ = ("key", "payload")
+
+    def __init__(self, key):
+        self.key = key
+        self.payload = None
+
+
+def bench_intrusive(n=1_000_000, removals=10_000):
+    """Linking existing records: Node wrappers against an intrusive list."""
+    print_title(f"INTRUSIVE LIST ({n:,} records)")
+    records = [_Record(i) for i in range(n)]
+    linked = [_LinkedRecord(i) for i in range(n)]
+    wrapped = measure_bytes(lambda k: DoublyLinkedList.from_iterable(records[:k]), n) / n
+    intrusive = measure_bytes(lambda k: IntrusiveDoublyLinkedList.from_iterable(linked[:k]), n) / n
+    growth = sys.getsizeof(linked[0]) - sys.getsizeof(records[0])
+    print(f"{'':<30} {'Node':>8} {'intrusive':>10}")
+    print(f"{'bytes allocated per record':<30} {wrapped:8.1f} {intrusive:10.1f}"
+          f"  (+{growth} bytes inside each linked record)")
+
+    def append_all(dll, items):
+        for item in items:
+            dll.append(item)
+        return dll
+
+    gc.collect()
+    node_time = timed(lambda: append_all(DoublyLinkedList(), records))
+    gc.collect()
+    intrusive_list = IntrusiveDoublyLinkedList()
+    intrusive_time = timed(lambda: append_all(intrusive_list, linked))
+    print(f"{'append loop':<30} {node_time:8.3f} {intrusive_time:10.3f} s")
+    # The Node list needs a record -> node dict to remove a record in O(1)
+    node_list = DoublyLinkedList()
+    nodes = {}
+    for record in records:
+        node_list.append(record)
+        nodes[record] = node_list.tail
+    victims = random.Random(0).sample(range(n), removals)
+    node_time = timed(lambda: [node_list.unlink(nodes.pop(records[i])) for i in victims])
+    intrusive_time = timed(lambda: [intrusive_list.unlink(linked[i]) for i in victims])
+    print(f"{f'{removals:,} removals by record':<30} {node_time:8.3f} {intrusive_time:10.3f} s"
+          f"  (Node list also keeps a {n:,}-entry dict)")
+
+
+BENCHMARKS = {
+    "memory": bench_node_memory,
+    "bulk": bench_bulk_load,
+    "unrolled": bench_unrolled,
+    "concurrent": bench_concurrent,
+    "async": bench_async,
+    "hotpaths": bench_hot_paths,
+    "numeric": bench_numeric,
+    "lazyreverse": bench_lazy_reverse,
+    "persistent": bench_persistent,
+    "snapshotview": bench_snapshot_view,
+    "parallel": bench_parallel,
+    "intrusive": bench_intrusive,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
@@ -0,0 +1,170 @@
+from doubly_linked_list import DoublyLinkedList
+
+
+# ------------------------------
+# Least-recently-used cache
+# ------------------------------
+class LRUCache:
+    """Fixed-capacity cache that evicts the least recently used key.
+
+    Entries are (key, value) tuples in a DoublyLinkedList ordered from most
+    to least recently used, with a dict from key to node. Lookups and
+    updates move the node to the front and evictions pop the tail, all in
+    O(1). ``on_evict(key, value)`` is called for every evicted entry.
+    """
+
+    def __init__(self, capacity, on_evict=None):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+        self.capacity = capacity
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self._nodes = {}
+        self._order = DoublyLinkedList()
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        return key in self._nodes
+
+    def get(self, key, default=None):
+        """Return the value for key and mark it most recently used"""
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._order.move_to_front(node)
+        return node.value[1]
+
+    def put(self, key, value):
+        """Store value under key, evicting the least recently used entry if full"""
+        node = self._nodes.get(key)
+        if node is not None:
+            node.value = (key, value)
+            self._order.move_to_front(node)
+            return
+        if len(self._nodes) >= self.capacity:
+            self._evict()
+        self._order.prepend((key, value))
+        self._nodes[key] = self._order.head
+
+    def remove(self, key):
+        """Drop key from the cache; return its value, or None if absent"""
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return None
+        self._order.unlink(node)
+        return node.value[1]
+
+    def keys(self):
+        """Return the keys from most to least recently used"""
+        return [key for key, _ in self._order]
+
+    def _evict(self):
+        key, value = self._order.pop().value
+        del self._nodes[key]
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+
+# ------------------------------
+# Least-frequently-used cache
+# ------------------------------
+class LFUCache:
+    """Fixed-capacity cache that evicts the least frequently used key.
+
+    Each access count has its own DoublyLinkedList bucket of [key, value,
+    count] entries, most recent first, so ties on the lowest count are
+    broken by evicting the least recently used entry. Lookups, updates and
+    evictions are O(1). ``on_evict(key, value)`` is called for every
+    evicted entry.
+    """
+
+    def __init__(self, capacity, on_evict=None):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+        self.capacity = capacity
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self._nodes = {}
+        self._buckets = {}
+        self._min_count = 0
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, key):
+        return key in self._nodes
+
+    def get(self, key, default=None):
+        """Return the value for key and count the access"""
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return self._touch(node).value[1]
+
+    def put(self, key, value):
+        """Store value under key, evicting the least frequently used entry if full"""
+        node = self._nodes.get(key)
+        if node is not None:
+            node.value[1] = value
+            self._touch(node)
+            return
+        if len(self._nodes) >= self.capacity:
+            self._evict()
+        self._nodes[key] = self._push([key, value, 1])
+        self._min_count = 1
+
+    def remove(self, key):
+        """Drop key from the cache; return its value, or None if absent"""
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return None
+        self._take(node)
+        return node.value[1]
+
+    def frequency(self, key):
+        """Return how many times key was stored or read, or 0 if absent"""
+        node = self._nodes.get(key)
+        return node.value[2] if node else 0
+
+    def _push(self, entry):
+        bucket = self._buckets.get(entry[2])
+        if bucket is None:
+            bucket = self._buckets[entry[2]] = DoublyLinkedList()
+        bucket.prepend(entry)
+        return bucket.head
+
+    def _take(self, node):
+        count = node.value[2]
+        bucket = self._buckets[count]
+        bucket.unlink(node)
+        if bucket.length == 0:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+
+    def _touch(self, node):
+        self._take(node)
+        node.value[2] += 1
+        new_node = self._push(node.value)
+        self._nodes[node.value[0]] = new_node
+        return new_node
+
+    def _evict(self):
+        if self._min_count not in self._buckets:
+            # remove() emptied the lowest bucket; rescan the counts in use
+            self._min_count = min(self._buckets)
+        bucket = self._buckets[self._min_count]
+        key, value, count = bucket.pop().value
+        if bucket.length == 0:
+            del self._buckets[count]
+        del self._nodes[key]
+        if self.on_evict is not None:
+            self.on_evict(key, value)
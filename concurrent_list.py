@@ -0,0 +1,240 @@
+import threading
+import time
+
+from doubly_linked_list import Node
+
+
+# ------------------------------
+# Thread-safe Doubly LinkedList (two-lock deque)
+# ------------------------------
+class ConcurrentDoublyLinkedList:
+    """Deque-style doubly linked list that is safe to share between threads.
+
+    The nodes hang between a head and a tail sentinel. ``prepend`` and
+    ``pop_first`` take the head lock, ``append`` and ``pop`` take the tail
+    lock, so a producer at one end and a consumer at the other do not block
+    each other. As in the Michael-Scott two-lock queue, the count lock is
+    held only to claim a value (or, after linking, to publish one), never
+    while nodes are linked. The two ends can only touch the same link
+    fields when the list holds at most one value; an operation that finds
+    no value (additions) or only one (removals) takes both locks instead,
+    always head first.
+
+    ``timeout`` works like ``queue.Queue``: 0 (the default) never waits,
+    None waits as long as needed, and a positive number waits up to that
+    many seconds. ``pop``/``pop_first`` return None when no value arrived
+    in time; with a ``capacity``, ``append``/``prepend`` return False when
+    no room was freed in time.
+    """
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+        self._capacity = capacity
+        self._head = Node(None)
+        self._tail = Node(None)
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        # _count: linked values not yet claimed by a removal; an addition
+        # counts its value only once it is linked, so _count never exceeds
+        # the nodes actually in the list
+        # _size: values linked or being linked (only tracked with a capacity)
+        self._count_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._count_lock)
+        self._not_full = threading.Condition(self._count_lock)
+        self._count = 0
+        self._size = 0
+
+    # -------------------------------
+    # Properties: length, capacity
+    # -------------------------------
+    @property
+    def length(self):
+        return self._count
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def __len__(self):
+        return self._count
+
+    def validate(self):
+        """Check links, counts and capacity with every lock held; return True or raise ValueError"""
+        with self._head_lock, self._tail_lock, self._count_lock:
+            count = 0
+            node = self._head
+            while node.next is not self._tail:
+                if node.next is None or node.next.prev is not node:
+                    raise ValueError(f"Broken link after index {count - 1}.")
+                node = node.next
+                count += 1
+                if count > self._count:
+                    raise ValueError("More nodes than length, or a cycle.")
+            if self._tail.prev is not node:
+                raise ValueError("Tail sentinel does not point back at the last node.")
+            if count != self._count:
+                raise ValueError(f"Length is {self._count} but the list has {count} nodes.")
+            if self._capacity is not None and not count <= self._size <= self._capacity:
+                raise ValueError("Reserved size is out of step with the values.")
+        return True
+
+    def __iter__(self):
+        """Yield a snapshot of the values, taken while both ends are locked"""
+        with self._head_lock, self._tail_lock:
+            values = []
+            node = self._head.next
+            while node is not self._tail:
+                values.append(node.value)
+                node = node.next
+        return iter(values)
+
+    # -------------------------------
+    # Locking helpers
+    # -------------------------------
+    @staticmethod
+    def _deadline(timeout):
+        return None if timeout is None else time.monotonic() + timeout
+
+    @staticmethod
+    def _wait(condition, predicate, deadline):
+        """Wait on condition (held) until predicate() holds; False on timeout"""
+        if deadline is None:
+            condition.wait_for(predicate)
+            return True
+        return condition.wait_for(predicate, max(0, deadline - time.monotonic()))
+
+    def _wait_for_value(self, deadline):
+        with self._count_lock:
+            return self._wait(self._not_empty, lambda: self._count > 0, deadline)
+
+    def _reserve_slot(self, deadline):
+        with self._count_lock:
+            if not self._wait(self._not_full, lambda: self._size < self._capacity, deadline):
+                return False
+            self._size += 1
+            return True
+
+    # -------------------------------
+    # Linking at the ends (caller holds the lock for that end)
+    # -------------------------------
+    def _link_first(self, node):
+        first = self._head.next
+        node.prev = self._head
+        node.next = first
+        first.prev = node
+        self._head.next = node
+
+    def _link_last(self, node):
+        last = self._tail.prev
+        node.next = self._tail
+        node.prev = last
+        last.next = node
+        self._tail.prev = node
+
+    def _unlink_first(self):
+        node = self._head.next
+        self._head.next = node.next
+        node.next.prev = self._head
+        node.next = node.prev = None
+        return node
+
+    def _unlink_last(self):
+        node = self._tail.prev
+        self._tail.prev = node.prev
+        node.prev.next = self._tail
+        node.next = node.prev = None
+        return node
+
+    def _add(self, value, own_lock, link, timeout):
+        if self._capacity is not None and not self._reserve_slot(self._deadline(timeout)):
+            return False
+        node = Node(value)
+        with own_lock:
+            with self._count_lock:
+                nonempty = self._count >= 1
+            if nonempty:
+                # The other end cannot remove the last value without this
+                # lock, so the neighbour being linked to stays in place
+                link(node)
+                self._publish()
+                return True
+        with self._head_lock, self._tail_lock:
+            link(node)
+            self._publish()
+        return True
+
+    def _publish(self):
+        """Count a freshly linked value and wake one waiting remover"""
+        with self._count_lock:
+            self._count += 1
+            self._not_empty.notify()
+
+    def _claim(self, minimum):
+        """Take one value off the count if at least minimum are unclaimed"""
+        with self._count_lock:
+            if self._count >= minimum:
+                self._count -= 1
+                return True
+            return False
+
+    def _remove(self, own_lock, unlink, timeout):
+        deadline = self._deadline(timeout)
+        while True:
+            with own_lock:
+                # With two or more unclaimed values the far end's node and
+                # its neighbour's links are never the ones unlinked here
+                if self._claim(2):
+                    node = unlink()
+                    break
+            with self._head_lock, self._tail_lock:
+                if self._claim(1):
+                    node = unlink()
+                    break
+            if not self._wait_for_value(deadline):
+                return None
+        if self._capacity is not None:
+            with self._count_lock:
+                self._size -= 1
+                self._not_full.notify()
+        return node
+
+    # -------------------------------
+    # Core methods
+    # -------------------------------
+    def append(self, value, timeout=0):
+        """Add a node at the end; False if the list stayed full past timeout"""
+        return self._add(value, self._tail_lock, self._link_last, timeout)
+
+    def prepend(self, value, timeout=0):
+        """Add a node at the beginning; False if the list stayed full past timeout"""
+        return self._add(value, self._head_lock, self._link_first, timeout)
+
+    def pop(self, timeout=0):
+        """Remove and return the last node, or None if none arrived in time"""
+        return self._remove(self._tail_lock, self._unlink_last, timeout)
+
+    def pop_first(self, timeout=0):
+        """Remove and return the first node, or None if none arrived in time"""
+        return self._remove(self._head_lock, self._unlink_first, timeout)
+
+    def make_empty(self):
+        """Reset the linked list to empty"""
+        with self._head_lock, self._tail_lock, self._count_lock:
+            self._head.next = self._tail
+            self._tail.prev = self._head
+            if self._capacity is not None:
+                self._size -= self._count
+            self._count = 0
+            self._not_full.notify_all()
+
+    def print_list(self):
+        """Print the linked list in a readable format."""
+        values = [str(value) for value in self]
+        if not values:
+            print("empty list")
+        else:
+            values.append("None")
+            print(" <-> ".join(values))
@@ -1,17 +1,128 @@
+import functools
+import gc
+import itertools
+import operator
+import weakref
+
 # ------------------------------
 # Node class for doubly linked list
 # ------------------------------
 class Node:
+    __slots__ = ("value", "next", "prev")
+
     def __init__(self, value):
         self.value = value
         self.next = None
         self.prev = None
 
+# Marker for "no initial value", so None can still be stored
+_EMPTY = object()
+
+
+def _build_chain(iterable, backward=False):
+    """Link the values of iterable into a detached chain.
+
+    Returns (first, last, count). With backward=True each value is linked
+    in front of the previous one, so the chain comes out reversed.
+
+    The cyclic garbage collector is paused while the chain is built: every
+    new node is reachable, so collections triggered by the burst of
+    allocations would only rescan live nodes.
+    """
+    values = iter(iterable)
+    for value in values:
+        first = last = Node(value)
+        break
+    else:
+        return None, None, 0
+    count = 1
+    # Node.__new__ skips the __init__ call; every slot is filled below
+    new = Node.__new__
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        if backward:
+            for count, value in enumerate(values, 2):
+                node = new(Node)
+                node.value = value
+                node.next = first
+                first.prev = node
+                first = node
+            first.prev = None
+        else:
+            for count, value in enumerate(values, 2):
+                node = new(Node)
+                node.value = value
+                node.prev = last
+                last.next = node
+                last = node
+            last.next = None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return first, last, count
+
+
+def _merge_chains(out, left, right, reverse):
+    """Stably merge two None-terminated chains onto out.next.
+
+    Chains are linked through .next only and each node's sort key is kept
+    in its .prev. If a comparison raises, the nodes not merged yet are
+    still linked after out, so no node is lost.
+    """
+    tail = out
+    try:
+        if reverse:
+            while left is not None and right is not None:
+                if left.prev < right.prev:
+                    tail.next = tail = right
+                    right = right.next
+                else:
+                    tail.next = tail = left
+                    left = left.next
+        else:
+            while left is not None and right is not None:
+                if right.prev < left.prev:
+                    tail.next = tail = right
+                    right = right.next
+                else:
+                    tail.next = tail = left
+                    left = left.next
+    finally:
+        if left is None:
+            tail.next = right
+        else:
+            tail.next = left
+            if right is not None:
+                while tail.next is not None:
+                    tail = tail.next
+                tail.next = right
+
 # ------------------------------
 # Doubly LinkedList class with methods
 # ------------------------------
 class DoublyLinkedList:
-    def __init__(self, value):
+    # Fixed fields: no per-instance __dict__, faster attribute access.
+    # Subclasses that do not declare __slots__ still get a __dict__.
+    __slots__ = ("__head", "__tail", "__length", "__version", "__finger",
+                 "__finger_index", "__finger_version", "__views", "_debug_depth",
+                 "__weakref__")
+
+    def __init__(self, value=_EMPTY):
+        # Structural modification counter and the last node reached by get()
+        self.__version = 0
+        self.__finger = None
+        self.__finger_index = 0
+        self.__finger_version = -1
+        # Live snapshot() views that still share nodes with this list
+        self.__views = None
+        # How many checked mutators are running on this list (debug mode)
+        self._debug_depth = 0
+        if value is _EMPTY:
+            self.__head = None
+            self.__tail = None
+            self.__length = 0
+            return
         new_node = Node(value)
         self.__head = new_node
         self.__tail = new_node
@@ -27,6 +138,7 @@ class DoublyLinkedList:
     @head.setter
     def head(self, node):
         self.__head = node
+        self.__version += 1
 
     @property
     def tail(self):
@@ -35,6 +147,7 @@ class DoublyLinkedList:
     @tail.setter
     def tail(self, node):
         self.__tail = node
+        self.__version += 1
 
     @property
     def length(self):
@@ -44,9 +157,135 @@ class DoublyLinkedList:
     def length(self, value):
         if value >= 0:
             self.__length = value
+            self.__version += 1
         else:
             raise ValueError("Length cannot be negative.")
 
+    @property
+    def version(self):
+        """Counter bumped by every change to the list's structure."""
+        return self.__version
+
+    # -------------------------------
+    # Iteration protocol
+    # -------------------------------
+    def __len__(self):
+        return self.__length
+
+    def __iter__(self):
+        """Yield the values from head to tail.
+
+        Raises RuntimeError if the list's structure changes before the
+        next value is read; iterate over a snapshot() to keep reading.
+        """
+        version = self.__version
+        node = self.__head
+        while node is not None:
+            yield node.value
+            if self.__version != version:
+                raise RuntimeError("DoublyLinkedList changed during iteration")
+            node = node.next
+
+    def __reversed__(self):
+        """Yield the values from tail to head (RuntimeError on a structural change)"""
+        version = self.__version
+        node = self.__tail
+        while node is not None:
+            yield node.value
+            if self.__version != version:
+                raise RuntimeError("DoublyLinkedList changed during iteration")
+            node = node.prev
+
+    def __contains__(self, value):
+        for item in self:
+            if item is value or item == value:
+                return True
+        return False
+
+    def iter_nodes(self, reverse=False):
+        """Yield the nodes from head to tail, or tail to head if reverse.
+
+        Raises RuntimeError if the list's structure changes in between.
+        """
+        version = self.__version
+        if reverse:
+            node = self.__tail
+            while node is not None:
+                yield node
+                if self.__version != version:
+                    raise RuntimeError("DoublyLinkedList changed during iteration")
+                node = node.prev
+        else:
+            node = self.__head
+            while node is not None:
+                yield node
+                if self.__version != version:
+                    raise RuntimeError("DoublyLinkedList changed during iteration")
+                node = node.next
+
+    def values_slice(self, start=0, stop=None):
+        """Lazily yield the values at indexes start..stop-1 (slice semantics).
+
+        The first node is reached through get(), which walks from whichever
+        of head, tail or the finger is nearest.
+        """
+        start, stop, _ = slice(start, stop).indices(self.__length)
+        if start >= stop:
+            return
+        node = self.get(start)
+        version = self.__version
+        for _ in range(stop - start):
+            yield node.value
+            if self.__version != version:
+                raise RuntimeError("DoublyLinkedList changed during iteration")
+            node = node.next
+
+    # -------------------------------
+    # Snapshot views sharing nodes with the list
+    # -------------------------------
+    def snapshot(self):
+        """Return a read-only SnapshotView of the current values in O(1).
+
+        The view shares this list's nodes instead of copying them. Adding
+        at either end never disturbs it; removing from an end copies only
+        the removed value into the view, and set_value() only the old
+        value. Any other relinking first copies the view's remaining shared
+        values, once.
+        """
+        view = SnapshotView(self.__head, self.__tail, self.__length)
+        if self.__length:
+            if self.__views is None:
+                self.__views = weakref.WeakSet()
+            self.__views.add(view)
+        return view
+
+    def _detach_views(self):
+        """Give every snapshot its own copy before nodes are relinked in the middle"""
+        views = self.__views
+        if views:
+            for view in list(views):
+                view._detach()
+        self.__views = None
+
+    def _release_from_views(self, node):
+        """Let snapshots copy the value of node, which is about to leave an end"""
+        views = self.__views
+        for view in list(views):
+            if view._release(node):
+                views.discard(view)
+
+    def _save_value(self, node):
+        """Let snapshots keep node's value before it is overwritten"""
+        if self.__views:
+            for view in self.__views:
+                view._save(node)
+
+    def _set_node_value(self, node, value):
+        """Overwrite node's value; subclasses that index values re-index here"""
+        if self.__views:
+            self._save_value(node)
+        node.value = value
+
     # -------------------------------
     # Core methods (unchanged logic)
     # -------------------------------
@@ -55,11 +294,7 @@ class DoublyLinkedList:
         if self.__head is None:
             print("empty list")
         else:
-            values = []
-            temp = self.__head
-            while temp:
-                values.append(str(temp.value))
-                temp = temp.next
+            values = [str(value) for value in self]
             values.append("None")
             print(" <-> ".join(values))
 
@@ -68,6 +303,10 @@ class DoublyLinkedList:
         self.__head = None
         self.__tail = None
         self.__length = 0
+        self.__finger = None
+        # The old nodes are no longer reachable from here, so snapshots keep them
+        self.__views = None
+        self.__version += 1
 
     def append(self, value):
         """Add a node at the end"""
@@ -80,13 +319,97 @@ class DoublyLinkedList:
             new_node.prev = self.__tail
             self.__tail = new_node
         self.__length += 1
+        self.__version += 1
+        return True
+
+    def extend(self, iterable):
+        """Add every value from iterable at the end, linking them as one chain"""
+        first, last, count = _build_chain(iterable)
+        if count == 0:
+            return True
+        if self.__length == 0:
+            self.__head = first
+        else:
+            self.__tail.next = first
+            first.prev = self.__tail
+        self.__tail = last
+        self.__length += count
+        self.__version += 1
         return True
 
+    def extendleft(self, iterable):
+        """Prepend every value from iterable (the values end up reversed)"""
+        first, last, count = _build_chain(iterable, backward=True)
+        if count == 0:
+            return True
+        if self.__length == 0:
+            self.__tail = last
+        else:
+            self.__head.prev = last
+            last.next = self.__head
+        self.__head = first
+        self.__length += count
+        self.__version += 1
+        return True
+
+    @classmethod
+    def from_iterable(cls, iterable=()):
+        """Build a new list from iterable; an empty iterable gives an empty list"""
+        dll = cls()
+        dll.extend(iterable)
+        return dll
+
+    def dump(self, path):
+        """Save the values to a binary file (see persistence.py)"""
+        from persistence import dump
+        dump(self, path)
+
+    @classmethod
+    def load(cls, path):
+        """Build a new list from a file written by dump(); only load trusted files (see persistence.load)"""
+        from persistence import load
+        return load(path, cls)
+
+    def parallel_map(self, fn, chunk_size=None, max_workers=None, executor=None):
+        """Return a new DoublyLinkedList of fn(value) for each value, computed in worker processes (see parallel.py)"""
+        from parallel import parallel_map
+        return parallel_map(self, fn, chunk_size, max_workers, executor)
+
+    def parallel_filter(self, pred, chunk_size=None, max_workers=None, executor=None):
+        """Return a new DoublyLinkedList of the values for which pred is true, tested in worker processes"""
+        from parallel import parallel_filter
+        return parallel_filter(self, pred, chunk_size, max_workers, executor)
+
+    def parallel_reduce(self, fn, init, chunk_size=None, max_workers=None, executor=None):
+        """Fold the values with an associative fn from init, batch by batch in worker processes"""
+        from parallel import parallel_reduce
+        return parallel_reduce(self, fn, init, chunk_size, max_workers, executor)
+
+    def to_numpy(self, dtype=None):
+        """Return the values as a NumPy array (NumPy must be installed).
+
+        With a dtype the array is allocated once at full length and filled
+        in a single walk; without one NumPy infers it from the values.
+        """
+        import numpy as np
+        if dtype is None:
+            return np.array(list(self))
+        return np.fromiter(self, dtype, count=self.__length)
+
+    @classmethod
+    def from_numpy(cls, array):
+        """Build a new list from a 1-D NumPy array, one node per element"""
+        if array.ndim != 1:
+            raise ValueError("Expected a 1-D array.")
+        return cls.from_iterable(array.tolist())
+
     def pop(self):
         """Remove and return the last node"""
         if self.__length == 0:
             return None
         temp = self.__tail
+        if self.__views:
+            self._release_from_views(temp)
         if self.__length == 1:
             self.__head = None
             self.__tail = None
@@ -95,6 +418,7 @@ class DoublyLinkedList:
             self.__tail.next = None
             temp.prev = None
         self.__length -= 1
+        self.__version += 1
         return temp
 
     def prepend(self, value):
@@ -108,6 +432,7 @@ class DoublyLinkedList:
             self.__head.prev = new_node
             self.__head = new_node
         self.__length += 1
+        self.__version += 1
         return True
 
     def pop_first(self):
@@ -115,6 +440,8 @@ class DoublyLinkedList:
         if self.__length == 0:
             return None
         temp = self.__head
+        if self.__views:
+            self._release_from_views(temp)
         if self.__length == 1:
             self.__head = None
             self.__tail = None
@@ -123,27 +450,53 @@ class DoublyLinkedList:
             self.__head.prev = None
             temp.next = None
         self.__length -= 1
+        self.__version += 1
         return temp
 
     def get(self, index):
-        """Return the node at the specified index"""
-        if index < 0 or index >= self.__length:
+        """Return the node at the specified index.
+
+        The walk starts from whichever of head, tail or the node found by
+        the previous get() (the "finger") is closest, so sequential access
+        like get(i), get(i + 1) costs O(1) per call.
+        """
+        length = self.__length
+        if index < 0 or index >= length:
             return None
-        if index < self.__length / 2:
+        if index < length / 2:
             temp = self.__head
-            for _ in range(index):
-                temp = temp.next
+            steps = index
         else:
             temp = self.__tail
-            for _ in range(self.__length - 1, index, -1):
+            steps = index - length + 1
+        if self.__finger_version == self.__version:
+            offset = index - self.__finger_index
+            if abs(offset) < abs(steps):
+                temp = self.__finger
+                steps = offset
+        if steps > 0:
+            for _ in range(steps):
+                temp = temp.next
+        else:
+            for _ in range(-steps):
                 temp = temp.prev
+        self.__finger = temp
+        self.__finger_index = index
+        self.__finger_version = self.__version
         return temp
 
+    def cursor(self, index=0):
+        """Return a Cursor on the node at index, or None if out of range"""
+        node = self.get(index)
+        if node is None:
+            return None
+        return Cursor(self, node, index)
+
     def set_value(self, index, value):
         """Set the value at the specified index"""
         temp = self.get(index)
         if temp:
-            temp.value = value
+            self._set_node_value(temp, value)
             return True
         return False
 
@@ -155,16 +508,16 @@ class DoublyLinkedList:
             return self.prepend(value)
         if index == self.__length:
             return self.append(value)
-        new_node = Node(value)
         before = self.get(index - 1)
-        after = before.next
-        new_node.prev = before
-        new_node.next = after
-        before.next = new_node
-        after.prev = new_node
-        self.__length += 1
+        self._insert_node_after(before, value)
+        self._keep_finger(before, index - 1)
         return True
 
+    def _keep_finger(self, node, index):
+        """After an edit that left node at index, keep the finger if get() put it there"""
+        if node is not None and node is self.__finger and index == self.__finger_index:
+            self.__finger_version = self.__version
+
     def remove(self, index):
         """Remove and return the node at the specified index"""
         if index < 0 or index >= self.__length:
@@ -174,13 +527,330 @@ class DoublyLinkedList:
         if index == self.__length - 1:
             return self.pop()
         temp = self.get(index)
-        temp.prev.next = temp.next
-        temp.next.prev = temp.prev
-        temp.next = None
-        temp.prev = None
-        self.__length -= 1
+        after = temp.next
+        self._unlink_node(temp)
+        # The node after the removed one now sits at index
+        self.__finger = after
+        self.__finger_index = index
+        self.__finger_version = self.__version
         return temp
 
+    def insert_many(self, index, iterable):
+        """Insert every value from iterable starting at index.
+
+        The new nodes are linked into one chain first, then the list is
+        walked once to index and the chain is spliced in with one relink.
+        """
+        if index < 0 or index > self.__length:
+            return False
+        first, last, count = _build_chain(iterable)
+        if count == 0:
+            return True
+        before = self.get(index - 1) if index else None
+        self._link_chain_after(before, first, last, count)
+        self._keep_finger(before, index - 1)
+        return True
+
+    def _link_chain_after(self, before, first, last, count):
+        """Splice the detached chain first..last of count nodes in after before (None means at the front)"""
+        after = self.__head if before is None else before.next
+        if self.__views and before is not None and after is not None:
+            self._detach_views()
+        first.prev = before
+        last.next = after
+        if before is None:
+            self.__head = first
+        else:
+            before.next = first
+        if after is None:
+            self.__tail = last
+        else:
+            after.prev = last
+        self.__length += count
+        self.__version += 1
+
+    def remove_range(self, start, stop):
+        """Remove the nodes at indexes start..stop-1 (slice semantics).
+
+        The walk to start and on to stop - 1 goes through get(), whose
+        finger makes the second lookup at most stop - start steps, and the
+        nodes are cut out with one relink. Returns how many were removed.
+        """
+        start, stop, _ = slice(start, stop).indices(self.__length)
+        if start >= stop:
+            return 0
+        first = self.get(start)
+        last = self.get(stop - 1)
+        after = last.next
+        self._unlink_chain(first, last, stop - start)
+        if after is not None:
+            # The node after the cut now sits at start
+            self.__finger = after
+            self.__finger_index = start
+            self.__finger_version = self.__version
+        return stop - start
+
+    def _unlink_chain(self, first, last, count):
+        """Cut the run first..last of count nodes out of the list with one relink"""
+        before = first.prev
+        after = last.next
+        if self.__views:
+            if before is None:
+                # Cut from the head: snapshots copy the removed values front first
+                node = first
+                for _ in range(count):
+                    following = node.next
+                    self._release_from_views(node)
+                    node = following
+            elif after is None:
+                node = last
+                for _ in range(count):
+                    following = node.prev
+                    self._release_from_views(node)
+                    node = following
+            else:
+                self._detach_views()
+        if before is None:
+            self.__head = after
+        else:
+            before.next = after
+        if after is None:
+            self.__tail = before
+        else:
+            after.prev = before
+        first.prev = None
+        last.next = None
+        self.__length -= count
+        self.__version += 1
+
+    # -------------------------------
+    # Moving whole chains between lists
+    # -------------------------------
+    def concat(self, other):
+        """Move all of other's nodes to the end of this list; other ends up empty"""
+        if other is self:
+            raise ValueError("Cannot concat a list with itself.")
+        if other.__length == 0:
+            return True
+        self._adopt_views(other)
+        if self.__length == 0:
+            self.__head = other.__head
+        else:
+            self.__tail.next = other.__head
+            other.__head.prev = self.__tail
+        self.__tail = other.__tail
+        self.__length += other.__length
+        self.__version += 1
+        other.make_empty()
+        return True
+
+    def split_at(self, index):
+        """Split off the nodes from index onwards into a new list.
+
+        This list keeps the first index nodes. Returns (self, right), or
+        None if index is out of range.
+        """
+        if index < 0 or index > self.__length:
+            return None
+        right = type(self)()
+        if index == self.__length:
+            return self, right
+        if self.__views:
+            self._detach_views()
+        first = self.get(index)
+        right.__head = first
+        right.__tail = self.__tail
+        right.__length = self.__length - index
+        right.__version += 1
+        self.__tail = first.prev
+        if self.__tail is None:
+            self.__head = None
+        else:
+            self.__tail.next = None
+            first.prev = None
+        self.__length = index
+        self.__version += 1
+        return self, right
+
+    def _adopt_views(self, other):
+        """Take over the snapshots of other, whose nodes are moving into this list"""
+        if other.__views:
+            if self.__views is None:
+                self.__views = weakref.WeakSet()
+            self.__views |= other.__views
+            other.__views = None
+
+    def splice(self, index, other):
+        """Move all of other's nodes in before index; other ends up empty"""
+        if other is self:
+            raise ValueError("Cannot splice a list into itself.")
+        if index < 0 or index > self.__length:
+            return False
+        if index == self.__length:
+            return self.concat(other)
+        if other.__length == 0:
+            return True
+        after = self.get(index)
+        before = after.prev
+        if self.__views and before is not None:
+            self._detach_views()
+        self._adopt_views(other)
+        first = other.__head
+        last = other.__tail
+        if before is None:
+            self.__head = first
+        else:
+            before.next = first
+            first.prev = before
+        last.next = after
+        after.prev = last
+        self.__length += other.__length
+        self.__version += 1
+        other.make_empty()
+        return True
+
+    # -------------------------------
+    # Node-handle operations, O(1) for a node of this list
+    # -------------------------------
+    def unlink(self, node):
+        """Remove a node of this list in O(1) and return it"""
+        return self._unlink_node(node)
+
+    def remove_node(self, node):
+        """Remove a node of this list in O(1) and return it (same as unlink)"""
+        return self.unlink(node)
+
+    def insert_after(self, node, value):
+        """Insert value right after a node of this list in O(1); return the new node"""
+        return self._insert_node_after(node, value)
+
+    def insert_before(self, node, value):
+        """Insert value right before a node of this list in O(1); return the new node"""
+        return self._insert_node_after(node.prev, value)
+
+    def move_to_front(self, node):
+        """Move a node of this list to the front in O(1)"""
+        if node is self.__head:
+            return True
+        if self.__views:
+            self._detach_views()
+        node.prev.next = node.next
+        if node.next is None:
+            self.__tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = None
+        node.next = self.__head
+        self.__head.prev = node
+        self.__head = node
+        self.__version += 1
+        return True
+
+    def move_to_back(self, node):
+        """Move a node of this list to the back in O(1)"""
+        if node is self.__tail:
+            return True
+        if self.__views:
+            self._detach_views()
+        node.next.prev = node.prev
+        if node.prev is None:
+            self.__head = node.next
+        else:
+            node.prev.next = node.next
+        node.next = None
+        node.prev = self.__tail
+        self.__tail.next = node
+        self.__tail = node
+        self.__version += 1
+        return True
+
+    def _insert_node_after(self, before, value):
+        """Link a new node after before (None means at the front) and return it"""
+        return self._link_node_after(before, Node(value))
+
+    def _link_node_after(self, before, new_node):
+        """Link an unlinked node after before (None means at the front) and return it"""
+        if before is None:
+            after = self.__head
+            self.__head = new_node
+        else:
+            after = before.next
+            if self.__views and after is not None:
+                self._detach_views()
+            before.next = new_node
+        new_node.prev = before
+        new_node.next = after
+        if after is None:
+            self.__tail = new_node
+        else:
+            after.prev = new_node
+        self.__length += 1
+        self.__version += 1
+        return new_node
+
+    def _unlink_node(self, node):
+        """Detach node from the list and return it"""
+        before = node.prev
+        after = node.next
+        if self.__views:
+            if before is None or after is None:
+                self._release_from_views(node)
+            else:
+                self._detach_views()
+        if before is None:
+            self.__head = after
+        else:
+            before.next = after
+        if after is None:
+            self.__tail = before
+        else:
+            after.prev = before
+        node.next = None
+        node.prev = None
+        self.__length -= 1
+        self.__version += 1
+        return node
+
+    def validate(self):
+        """Check the list's structure in O(n); return True or raise ValueError.
+
+        Checks prev/next symmetry, that head and tail are the ends, that
+        length matches the node count, that there is no cycle, and that
+        the node remembered by get() is still at its index.
+        """
+        head = self.__head
+        if head is None or self.__tail is None:
+            if head is not self.__tail or self.__length != 0:
+                raise ValueError("Empty list must have no head, no tail and length 0.")
+            return True
+        if head.prev is not None:
+            raise ValueError("Head has a prev link.")
+        finger = self.__finger if self.__finger_version == self.__version else None
+        finger_found = finger is None
+        count = 1
+        node = head
+        while True:
+            if node is finger:
+                if count - 1 != self.__finger_index:
+                    raise ValueError(f"get() finger says index {self.__finger_index}, "
+                                     f"node is at {count - 1}.")
+                finger_found = True
+            if node.next is None:
+                break
+            if node.next.prev is not node:
+                raise ValueError(f"Broken prev link after index {count - 1}.")
+            node = node.next
+            count += 1
+            if count > self.__length:
+                raise ValueError("More nodes than length, or a cycle.")
+        if node is not self.__tail:
+            raise ValueError("Last node reached from head is not the tail.")
+        if count != self.__length:
+            raise ValueError(f"Length is {self.__length} but the list has {count} nodes.")
+        if not finger_found:
+            raise ValueError("get() finger is not a node of this list.")
+        return True
+
     def is_palindrome(self):
         """Check if the list is a palindrome"""
         if self.__length <= 1:
@@ -196,16 +866,21 @@ class DoublyLinkedList:
 
     def reverse(self):
         """Reverse the entire linked list"""
+        if self.__views:
+            self._detach_views()
         temp = self.__head
         while temp:
             temp.prev, temp.next = temp.next, temp.prev
             temp = temp.prev
         self.__head, self.__tail = self.__tail, self.__head
+        self.__version += 1
 
     def partition_list(self, x):
         """Partition list around value x"""
         if not self.__head:
             return
+        if self.__views:
+            self._detach_views()
         dummy1 = Node(0)
         dummy2 = Node(0)
         prev1 = dummy1
@@ -229,12 +904,107 @@ class DoublyLinkedList:
         self.__head = dummy1.next
         if self.__head:
             self.__head.prev = None
-        self.__tail = prev2
+        self.__tail = prev2 if dummy2.next else prev1
+        self.__version += 1
+
+    def sort(self, key=None, reverse=False):
+        """Sort the nodes in place; stable, with key and reverse as in sorted().
+
+        A bottom-up natural merge sort: the list is cut into runs that are
+        already in order (strictly backward runs are flipped), and runs are
+        merged like a binary counter, so sorted or nearly sorted input costs
+        close to O(n). Nodes are relinked, never copied. While sorting, each
+        node's prev holds its key; a final pass restores prev, head and tail.
+        If key or a comparison raises, the list keeps all its nodes, in an
+        unspecified order.
+        """
+        if self.__length < 2:
+            return
+        if self.__views:
+            self._detach_views()
+        # before(a, b): a key that must come strictly before key b
+        if reverse:
+            before = operator.gt
+        else:
+            before = operator.lt
+        pending = self.__head
+        slots = []
+        carry = None
+        out = Node(None)
+        try:
+            node = pending
+            while node is not None:
+                node.prev = node.value if key is None else key(node.value)
+                node = node.next
+            while pending is not None:
+                # Find the next run before cutting it, so a failing
+                # comparison leaves pending intact
+                end = pending
+                following = end.next
+                if following is not None and before(following.prev, end.prev):
+                    while following is not None and before(following.prev, end.prev):
+                        end = following
+                        following = end.next
+                    run = None
+                    node = pending
+                    while node is not following:
+                        node.next, run, node = run, node, node.next
+                else:
+                    while following is not None and not before(following.prev, end.prev):
+                        end = following
+                        following = end.next
+                    end.next = None
+                    run = pending
+                pending = following
+                carry = run
+                i = 0
+                while i < len(slots) and slots[i] is not None:
+                    left, slots[i] = slots[i], None
+                    right, carry = carry, None
+                    _merge_chains(out, left, right, reverse)
+                    carry, out.next = out.next, None
+                    i += 1
+                if i == len(slots):
+                    slots.append(None)
+                slots[i], carry = carry, None
+            for i in range(len(slots)):
+                if slots[i] is not None:
+                    if carry is None:
+                        carry, slots[i] = slots[i], None
+                    else:
+                        left, slots[i] = slots[i], None
+                        right, carry = carry, None
+                        _merge_chains(out, left, right, reverse)
+                        carry, out.next = out.next, None
+            first = carry
+        except BaseException:
+            # Chain every surviving piece together so the list stays whole
+            first = None
+            for piece in [pending, carry, out.next] + slots:
+                if piece is not None:
+                    last = piece
+                    while last.next is not None:
+                        last = last.next
+                    last.next = first
+                    first = piece
+            raise
+        finally:
+            previous = None
+            node = first
+            while node is not None:
+                node.prev = previous
+                previous = node
+                node = node.next
+            self.__head = first
+            self.__tail = previous
+            self.__version += 1
 
     def reverse_between(self, start, end):
-        """Reverse sublist from index start to end (exclusive)"""
+        """Reverse sublist from index start to end (inclusive)"""
         if self.__length <= 1 or start == end:
             return
+        if self.__views:
+            self._detach_views()
         dummy = Node(0)
         dummy.next = self.__head
         self.__head.prev = dummy
@@ -251,11 +1021,16 @@ class DoublyLinkedList:
             prev.next.prev = move
             prev.next = move
             move.prev = prev
+        if current.next is None:
+            self.__tail = current
         self.__head = dummy.next
         self.__head.prev = None
+        self.__version += 1
 
     def swap_pairs(self):
         """Swap adjacent node values in pairs"""
+        if self.__views:
+            self._detach_views()
         current = self.__head
         while current and current.next:
             current.value, current.next.value = current.next.value, current.value
@@ -293,6 +1068,8 @@ class DoublyLinkedList:
 
     def remove_duplicates(self):
         """Remove duplicate values in the list"""
+        if self.__views:
+            self._detach_views()
         seen = set()
         current = self.__head
         while current:
@@ -307,6 +1084,7 @@ class DoublyLinkedList:
                 if current == self.__head:
                     self.__head = current.next
                 self.__length -= 1
+                self.__version += 1
                 current = next_node
             else:
                 seen.add(current.value)
@@ -319,4 +1097,410 @@ class DoublyLinkedList:
         while current:
             decimal = decimal * 2 + current.value
             current = current.next
-        return decimal
\ No newline at end of file
+        return decimal
+
+# ------------------------------
+# Debug mode: check invariants after every mutation
+# ------------------------------
+DEBUG = False
+
+_MUTATORS = (
+    "make_empty", "append", "extend", "extendleft", "pop", "prepend", "pop_first",
+    "set_value", "insert", "remove", "insert_many", "remove_range", "concat",
+    "split_at", "splice", "unlink", "remove_node", "insert_after", "insert_before",
+    "move_to_front", "move_to_back", "_insert_node_after", "_link_node_after",
+    "_unlink_node", "_set_node_value", "_link_chain_after", "_unlink_chain",
+    "reverse", "partition_list", "sort", "reverse_between", "swap_pairs",
+    "remove_duplicates",
+)
+_unchecked = {}
+
+
+def _checked(method):
+    @functools.wraps(method)
+    def checked(self, *args, **kwargs):
+        # Only the outermost call validates: a subclass mutator may call
+        # base mutators through super() before fixing up its own state
+        depth = self._debug_depth
+        self._debug_depth = depth + 1
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            self._debug_depth = depth
+        if depth == 0:
+            self.validate()
+        return result
+    return checked
+
+
+def _list_classes(cls=None):
+    cls = cls or DoublyLinkedList
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from _list_classes(subclass)
+
+
+def set_debug(enabled=True):
+    """Turn invariant checks after every mutating method on or off.
+
+    While on, each mutator of DoublyLinkedList and of every subclass
+    defined so far calls the list's validate() when it returns, raising
+    ValueError on the first broken invariant. Mutators called from inside
+    another mutator of the same list are not checked, so subclasses can
+    finish updating their own state first. This costs O(n) per call; while off the original
+    methods are in place, so there is no overhead at all.
+    """
+    global DEBUG
+    enabled = bool(enabled)
+    if enabled == DEBUG:
+        return
+    if enabled:
+        for cls in _list_classes():
+            for name in _MUTATORS:
+                if name in cls.__dict__:
+                    _unchecked[cls, name] = cls.__dict__[name]
+                    setattr(cls, name, _checked(cls.__dict__[name]))
+    else:
+        for (cls, name), method in _unchecked.items():
+            setattr(cls, name, method)
+        _unchecked.clear()
+    DEBUG = enabled
+
+# ------------------------------
+# Cursor for O(1) edits at a position
+# ------------------------------
+class Cursor:
+    """A position in a DoublyLinkedList that edits in O(1) where it stands.
+
+    The cursor remembers its node and index. Edits made through the cursor
+    keep it valid; any other change to the list's structure invalidates it,
+    and using it afterwards raises RuntimeError.
+    """
+    __slots__ = ("_list", "_node", "_index", "_version")
+
+    def __init__(self, dll, node, index):
+        self._list = dll
+        self._node = node
+        self._index = index
+        self._version = dll.version
+
+    def _check(self):
+        if self._version != self._list.version:
+            raise RuntimeError("list was modified outside this cursor")
+
+    def _sync(self):
+        self._version = self._list.version
+
+    @property
+    def node(self):
+        self._check()
+        return self._node
+
+    @property
+    def index(self):
+        self._check()
+        return self._index
+
+    @property
+    def value(self):
+        self._check()
+        return self._node.value
+
+    @value.setter
+    def value(self, value):
+        self._check()
+        self._list._set_node_value(self._node, value)
+
+    def move_next(self):
+        """Step to the next node; return False at the end of the list"""
+        self._check()
+        if self._node is None or self._node.next is None:
+            return False
+        self._node = self._node.next
+        self._index += 1
+        return True
+
+    def move_prev(self):
+        """Step to the previous node; return False at the start of the list"""
+        self._check()
+        if self._node is None or self._node.prev is None:
+            return False
+        self._node = self._node.prev
+        self._index -= 1
+        return True
+
+    def insert_after(self, value):
+        """Insert a node after the cursor; the cursor does not move"""
+        self._check()
+        new_node = self._list._insert_node_after(self._node, value)
+        if self._node is None:
+            self._node = new_node
+        self._sync()
+        return True
+
+    def insert_before(self, value):
+        """Insert a node before the cursor; the cursor stays on its node"""
+        self._check()
+        if self._node is None:
+            self._node = self._list._insert_node_after(None, value)
+        else:
+            self._list._insert_node_after(self._node.prev, value)
+            self._index += 1
+        self._sync()
+        return True
+
+    def remove_here(self):
+        """Remove and return the cursor's node.
+
+        The cursor moves to the following node, or to the previous one when
+        the last node was removed. Removing the only node leaves the cursor
+        on an empty list, where the insert methods still work.
+        """
+        self._check()
+        temp = self._node
+        if temp is None:
+            return None
+        if temp.next is not None:
+            self._node = temp.next
+        else:
+            self._node = temp.prev
+            self._index = max(self._index - 1, 0)
+        self._list._unlink_node(temp)
+        self._sync()
+        return temp
+
+# ------------------------------
+# Read-only snapshot sharing nodes with a live list
+# ------------------------------
+class SnapshotView:
+    """Read-only view of a DoublyLinkedList's values at one moment.
+
+    Returned by DoublyLinkedList.snapshot(). The view is a run of the
+    list's own nodes (first, last, count) with two lists of copied values
+    around it. The live list tells its views about a change before it
+    makes it: a node leaving an end moves its value into the copied
+    prefix or suffix, an overwritten value is kept in a per-node patch,
+    and any other relink copies the whole shared run into the prefix.
+    Appending or prepending to the live list never reaches the view.
+
+    Iterators read links only while the run is still shared, so they stay
+    correct while the live list changes between steps.
+    """
+    __slots__ = ("_prefix", "_suffix", "_first", "_last", "_count", "_forward",
+                 "_patches", "_changes", "__weakref__")
+
+    def __init__(self, first, last, count, forward=True):
+        # _first/_last/_forward are physical: forward=False walks prev links
+        self._prefix = []
+        self._suffix = []
+        self._first = first
+        self._last = last
+        self._count = count
+        self._forward = forward
+        self._patches = None
+        # Bumped whenever the live list moves or patches a shared value
+        self._changes = 0
+
+    @property
+    def length(self):
+        return len(self._prefix) + self._count + len(self._suffix)
+
+    @property
+    def shared(self):
+        """How many values are still read from the live list's nodes"""
+        return self._count
+
+    def snapshot(self):
+        """A view never changes, so it is its own snapshot"""
+        return self
+
+    # -------------------------------
+    # Called by the live list before it changes
+    # -------------------------------
+    def _value(self, node):
+        patches = self._patches
+        return patches.get(node, node.value) if patches else node.value
+
+    def _detach(self):
+        """Copy the shared values so the live list may relink the nodes"""
+        if self._count:
+            if self._forward:
+                self._prefix.extend(self._walk(self._first, self._count, True))
+            else:
+                self._prefix.extend(self._walk(self._last, self._count, False))
+        self._first = self._last = None
+        self._count = 0
+        self._patches = None
+        self._changes += 1
+
+    def _release(self, node):
+        """Copy node's value if it ends the shared run; return True once nothing is shared"""
+        if self._count == 0:
+            return True
+        if node is self._first:
+            value = self._value(node)
+            self._first = node.next
+            front = self._forward
+        elif node is self._last:
+            value = self._value(node)
+            self._last = node.prev
+            front = not self._forward
+        else:
+            return False
+        (self._prefix if front else self._suffix).append(value)
+        if self._patches:
+            self._patches.pop(node, None)
+        self._count -= 1
+        self._changes += 1
+        if self._count == 0:
+            self._first = self._last = self._patches = None
+            return True
+        return False
+
+    def _save(self, node):
+        """Keep node's current value; the live list is about to overwrite it"""
+        if self._count:
+            if self._patches is None:
+                self._patches = {}
+            if node not in self._patches:
+                self._patches[node] = node.value
+                self._changes += 1
+
+    def validate(self):
+        """Check that the shared run is still linked as taken; return True or raise ValueError"""
+        if self._count == 0:
+            return True
+        node = self._first
+        for _ in range(self._count - 1):
+            if node is None or node.next is None or node.next.prev is not node:
+                raise ValueError("Shared run of a snapshot was relinked.")
+            node = node.next
+        if node is not self._last:
+            raise ValueError("Shared run of a snapshot does not end at its last node.")
+        return True
+
+    # -------------------------------
+    # Iteration protocol
+    # -------------------------------
+    def _walk(self, node, count, forward):
+        for _ in range(count):
+            yield self._value(node)
+            node = node.next if forward else node.prev
+
+    def _values(self, near, far, forward):
+        """Yield near, then the shared run, then far reversed.
+
+        The run is walked node by node until the live list reports a
+        change; then the sizes are re-read, so values moved out of the run
+        are picked up from near or far instead of the nodes.
+        """
+        index = 0
+        node = None
+        while True:
+            before = len(near)
+            stop = before + self._count
+            if index < before:
+                yield near[index]
+                index += 1
+            elif index < stop:
+                if index == before:
+                    node = self._first if forward else self._last
+                changes = self._changes
+                patches = self._patches
+                while index < stop and self._changes == changes:
+                    value = node.value if patches is None else patches.get(node, node.value)
+                    # Read the link now, while the run is known to be intact
+                    node = node.next if forward else node.prev
+                    index += 1
+                    yield value
+            else:
+                offset = index - stop
+                if offset >= len(far):
+                    return
+                yield far[len(far) - 1 - offset]
+                index += 1
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """Yield the values from head to tail"""
+        return self._values(self._prefix, self._suffix, self._forward)
+
+    def __reversed__(self):
+        """Yield the values from tail to head"""
+        return self._values(self._suffix, self._prefix, not self._forward)
+
+    def __contains__(self, value):
+        for item in self:
+            if item is value or item == value:
+                return True
+        return False
+
+    def values_slice(self, start=0, stop=None):
+        """Lazily yield the values at indexes start..stop-1 (slice semantics)"""
+        start, stop, _ = slice(start, stop).indices(self.length)
+        yield from itertools.islice(self, start, stop)
+
+    # -------------------------------
+    # Read methods
+    # -------------------------------
+    def print_list(self):
+        """Print the snapshot in a readable format."""
+        if self.length == 0:
+            print("empty list")
+        else:
+            values = [str(value) for value in self]
+            values.append("None")
+            print(" <-> ".join(values))
+
+    def get(self, index):
+        """Return a detached Node holding the value at the specified index"""
+        if index < 0 or index >= self.length:
+            return None
+        before = len(self._prefix)
+        if index < before:
+            return Node(self._prefix[index])
+        index -= before
+        if index >= self._count:
+            return Node(self._suffix[len(self._suffix) - 1 - (index - self._count)])
+        # Walk the shared run from its nearer end
+        forward = self._forward
+        if index < self._count / 2:
+            steps = index
+        else:
+            steps = self._count - 1 - index
+            forward = not forward
+        node = self._first if forward else self._last
+        for _ in range(steps):
+            node = node.next if forward else node.prev
+        return Node(self._value(node))
+
+    @property
+    def head(self):
+        return self.get(0)
+
+    @property
+    def tail(self):
+        return self.get(self.length - 1)
+
+    def find_middle_node(self):
+        """Return a detached Node holding the middle value"""
+        return self.get(self.length // 2)
+
+    def find_kth_from_end(self, k):
+        """Find k-th value from the end"""
+        if k <= 0 or k > self.length:
+            return None
+        return self.get(self.length - k)
+
+    def is_palindrome(self):
+        """Check if the snapshot is a palindrome"""
+        for _, left, right in zip(range(self.length // 2), self, reversed(self)):
+            if left != right:
+                return False
+        return True
+
+    def has_loop(self):
+        """A snapshot reads a counted run, so it never loops"""
+        return False
@@ -0,0 +1,434 @@
+"""Differential fuzzer for the linked list classes.
+
+Runs long random sequences of operations on a list and, side by side, on a
+plain Python list that models it, and after every operation checks that
+the two hold the same values and that ``validate()`` passes:
+
+    python3 fuzz.py
+    python3 fuzz.py --seeds 200 --steps 2000 --classes DoublyLinkedList IndexedDoublyLinkedList
+    python3 fuzz.py --debug     # also validate inside every mutator call
+
+A failure prints the class, seed and step, so ``fuzz(cls, seed, steps)``
+replays it exactly. Values are small ints, so duplicates are common.
+"""
+import argparse
+import bisect
+import itertools
+import random
+import sys
+
+from doubly_linked_list import DoublyLinkedList, set_debug
+from hashed_list import HashedDoublyLinkedList
+from indexed_list import IndexedDoublyLinkedList
+from lazy_reverse_list import LazyReverseDoublyLinkedList
+from persistent_list import PersistentList
+from pooled_list import PooledDoublyLinkedList
+from sorted_list import SortedDoublyLinkedList
+from unrolled_list import UnrolledDoublyLinkedList
+
+try:
+    from numeric_list import NumericDoublyLinkedList
+except ImportError:  # NumPy is optional
+    NumericDoublyLinkedList = None
+
+MAX_VALUE = 10
+
+
+def _expect(actual, expected, what):
+    if actual != expected:
+        raise AssertionError(f"{what}: got {actual!r}, expected {expected!r}")
+
+
+def _values(rng, most=5):
+    return [rng.randrange(MAX_VALUE) for _ in range(rng.randrange(most + 1))]
+
+
+def _index(rng, model):
+    """Random index, sometimes one step out of range"""
+    return rng.randrange(-1, len(model) + 1)
+
+
+def _popped(node, model, index):
+    if not model or not -len(model) <= index < len(model):
+        _expect(node, None, "removal from out of range")
+        return
+    _expect(node.value, model.pop(index), "removed value")
+
+
+# ------------------------------
+# Operations: each applies one random call to dll and to model
+# ------------------------------
+def op_append(dll, model, rng):
+    value = rng.randrange(MAX_VALUE)
+    dll.append(value)
+    model.append(value)
+
+
+def op_prepend(dll, model, rng):
+    value = rng.randrange(MAX_VALUE)
+    dll.prepend(value)
+    model.insert(0, value)
+
+
+def op_extend(dll, model, rng):
+    values = _values(rng)
+    dll.extend(values)
+    model.extend(values)
+
+
+def op_extendleft(dll, model, rng):
+    values = _values(rng)
+    dll.extendleft(values)
+    model[:0] = values[::-1]
+
+
+def op_pop(dll, model, rng):
+    _popped(dll.pop(), model, -1)
+
+
+def op_pop_first(dll, model, rng):
+    _popped(dll.pop_first(), model, 0)
+
+
+def op_insert(dll, model, rng):
+    index = _index(rng, model)
+    value = rng.randrange(MAX_VALUE)
+    ok = 0 <= index <= len(model)
+    _expect(dll.insert(index, value), ok, f"insert({index})")
+    if ok:
+        model.insert(index, value)
+
+
+def op_remove(dll, model, rng):
+    index = _index(rng, model)
+    _popped(dll.remove(index), model, index if index >= 0 else len(model))
+
+
+def op_set_value(dll, model, rng):
+    index = _index(rng, model)
+    value = rng.randrange(MAX_VALUE)
+    ok = 0 <= index < len(model)
+    _expect(dll.set_value(index, value), ok, f"set_value({index})")
+    if ok:
+        model[index] = value
+
+
+def op_insert_many(dll, model, rng):
+    index = _index(rng, model)
+    values = _values(rng)
+    ok = 0 <= index <= len(model)
+    _expect(dll.insert_many(index, values), ok, f"insert_many({index})")
+    if ok:
+        model[index:index] = values
+
+
+def op_remove_range(dll, model, rng):
+    start = rng.randrange(-len(model) - 2, len(model) + 2)
+    stop = rng.randrange(-len(model) - 2, len(model) + 2)
+    removed = len(model[start:stop])
+    _expect(dll.remove_range(start, stop), removed, f"remove_range({start}, {stop})")
+    del model[start:stop]
+
+
+def op_concat(dll, model, rng):
+    values = _values(rng)
+    other = type(dll).from_iterable(values)
+    dll.concat(other)
+    model.extend(values)
+    _expect(other.length, 0, "length of concatenated list")
+    other.validate()
+
+
+def op_split_at(dll, model, rng):
+    index = _index(rng, model)
+    halves = dll.split_at(index)
+    if not 0 <= index <= len(model):
+        _expect(halves, None, f"split_at({index})")
+        return
+    right = halves[1]
+    right.validate()
+    _expect(list(right), model[index:], "split-off values")
+    _expect(list(dll), model[:index], "values kept by split_at")
+    dll.concat(right)
+
+
+def op_splice(dll, model, rng):
+    index = _index(rng, model)
+    values = _values(rng)
+    other = type(dll).from_iterable(values)
+    ok = 0 <= index <= len(model)
+    _expect(dll.splice(index, other), ok, f"splice({index})")
+    if ok:
+        model[index:index] = values
+        _expect(other.length, 0, "length of spliced list")
+
+
+def op_unlink(dll, model, rng):
+    if model:
+        index = rng.randrange(len(model))
+        _expect(dll.unlink(dll.get(index)).value, model.pop(index), "unlinked value")
+
+
+def op_insert_after(dll, model, rng):
+    if model:
+        index = rng.randrange(len(model))
+        value = rng.randrange(MAX_VALUE)
+        _expect(dll.insert_after(dll.get(index), value).value, value, "inserted node")
+        model.insert(index + 1, value)
+
+
+def op_insert_before(dll, model, rng):
+    if model:
+        index = rng.randrange(len(model))
+        value = rng.randrange(MAX_VALUE)
+        _expect(dll.insert_before(dll.get(index), value).value, value, "inserted node")
+        model.insert(index, value)
+
+
+def op_move_to_front(dll, model, rng):
+    if model:
+        index = rng.randrange(len(model))
+        dll.move_to_front(dll.get(index))
+        model.insert(0, model.pop(index))
+
+
+def op_move_to_back(dll, model, rng):
+    if model:
+        index = rng.randrange(len(model))
+        dll.move_to_back(dll.get(index))
+        model.append(model.pop(index))
+
+
+def op_cursor(dll, model, rng):
+    """Walk a cursor a few steps, editing as it goes"""
+    if not model:
+        return
+    index = rng.randrange(len(model))
+    cursor = dll.cursor(index)
+    for _ in range(rng.randrange(1, 6)):
+        action = rng.randrange(5)
+        if action == 0:
+            _expect(cursor.move_next(), index + 1 < len(model), "move_next()")
+            index = min(index + 1, max(len(model) - 1, 0))
+        elif action == 1:
+            _expect(cursor.move_prev(), index > 0, "move_prev()")
+            index = max(index - 1, 0)
+        elif action == 2:
+            value = rng.randrange(MAX_VALUE)
+            cursor.insert_after(value)
+            if model:
+                model.insert(index + 1, value)
+            else:
+                model.append(value)
+        elif action == 3:
+            value = rng.randrange(MAX_VALUE)
+            cursor.insert_before(value)
+            if model:
+                model.insert(index, value)
+                index += 1
+            else:
+                model.append(value)
+        else:
+            node = cursor.remove_here()
+            _popped(node, model, index if model else 0)
+            if index >= len(model):
+                index = max(index - 1, 0)
+        if model:
+            _expect((cursor.index, cursor.value), (index, model[index]), "cursor position")
+
+
+def op_reverse(dll, model, rng):
+    dll.reverse()
+    model.reverse()
+
+
+def op_partition_list(dll, model, rng):
+    x = rng.randrange(MAX_VALUE)
+    dll.partition_list(x)
+    model[:] = [v for v in model if v < x] + [v for v in model if v >= x]
+
+
+def op_sort(dll, model, rng):
+    key = rng.choice((None, lambda v: v % 3))
+    reverse = rng.random() < 0.5
+    dll.sort(key=key, reverse=reverse)
+    model.sort(key=key, reverse=reverse)
+
+
+def op_reverse_between(dll, model, rng):
+    if len(model) > 1:
+        start = rng.randrange(len(model))
+        end = rng.randrange(start, len(model))
+        dll.reverse_between(start, end)
+        model[start:end + 1] = model[start:end + 1][::-1]
+
+
+def op_swap_pairs(dll, model, rng):
+    dll.swap_pairs()
+    for i in range(0, len(model) - 1, 2):
+        model[i], model[i + 1] = model[i + 1], model[i]
+
+
+def op_remove_duplicates(dll, model, rng):
+    dll.remove_duplicates()
+    model[:] = dict.fromkeys(model)
+
+
+def op_snapshot(dll, model, rng):
+    """Take a snapshot, change the list, and check the snapshot kept its values.
+
+    A writable snapshot is changed too, to check neither saw the other's
+    edits. A read-only view is read by an iterator that is advanced a few
+    values at a time between random edits of the list.
+    """
+    snapshot = dll.snapshot()
+    expected = list(model)
+    if hasattr(snapshot, "append"):
+        for _ in range(rng.randrange(1, 4)):
+            rng.choice((op_append, op_insert, op_remove, op_set_value))(dll, model, rng)
+        rng.choice((op_append, op_insert, op_remove, op_set_value))(snapshot, expected, rng)
+        check(snapshot, expected, rng)
+        return
+    edits = [function for name, function in OPERATIONS.items()
+             if name != "snapshot" and hasattr(dll, name)]
+    forward = rng.random() < 0.5
+    reader = iter(snapshot) if forward else reversed(snapshot)
+    seen = []
+    for _ in range(rng.randrange(1, 6)):
+        seen.extend(itertools.islice(reader, rng.randrange(3)))
+        rng.choice(edits)(dll, model, rng)
+    seen.extend(reader)
+    _expect(seen, expected if forward else expected[::-1], "snapshot read during edits")
+    check(snapshot, expected, rng)
+
+
+def op_make_empty(dll, model, rng):
+    if rng.random() < 0.1:
+        dll.make_empty()
+        model.clear()
+
+
+OPERATIONS = {name[3:]: function for name, function in globals().items()
+              if name.startswith("op_")}
+
+
+# ------------------------------
+# Operations for SortedDoublyLinkedList
+# ------------------------------
+def sorted_insert(dll, model, rng):
+    value = rng.randrange(MAX_VALUE)
+    dll.insert_sorted(value)
+    bisect.insort_right(model, value)
+
+
+def sorted_extend(dll, model, rng):
+    values = _values(rng)
+    dll.extend(values)
+    model[:] = sorted(model + values)
+
+
+def sorted_merge(dll, model, rng):
+    values = _values(rng)
+    other = SortedDoublyLinkedList.from_iterable(values)
+    dll.merge(other)
+    model[:] = sorted(model + values)
+    _expect(other.length, 0, "length of merged list")
+
+
+def sorted_search(dll, model, rng):
+    value = rng.randrange(-1, MAX_VALUE + 1)
+    _expect(dll.bisect_left(value), bisect.bisect_left(model, value), f"bisect_left({value})")
+    _expect(dll.bisect_right(value), bisect.bisect_right(model, value), f"bisect_right({value})")
+    _expect(value in dll, value in model, f"{value} in list")
+    lo, hi = sorted((rng.randrange(MAX_VALUE), rng.randrange(MAX_VALUE)))
+    _expect(list(dll.irange(lo, hi, (True, False))), [v for v in model if lo <= v < hi],
+            f"irange({lo}, {hi})")
+
+
+SORTED_OPERATIONS = {
+    "insert_sorted": sorted_insert,
+    "extend": sorted_extend,
+    "merge": sorted_merge,
+    "search": sorted_search,
+    "pop": op_pop,
+    "pop_first": op_pop_first,
+    "remove": op_remove,
+    "remove_range": op_remove_range,
+    "unlink": op_unlink,
+    "remove_duplicates": op_remove_duplicates,
+    "make_empty": op_make_empty,
+}
+
+
+# ------------------------------
+# Runner
+# ------------------------------
+CLASSES = {cls.__name__: cls for cls in (
+    DoublyLinkedList, IndexedDoublyLinkedList, HashedDoublyLinkedList,
+    SortedDoublyLinkedList, LazyReverseDoublyLinkedList, PooledDoublyLinkedList,
+    UnrolledDoublyLinkedList, NumericDoublyLinkedList, PersistentList) if cls is not None}
+
+
+def check(dll, model, rng):
+    """Compare dll with model and validate its structure"""
+    dll.validate()
+    _expect(list(dll), model, "values")
+    _expect(list(reversed(dll)), model[::-1], "values in reverse")
+    _expect(dll.length, len(model), "length")
+    _expect(dll.head.value if dll.head else None, model[0] if model else None, "head")
+    _expect(dll.tail.value if dll.tail else None, model[-1] if model else None, "tail")
+    if model:
+        index = rng.randrange(len(model))
+        _expect(dll.get(index).value, model[index], f"get({index})")
+        _expect(dll.find_kth_from_end(index + 1).value, model[-index - 1],
+                f"find_kth_from_end({index + 1})")
+
+
+def fuzz(cls, seed, steps=1000):
+    """Run steps random operations on a cls list; raise AssertionError on a mismatch"""
+    rng = random.Random(seed)
+    sorted_mode = issubclass(cls, SortedDoublyLinkedList)
+    table = SORTED_OPERATIONS if sorted_mode else OPERATIONS
+    dll = cls()
+    operations = [(name, function) for name, function in table.items()
+                  if hasattr(dll, name) or name == "search"]
+    model = []
+    for step in range(steps):
+        name, function = rng.choice(operations)
+        try:
+            function(dll, model, rng)
+            check(dll, model, rng)
+        except (AssertionError, ValueError) as error:
+            raise AssertionError(f"{cls.__name__} seed {seed} step {step} "
+                                 f"after {name}: {error}") from error
+        if len(model) > 200:
+            # Keep lists short so each check stays cheap
+            dll.remove_range(0, 100)
+            del model[:100]
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Differential fuzzer for the linked lists")
+    parser.add_argument("--seeds", type=int, default=20, help="seeds per class")
+    parser.add_argument("--steps", type=int, default=1000, help="operations per seed")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--classes", nargs="+", choices=sorted(CLASSES), default=sorted(CLASSES))
+    parser.add_argument("--debug", action="store_true",
+                        help="run with set_debug(True), validating after every mutator")
+    args = parser.parse_args(argv)
+    set_debug(args.debug)
+    failures = 0
+    for name in args.classes:
+        for seed in range(args.first_seed, args.first_seed + args.seeds):
+            try:
+                fuzz(CLASSES[name], seed, args.steps)
+            except AssertionError as error:
+                print(f"FAIL  {error}")
+                failures += 1
+        print(f"{name}: {args.seeds} seeds x {args.steps} steps done")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
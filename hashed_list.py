@@ -0,0 +1,352 @@
+from doubly_linked_list import DoublyLinkedList, _EMPTY
+
+
+# ------------------------------
+# Doubly LinkedList with a value -> nodes hash index
+# ------------------------------
+class HashedDoublyLinkedList(DoublyLinkedList):
+    """DoublyLinkedList with a hash index from each value to its nodes.
+
+    The index maps value -> {node: None} (an insertion-ordered set) and is
+    kept up to date by the list's own methods, which gives O(1)
+    ``find(value)``, ``count(value)``, ``remove_value(value)`` and ``in``.
+    Values must be hashable.
+
+    ``remove_duplicates`` is incremental: the index remembers which values
+    gained a second node since the last call, and only those are
+    deduplicated, walking from the head just far enough to find the first
+    node of each.
+
+    The index remembers the list ``version`` it matches. Structural
+    changes made outside the overridden methods (cursor inserts and
+    removals, manual relinking through the head/tail/length setters) are
+    caught by the version check and the index is rebuilt on next use.
+    Values written by ``set_value`` or a cursor's ``value`` setter are
+    re-indexed at once. Assigning ``node.value`` directly is not tracked.
+    """
+
+    def __init__(self, value=_EMPTY):
+        super().__init__(value)
+        self._rebuild_index()
+
+    # -------------------------------
+    # Index maintenance
+    # -------------------------------
+    def _rebuild_index(self):
+        self._buckets = {}
+        self._duplicates = set()
+        node = self.head
+        while node:
+            self._add(node)
+            node = node.next
+        self._index_version = self.version
+
+    def _ensure_index(self):
+        if self._index_version != self.version:
+            self._rebuild_index()
+
+    def _synced(self):
+        self._index_version = self.version
+
+    def _add(self, node):
+        bucket = self._buckets.get(node.value)
+        if bucket is None:
+            self._buckets[node.value] = {node: None}
+        else:
+            bucket[node] = None
+            self._duplicates.add(node.value)
+
+    def _discard(self, node):
+        bucket = self._buckets[node.value]
+        del bucket[node]
+        if not bucket:
+            del self._buckets[node.value]
+
+    def _add_run(self, first, count):
+        """Index count nodes starting at first"""
+        for _ in range(count):
+            self._add(first)
+            first = first.next
+
+    def validate(self):
+        """Also check the index (when current) holds exactly the list's nodes"""
+        super().validate()
+        if self._index_version != self.version:
+            return True
+        indexed = 0
+        for value, bucket in self._buckets.items():
+            if not bucket:
+                raise ValueError(f"Empty index bucket for {value!r}.")
+            indexed += len(bucket)
+        if indexed != self.length:
+            raise ValueError(f"Index holds {indexed} nodes, the list has {self.length}.")
+        for node in self.iter_nodes():
+            if node not in self._buckets.get(node.value, ()):
+                raise ValueError(f"Node with value {node.value!r} is not indexed under it.")
+        return True
+
+    # -------------------------------
+    # Lookups by value in O(1)
+    # -------------------------------
+    def __contains__(self, value):
+        self._ensure_index()
+        return value in self._buckets
+
+    def find(self, value):
+        """Return a node holding value (not necessarily the first), or None"""
+        self._ensure_index()
+        bucket = self._buckets.get(value)
+        if bucket is None:
+            return None
+        return next(iter(bucket))
+
+    def count(self, value):
+        """Return how many nodes hold value"""
+        self._ensure_index()
+        return len(self._buckets.get(value, ()))
+
+    def remove_value(self, value):
+        """Remove and return a node holding value, or None if there is none"""
+        node = self.find(value)
+        if node is None:
+            return None
+        return self.unlink(node)
+
+    def remove_duplicates(self):
+        """Remove duplicate values, keeping the first node of each value"""
+        self._ensure_index()
+        pending = {value for value in self._duplicates
+                   if len(self._buckets.get(value, ())) > 1}
+        self._duplicates.clear()
+        node = self.head
+        while pending:
+            value = node.value
+            if value in pending:
+                pending.discard(value)
+                for other in list(self._buckets[value]):
+                    if other is not node:
+                        self.unlink(other)
+            node = node.next
+
+    # -------------------------------
+    # Mutators that keep the index in step
+    # -------------------------------
+    def make_empty(self):
+        """Reset the linked list to empty"""
+        super().make_empty()
+        self._buckets = {}
+        self._duplicates = set()
+        self._synced()
+
+    def append(self, value):
+        """Add a node at the end"""
+        self._ensure_index()
+        super().append(value)
+        self._add(self.tail)
+        self._synced()
+        return True
+
+    def prepend(self, value):
+        """Add a node at the beginning"""
+        self._ensure_index()
+        super().prepend(value)
+        self._add(self.head)
+        self._synced()
+        return True
+
+    def extend(self, iterable):
+        """Add every value from iterable at the end"""
+        self._ensure_index()
+        length = self.length
+        last = self.tail
+        super().extend(iterable)
+        self._add_run(last.next if last else self.head, self.length - length)
+        self._synced()
+        return True
+
+    def extendleft(self, iterable):
+        """Prepend every value from iterable (the values end up reversed)"""
+        self._ensure_index()
+        length = self.length
+        super().extendleft(iterable)
+        self._add_run(self.head, self.length - length)
+        self._synced()
+        return True
+
+    def pop(self):
+        """Remove and return the last node"""
+        self._ensure_index()
+        node = super().pop()
+        if node is not None:
+            self._discard(node)
+            self._synced()
+        return node
+
+    def pop_first(self):
+        """Remove and return the first node"""
+        self._ensure_index()
+        node = super().pop_first()
+        if node is not None:
+            self._discard(node)
+            self._synced()
+        return node
+
+    def _set_node_value(self, node, value):
+        """Overwrite node's value and move it to its new index bucket"""
+        self._ensure_index()
+        self._discard(node)
+        super()._set_node_value(node, value)
+        self._add(node)
+
+    def insert(self, index, value):
+        """Insert a node at the specified index"""
+        if index <= 0 or index >= self.length:
+            # Out of range, or an end handled by prepend/append
+            return super().insert(index, value)
+        self._ensure_index()
+        super().insert(index, value)
+        self._add(self.get(index))
+        self._synced()
+        return True
+
+    def remove(self, index):
+        """Remove and return the node at the specified index"""
+        if index <= 0 or index >= self.length - 1:
+            # Out of range, or an end handled by pop_first/pop
+            return super().remove(index)
+        self._ensure_index()
+        node = super().remove(index)
+        self._discard(node)
+        self._synced()
+        return node
+
+    def insert_many(self, index, iterable):
+        """Insert every value from iterable starting at index"""
+        self._ensure_index()
+        length = self.length
+        if not super().insert_many(index, iterable):
+            return False
+        if self.length > length:
+            # The finger sits just before index, so this get() is one step
+            self._add_run(self.get(index), self.length - length)
+        self._synced()
+        return True
+
+    def remove_range(self, start, stop):
+        """Remove the nodes at indexes start..stop-1 (slice semantics)"""
+        self._ensure_index()
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start >= stop:
+            return 0
+        node = self.get(start)
+        count = super().remove_range(start, stop)
+        while node is not None:
+            self._discard(node)
+            node = node.next
+        self._synced()
+        return count
+
+    def insert_after(self, node, value):
+        """Insert value right after a node of this list in O(1); return the new node"""
+        self._ensure_index()
+        new_node = super().insert_after(node, value)
+        self._add(new_node)
+        self._synced()
+        return new_node
+
+    def insert_before(self, node, value):
+        """Insert value right before a node of this list in O(1); return the new node"""
+        self._ensure_index()
+        new_node = super().insert_before(node, value)
+        self._add(new_node)
+        self._synced()
+        return new_node
+
+    def unlink(self, node):
+        """Remove a node of this list in O(1) and return it"""
+        self._ensure_index()
+        super().unlink(node)
+        self._discard(node)
+        self._synced()
+        return node
+
+    def swap_pairs(self):
+        """Swap adjacent node values in pairs"""
+        super().swap_pairs()
+        self._rebuild_index()
+
+    def concat(self, other):
+        """Move all of other's nodes to the end of this list; other ends up empty"""
+        self._ensure_index()
+        last = self.tail
+        count = other.length
+        super().concat(other)
+        self._add_run(last.next if last else self.head, count)
+        self._synced()
+        return True
+
+    def splice(self, index, other):
+        """Move all of other's nodes in before index; other ends up empty"""
+        self._ensure_index()
+        first = other.head
+        count = other.length
+        if not super().splice(index, other):
+            return False
+        if index < self.length - count:
+            # splice() at the end went through concat(), which indexed the run
+            self._add_run(first, count)
+        self._synced()
+        return True
+
+    def split_at(self, index):
+        """Split off the nodes from index onwards into a new list"""
+        self._ensure_index()
+        parts = super().split_at(index)
+        if parts is not None:
+            for node in parts[1].iter_nodes():
+                self._discard(node)
+            self._synced()
+        return parts
+
+    # -------------------------------
+    # Reordering leaves the index valid
+    # -------------------------------
+    def move_to_front(self, node):
+        """Move a node of this list to the front in O(1)"""
+        self._ensure_index()
+        super().move_to_front(node)
+        self._synced()
+        return True
+
+    def move_to_back(self, node):
+        """Move a node of this list to the back in O(1)"""
+        self._ensure_index()
+        super().move_to_back(node)
+        self._synced()
+        return True
+
+    def reverse(self):
+        """Reverse the entire linked list"""
+        self._ensure_index()
+        super().reverse()
+        self._synced()
+
+    def partition_list(self, x):
+        """Partition list around value x"""
+        self._ensure_index()
+        super().partition_list(x)
+        self._synced()
+
+    def sort(self, key=None, reverse=False):
+        """Sort the nodes in place; stable, key and reverse as in sorted()"""
+        self._ensure_index()
+        try:
+            super().sort(key, reverse)
+        finally:
+            self._synced()
+
+    def reverse_between(self, start, end):
+        """Reverse sublist from index start to end (inclusive)"""
+        self._ensure_index()
+        super().reverse_between(start, end)
+        self._synced()
@@ -12,12 +12,7 @@ def check(expected, actual, message=""):
 
 def check_list(linked_list, expected_list, message=""):
     """Check if linked list values match the expected list."""
-    actual = []
-    node = linked_list.head
-    while node:
-        actual.append(node.value)
-        node = node.next
-    check(expected_list, actual, message)
+    check(expected_list, list(linked_list), message)
 
 def print_title(title):
     """Print a clear section title for test cases."""
@@ -0,0 +1,290 @@
+import random
+
+from doubly_linked_list import DoublyLinkedList, _EMPTY
+
+# Skip-list shape: each lane level is promoted with probability P
+MAX_LEVEL = 32
+P = 0.25
+
+
+# ------------------------------
+# Express lane entry for one node
+# ------------------------------
+class _Lane:
+    """Tower of forward links above a node; span[l] counts positions to next[l]."""
+    __slots__ = ("node", "next", "span")
+
+    def __init__(self, node, height):
+        self.node = node
+        self.next = [None] * height
+        self.span = [0] * height
+
+
+def _random_height():
+    height = 0
+    while random.random() < P and height < MAX_LEVEL:
+        height += 1
+    return height
+
+
+# ------------------------------
+# Doubly LinkedList with a positional skip-list index
+# ------------------------------
+class IndexedDoublyLinkedList(DoublyLinkedList):
+    """DoublyLinkedList with skip-list express lanes for positional access.
+
+    The node chain is the bottom level. About a quarter of the nodes get
+    a lane tower whose links skip ahead and record how many positions
+    they jump, so ``get``, ``set_value``, ``insert`` and ``remove`` locate
+    an index in O(log n) expected time instead of walking up to n/2
+    nodes. ``append`` stays O(1) expected because the last lane of each
+    level is remembered; ``prepend`` touches one span per active level.
+
+    The lanes remember the list ``version`` they were built for. Any other
+    structural change (``reverse``, ``partition_list``, ``reverse_between``,
+    ``remove_duplicates``, ``extendleft``, cursor edits, ...) is already
+    O(n) or rare, so the lanes are simply rebuilt in one pass on the next
+    positional access.
+
+    Relinking nodes by hand through ``next``/``prev`` bypasses both the
+    version counter and the index.
+    """
+
+    def __init__(self, value=_EMPTY):
+        super().__init__(value)
+        self._rebuild_index()
+
+    # -------------------------------
+    # Index maintenance
+    # -------------------------------
+    def _reset_index(self):
+        self._header = _Lane(None, MAX_LEVEL)
+        self._level = 0
+        # Last lane on each level and its position (header sits at -1)
+        self._last = [self._header] * MAX_LEVEL
+        self._last_pos = [-1] * MAX_LEVEL
+
+    def _rebuild_index(self):
+        self._reset_index()
+        node = self.head
+        position = 0
+        while node:
+            self._index_new_tail(node, position)
+            node = node.next
+            position += 1
+        self._index_version = self.version
+
+    def _ensure_index(self):
+        if self._index_version != self.version:
+            self._rebuild_index()
+
+    def _index_new_tail(self, node, position):
+        """Give the node just linked at the end (at position) its lane, if any."""
+        height = _random_height()
+        if height == 0:
+            return
+        if height > self._level:
+            self._level = height
+        lane = _Lane(node, height)
+        last = self._last
+        last_pos = self._last_pos
+        for level in range(height):
+            before = last[level]
+            before.next[level] = lane
+            before.span[level] = position - last_pos[level]
+            last[level] = lane
+            last_pos[level] = position
+
+    def _predecessors(self, index):
+        """Return, per level, the last lane before index and its position."""
+        update = [self._header] * self._level
+        positions = [-1] * self._level
+        lane = self._header
+        position = -1
+        for level in range(self._level - 1, -1, -1):
+            following = lane.next[level]
+            while following is not None and position + lane.span[level] < index:
+                position += lane.span[level]
+                lane = following
+                following = lane.next[level]
+            update[level] = lane
+            positions[level] = position
+        return update, positions
+
+    def _walk_from(self, lane, position, index):
+        """Walk the node chain from a lane at position to the node at index."""
+        if lane is self._header:
+            node = self.head
+            position = 0
+        else:
+            node = lane.node
+        for _ in range(index - position):
+            node = node.next
+        return node
+
+    def _node_at(self, index):
+        lane = self._header
+        position = -1
+        for level in range(self._level - 1, -1, -1):
+            following = lane.next[level]
+            while following is not None and position + lane.span[level] <= index:
+                position += lane.span[level]
+                lane = following
+                following = lane.next[level]
+        return self._walk_from(lane, position, index)
+
+    def validate(self):
+        """Also check the lanes (when current): spans, towers and last lanes"""
+        super().validate()
+        if self._index_version != self.version:
+            return True
+        nodes = list(self.iter_nodes())
+        below = None
+        for level in range(MAX_LEVEL):
+            lane = self._header
+            position = -1
+            following = lane.next[level]
+            if level >= self._level:
+                if following is not None:
+                    raise ValueError(f"Lane level {level} is above the index level.")
+                continue
+            lanes = set()
+            while following is not None:
+                if len(following.next) <= level:
+                    raise ValueError(f"Lane on level {level} is too short.")
+                position += lane.span[level]
+                if not position < len(nodes) or following.node is not nodes[position]:
+                    raise ValueError(f"Lane span on level {level} does not reach its node.")
+                if below is not None and id(following) not in below:
+                    raise ValueError(f"Lane on level {level} is missing below.")
+                lanes.add(id(following))
+                lane = following
+                following = lane.next[level]
+            if lane is not self._last[level] or position != self._last_pos[level]:
+                raise ValueError(f"Last lane on level {level} is out of date.")
+            below = lanes
+        return True
+
+    # -------------------------------
+    # Positional methods in O(log n)
+    # -------------------------------
+    def make_empty(self):
+        """Reset the linked list to empty"""
+        super().make_empty()
+        self._reset_index()
+        self._index_version = self.version
+
+    def append(self, value):
+        """Add a node at the end"""
+        self._ensure_index()
+        super().append(value)
+        self._index_new_tail(self.tail, self.length - 1)
+        self._index_version = self.version
+        return True
+
+    def extend(self, iterable):
+        """Add every value from iterable at the end, indexing only the new nodes"""
+        self._ensure_index()
+        position = self.length
+        node = self.tail
+        super().extend(iterable)
+        node = node.next if node else self.head
+        while node:
+            self._index_new_tail(node, position)
+            node = node.next
+            position += 1
+        self._index_version = self.version
+        return True
+
+    def prepend(self, value):
+        """Add a node at the beginning"""
+        return self.insert(0, value)
+
+    def pop(self):
+        """Remove and return the last node"""
+        return self.remove(self.length - 1)
+
+    def pop_first(self):
+        """Remove and return the first node"""
+        return self.remove(0)
+
+    def get(self, index):
+        """Return the node at the specified index"""
+        if index < 0 or index >= self.length:
+            return None
+        self._ensure_index()
+        return self._node_at(index)
+
+    def insert(self, index, value):
+        """Insert a node at the specified index"""
+        length = self.length
+        if index < 0 or index > length:
+            return False
+        if index == length:
+            return self.append(value)
+        self._ensure_index()
+        update, positions = self._predecessors(index)
+        if index == 0:
+            before = None
+        elif update:
+            before = self._walk_from(update[0], positions[0], index - 1)
+        else:
+            before = self._walk_from(self._header, -1, index - 1)
+        node = self._insert_node_after(before, value)
+
+        height = _random_height()
+        if height > self._level:
+            update.extend([self._header] * (height - self._level))
+            positions.extend([-1] * (height - self._level))
+            self._level = height
+        lane = _Lane(node, height) if height else None
+        for level in range(self._level):
+            before_lane = update[level]
+            following = before_lane.next[level]
+            if level < height:
+                lane.next[level] = following
+                if following is not None:
+                    lane.span[level] = positions[level] + before_lane.span[level] + 1 - index
+                before_lane.next[level] = lane
+                before_lane.span[level] = index - positions[level]
+                if following is None:
+                    self._last[level] = lane
+                    self._last_pos[level] = index
+                    continue
+            elif following is not None:
+                before_lane.span[level] += 1
+            if self._last_pos[level] >= index:
+                self._last_pos[level] += 1
+        self._index_version = self.version
+        return True
+
+    def remove(self, index):
+        """Remove and return the node at the specified index"""
+        if index < 0 or index >= self.length:
+            return None
+        self._ensure_index()
+        update, positions = self._predecessors(index)
+        if update:
+            node = self._walk_from(update[0], positions[0], index)
+        else:
+            node = self._walk_from(self._header, -1, index)
+        for level in range(self._level):
+            before_lane = update[level]
+            following = before_lane.next[level]
+            if following is not None and following.node is node:
+                before_lane.next[level] = following.next[level]
+                if following.next[level] is not None:
+                    before_lane.span[level] += following.span[level] - 1
+                if self._last[level] is following:
+                    self._last[level] = before_lane
+                    self._last_pos[level] = positions[level]
+                    continue
+            elif following is not None:
+                before_lane.span[level] -= 1
+            if self._last_pos[level] > index:
+                self._last_pos[level] -= 1
+        while self._level and self._header.next[self._level - 1] is None:
+            self._level -= 1
+        self._unlink_node(node)
+        self._index_version = self.version
+        return node
@@ -0,0 +1,275 @@
+import weakref
+
+from doubly_linked_list import Cursor, DoublyLinkedList, _EMPTY
+
+
+# ------------------------------
+# Mixin for objects that carry their own links
+# ------------------------------
+class IntrusiveNode:
+    """Mixin that lets instances be linked into an IntrusiveDoublyLinkedList.
+
+    It adds ``next``, ``prev`` and an owner slot to the class, so the list
+    links the objects themselves and allocates no wrapper ``Node``. An
+    object can be in at most one intrusive list at a time. ``value`` is
+    the object itself, which is what the list yields and compares, so a
+    subclass must not define its own ``value`` attribute.
+
+    The mixin declares ``__slots__``: a subclass without ``__slots__`` still
+    gets a ``__dict__``, and one with ``__slots__`` stays dict-free.
+    """
+    __slots__ = ("next", "prev", "_owner")
+
+    @property
+    def value(self):
+        return self
+
+    @property
+    def owner(self):
+        """The IntrusiveDoublyLinkedList holding this object, or None"""
+        ref = getattr(self, "_owner", None)
+        return ref() if ref is not None else None
+
+
+# ------------------------------
+# Cursor whose value setter swaps objects
+# ------------------------------
+class _IntrusiveCursor(Cursor):
+    __slots__ = ()
+
+    @property
+    def value(self):
+        self._check()
+        return self._node
+
+    @value.setter
+    def value(self, obj):
+        """Replace the object under the cursor with obj, as set_value does"""
+        self._check()
+        old = self._node
+        if old is obj:
+            return
+        self._list._insert_node_after(old, obj)
+        self._list._unlink_node(old)
+        self._node = obj
+        self._sync()
+
+
+# ------------------------------
+# Doubly LinkedList of IntrusiveNode objects
+# ------------------------------
+class IntrusiveDoublyLinkedList(DoublyLinkedList):
+    """DoublyLinkedList that links IntrusiveNode objects directly.
+
+    ``append(obj)``, ``insert(i, obj)`` and the other adding methods link
+    obj itself instead of wrapping it in a ``Node``. So building the list
+    allocates nothing, and ``get``, ``pop`` and iteration return the
+    objects. ``unlink(obj)`` / ``remove_node(obj)`` remove an object in
+    O(1). They raise ValueError if obj is not in this list, which is known
+    from its owner slot.
+
+    Adding an object that is already in a list raises ValueError.
+    ``set_value(i, obj)`` replaces the object at index i, and
+    ``swap_pairs`` swaps objects by relinking them. Assigning a cursor's
+    ``value`` replaces the object under it the same way, and the cursor
+    moves onto the new object. Because every object
+    records its list, ``concat``, ``splice`` and ``split_at`` take time
+    proportional to the objects they move, and ``make_empty`` O(n).
+
+    Objects hold their list through one weak reference shared by the
+    whole list, so linking allocates nothing, and the objects of a list
+    that is dropped without ``make_empty()`` are free to join another.
+    """
+
+    def __init__(self, value=_EMPTY):
+        super().__init__()
+        self._ref = weakref.ref(self)
+        if value is not _EMPTY:
+            self.append(value)
+
+    def _adopt(self, obj):
+        """Check obj can be linked here, clear its links and return it"""
+        if not isinstance(obj, IntrusiveNode):
+            raise ValueError(f"{type(obj).__name__} does not inherit IntrusiveNode.")
+        if obj.owner is not None:
+            raise ValueError("Object is already in an intrusive list.")
+        obj.next = obj.prev = None
+        obj._owner = self._ref
+        return obj
+
+    def validate(self):
+        """Check the structure and that every object records this list as its owner"""
+        super().validate()
+        node = self.head
+        while node is not None:
+            if node._owner is not self._ref:
+                raise ValueError("Object in the list does not record it as owner.")
+            node = node.next
+        return True
+
+    # -------------------------------
+    # Linking objects instead of new Nodes
+    # -------------------------------
+    def append(self, obj):
+        """Link obj at the end"""
+        self._link_node_after(self.tail, self._adopt(obj))
+        return True
+
+    def prepend(self, obj):
+        """Link obj at the beginning"""
+        self._link_node_after(None, self._adopt(obj))
+        return True
+
+    def _insert_node_after(self, before, obj):
+        """Link obj after before (None means at the front) and return it"""
+        return self._link_node_after(before, self._adopt(obj))
+
+    def extend(self, iterable):
+        """Link every object from iterable at the end"""
+        for obj in iterable:
+            self.append(obj)
+        return True
+
+    def extendleft(self, iterable):
+        """Link every object from iterable at the front (they end up reversed)"""
+        for obj in iterable:
+            self.prepend(obj)
+        return True
+
+    def insert_many(self, index, iterable):
+        """Link every object from iterable starting at index"""
+        if index < 0 or index > self.length:
+            return False
+        before = self.get(index - 1) if index else None
+        for obj in iterable:
+            before = self._insert_node_after(before, obj)
+        return True
+
+    def cursor(self, index=0):
+        """Return a cursor on the object at index, or None if out of range"""
+        obj = self.get(index)
+        if obj is None:
+            return None
+        return _IntrusiveCursor(self, obj, index)
+
+    def set_value(self, index, obj):
+        """Replace the object at the specified index with obj"""
+        old = self.get(index)
+        if old is None:
+            return False
+        if old is obj:
+            return True
+        self._insert_node_after(old, obj)
+        self._unlink_node(old)
+        return True
+
+    # -------------------------------
+    # Unlinking, O(1) given the object
+    # -------------------------------
+    def _unlink_node(self, node):
+        """Detach node from the list and return it"""
+        super()._unlink_node(node)
+        node._owner = None
+        return node
+
+    def unlink(self, obj):
+        """Remove obj from this list in O(1) and return it"""
+        if not isinstance(obj, IntrusiveNode) or obj.owner is not self:
+            raise ValueError("Object is not in this list.")
+        return self._unlink_node(obj)
+
+    def pop(self):
+        """Unlink and return the last object"""
+        node = super().pop()
+        if node is not None:
+            node._owner = None
+        return node
+
+    def pop_first(self):
+        """Unlink and return the first object"""
+        node = super().pop_first()
+        if node is not None:
+            node._owner = None
+        return node
+
+    def remove_range(self, start, stop):
+        """Unlink the objects at indexes start..stop-1 (slice semantics); return how many"""
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start >= stop:
+            return 0
+        removed = list(self.values_slice(start, stop))
+        super().remove_range(start, stop)
+        for obj in removed:
+            obj._owner = None
+        return stop - start
+
+    def remove_duplicates(self):
+        """Unlink objects equal to an earlier one"""
+        seen = set()
+        for obj in list(self):
+            if obj in seen:
+                self._unlink_node(obj)
+            else:
+                seen.add(obj)
+
+    def make_empty(self):
+        """Unlink every object in O(n)"""
+        node = self.head
+        if node is not None and node._owner is self._ref:
+            # Snapshots must copy before the links are cleared
+            self._detach_views()
+        # concat() and splice() empty the other list after its objects
+        # changed owner; those objects keep their new links
+        while node is not None and node._owner is self._ref:
+            following = node.next
+            node.next = node.prev = node._owner = None
+            node = following
+        super().make_empty()
+
+    def swap_pairs(self):
+        """Swap adjacent objects in pairs by relinking them"""
+        first = self.head
+        while first is not None and first.next is not None:
+            second = first.next
+            self._unlink_node(second)
+            self._insert_node_after(first.prev, second)
+            first = first.next
+
+    # -------------------------------
+    # Moving objects between lists
+    # -------------------------------
+    def _take_ownership(self, other):
+        """Record this list as the owner of every object in other"""
+        if not isinstance(other, IntrusiveDoublyLinkedList):
+            raise ValueError("Can only move objects from another IntrusiveDoublyLinkedList.")
+        node = other.head
+        while node is not None:
+            node._owner = self._ref
+            node = node.next
+
+    def concat(self, other):
+        """Move all of other's objects to the end of this list; other ends up empty"""
+        if other is self:
+            raise ValueError("Cannot concat a list with itself.")
+        self._take_ownership(other)
+        return super().concat(other)
+
+    def splice(self, index, other):
+        """Move all of other's objects in before index; other ends up empty"""
+        if other is self:
+            raise ValueError("Cannot splice a list into itself.")
+        if index < 0 or index > self.length:
+            return False
+        if index == self.length:
+            # The base splice hands this case to concat, which takes ownership
+            return self.concat(other)
+        self._take_ownership(other)
+        return super().splice(index, other)
+
+    def split_at(self, index):
+        """Split off the objects from index onwards into a new list"""
+        result = super().split_at(index)
+        if result is not None:
+            right = result[1]
+            right._take_ownership(right)
+        return result
@@ -0,0 +1,308 @@
+from doubly_linked_list import DoublyLinkedList, _EMPTY, _build_chain
+
+
+# ------------------------------
+# Doubly LinkedList with an O(1) reverse
+# ------------------------------
+class LazyReverseDoublyLinkedList(DoublyLinkedList):
+    """DoublyLinkedList whose ``reverse()`` flips an orientation flag in O(1).
+
+    While the flag is set the nodes stay linked in their old order and every
+    method reads through it: ``append`` links at the physical head, ``get(i)``
+    counts from the physical tail, iteration walks ``prev`` links, and so
+    on. ``reverse_between``, ``move_to_front``/``move_to_back`` and the
+    node-handle inserts map onto the mirrored physical operation without
+    touching the rest of the list.
+
+    Methods that depend on the physical order and cannot be mirrored
+    (``partition_list``, ``sort``, ``remove_duplicates``, ``split_at``,
+    ``concat``, ``splice``, ``cursor`` and ``swap_pairs`` on an odd
+    length) first call ``normalize()``, which relinks the nodes in O(n)
+    and clears the flag.
+
+    Node handles keep their physical links: while the list is reversed a
+    node's ``next`` points toward the logical head. Call ``normalize()``
+    before walking nodes by hand or before passing the list to another
+    list's ``concat``/``splice``.
+    """
+
+    def __init__(self, value=_EMPTY):
+        super().__init__(value)
+        self._reversed = False
+        self._flips = 0
+
+    # -------------------------------
+    # Orientation
+    # -------------------------------
+    @property
+    def is_reversed(self):
+        """True while the nodes are linked in the opposite of the logical order"""
+        return self._reversed
+
+    @property
+    def version(self):
+        """Counter bumped by every change to the list's structure or orientation."""
+        return super().version + self._flips
+
+    def reverse(self):
+        """Reverse the entire linked list in O(1)"""
+        self._reversed = not self._reversed
+        self._flips += 1
+
+    def normalize(self):
+        """Relink the nodes in logical order (O(n)) if the list is reversed"""
+        if self._reversed:
+            DoublyLinkedList.reverse(self)
+            self._reversed = False
+            self._flips += 1
+
+    def _physical(self, index):
+        return self.length - 1 - index if self._reversed else index
+
+    # -------------------------------
+    # Ends and iteration
+    # -------------------------------
+    @property
+    def head(self):
+        return DoublyLinkedList.tail.fget(self) if self._reversed else DoublyLinkedList.head.fget(self)
+
+    @head.setter
+    def head(self, node):
+        (DoublyLinkedList.tail if self._reversed else DoublyLinkedList.head).fset(self, node)
+
+    @property
+    def tail(self):
+        return DoublyLinkedList.head.fget(self) if self._reversed else DoublyLinkedList.tail.fget(self)
+
+    @tail.setter
+    def tail(self, node):
+        (DoublyLinkedList.head if self._reversed else DoublyLinkedList.tail).fset(self, node)
+
+    def __iter__(self):
+        return super().__reversed__() if self._reversed else super().__iter__()
+
+    def __reversed__(self):
+        return super().__iter__() if self._reversed else super().__reversed__()
+
+    def iter_nodes(self, reverse=False):
+        """Yield the nodes from head to tail, or tail to head if reverse"""
+        return super().iter_nodes(reverse != self._reversed)
+
+    def values_slice(self, start=0, stop=None):
+        """Lazily yield the values at indexes start..stop-1 (slice semantics)"""
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start >= stop:
+            return
+        node = self.get(start)
+        version = self.version
+        for _ in range(stop - start):
+            yield node.value
+            if self.version != version:
+                raise RuntimeError("DoublyLinkedList changed during iteration")
+            node = node.prev if self._reversed else node.next
+
+    def snapshot(self):
+        """Return a read-only SnapshotView of the current values in O(1)"""
+        view = super().snapshot()
+        # The view reads the shared nodes in the list's current orientation
+        view._forward = not self._reversed
+        return view
+
+    def make_empty(self):
+        """Reset the linked list to empty"""
+        super().make_empty()
+        self._reversed = False
+
+    def append(self, value):
+        """Add a node at the end"""
+        if self._reversed:
+            return DoublyLinkedList.prepend(self, value)
+        return DoublyLinkedList.append(self, value)
+
+    def prepend(self, value):
+        """Add a node at the beginning"""
+        if self._reversed:
+            return DoublyLinkedList.append(self, value)
+        return DoublyLinkedList.prepend(self, value)
+
+    def pop(self):
+        """Remove and return the last node"""
+        if self._reversed:
+            return DoublyLinkedList.pop_first(self)
+        return DoublyLinkedList.pop(self)
+
+    def pop_first(self):
+        """Remove and return the first node"""
+        if self._reversed:
+            return DoublyLinkedList.pop(self)
+        return DoublyLinkedList.pop_first(self)
+
+    def extend(self, iterable):
+        """Add every value from iterable at the end"""
+        return super().extendleft(iterable) if self._reversed else super().extend(iterable)
+
+    def extendleft(self, iterable):
+        """Prepend every value from iterable (the values end up reversed)"""
+        return super().extend(iterable) if self._reversed else super().extendleft(iterable)
+
+    # -------------------------------
+    # Positional methods
+    # -------------------------------
+    def get(self, index):
+        """Return the node at the specified index"""
+        if index < 0 or index >= self.length:
+            return None
+        return super().get(self._physical(index))
+
+    def set_value(self, index, value):
+        """Set the value at the specified index"""
+        node = self.get(index)
+        if node is None:
+            return False
+        self._set_node_value(node, value)
+        return True
+
+    def insert(self, index, value):
+        """Insert a node at the specified index"""
+        if not self._reversed:
+            return super().insert(index, value)
+        if index < 0 or index > self.length:
+            return False
+        # Logically before index means physically after its node
+        before = self.get(index) if index < self.length else None
+        self._insert_node_after(before, value)
+        return True
+
+    def remove(self, index):
+        """Remove and return the node at the specified index"""
+        if not self._reversed:
+            return super().remove(index)
+        node = self.get(index)
+        if node is None:
+            return None
+        return self._unlink_node(node)
+
+    def insert_many(self, index, iterable):
+        """Insert every value from iterable starting at index"""
+        if not self._reversed:
+            return super().insert_many(index, iterable)
+        if index < 0 or index > self.length:
+            return False
+        # Logical order is physical order backward, so the chain is built
+        # reversed and spliced in physically after the node at index
+        first, last, count = _build_chain(iterable, backward=True)
+        if count == 0:
+            return True
+        before = self.get(index) if index < self.length else None
+        self._link_chain_after(before, first, last, count)
+        return True
+
+    def remove_range(self, start, stop):
+        """Remove the nodes at indexes start..stop-1 (slice semantics); return how many"""
+        if not self._reversed:
+            return super().remove_range(start, stop)
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start >= stop:
+            return 0
+        # Logical start..stop-1 is the physical run from stop-1 to start
+        self._unlink_chain(self.get(stop - 1), self.get(start), stop - start)
+        return stop - start
+
+    def find_middle_node(self):
+        """Return the middle node"""
+        if not self._reversed:
+            return super().find_middle_node()
+        return self.get(self.length // 2)
+
+    def find_kth_from_end(self, k):
+        """Find k-th node from the end"""
+        if not self._reversed:
+            return super().find_kth_from_end(k)
+        if k <= 0 or k > self.length:
+            return None
+        return super().get(k - 1)
+
+    def binary_to_decimal(self):
+        """Convert binary representation to decimal"""
+        decimal = 0
+        for bit in self:
+            decimal = decimal * 2 + bit
+        return decimal
+
+    # -------------------------------
+    # Mirrored in place
+    # -------------------------------
+    def reverse_between(self, start, end):
+        """Reverse sublist from index start to end (inclusive)"""
+        if self._reversed:
+            start, end = self._physical(end), self._physical(start)
+        super().reverse_between(start, end)
+
+    def insert_after(self, node, value):
+        """Insert value right after a node of this list in O(1); return the new node"""
+        if self._reversed:
+            return super().insert_before(node, value)
+        return super().insert_after(node, value)
+
+    def insert_before(self, node, value):
+        """Insert value right before a node of this list in O(1); return the new node"""
+        if self._reversed:
+            return super().insert_after(node, value)
+        return super().insert_before(node, value)
+
+    def move_to_front(self, node):
+        """Move a node of this list to the front in O(1)"""
+        return super().move_to_back(node) if self._reversed else super().move_to_front(node)
+
+    def move_to_back(self, node):
+        """Move a node of this list to the back in O(1)"""
+        return super().move_to_front(node) if self._reversed else super().move_to_back(node)
+
+    def swap_pairs(self):
+        """Swap adjacent node values in pairs"""
+        if self.length % 2:
+            # The unpaired value is at the logical end, so orientation matters
+            self.normalize()
+        super().swap_pairs()
+
+    # -------------------------------
+    # Normalized first
+    # -------------------------------
+    def partition_list(self, x):
+        """Partition list around value x"""
+        self.normalize()
+        super().partition_list(x)
+
+    def sort(self, key=None, reverse=False):
+        """Sort the nodes in place; stable, with key and reverse as in sorted()"""
+        self.normalize()
+        super().sort(key=key, reverse=reverse)
+
+    def remove_duplicates(self):
+        """Remove duplicate values in the list"""
+        self.normalize()
+        super().remove_duplicates()
+
+    def split_at(self, index):
+        """Split off the nodes from index onwards into a new list"""
+        self.normalize()
+        return super().split_at(index)
+
+    def concat(self, other):
+        """Move all of other's nodes to the end of this list; other ends up empty"""
+        self.normalize()
+        if isinstance(other, LazyReverseDoublyLinkedList):
+            other.normalize()
+        return super().concat(other)
+
+    def splice(self, index, other):
+        """Move all of other's nodes in before index; other ends up empty"""
+        self.normalize()
+        if isinstance(other, LazyReverseDoublyLinkedList):
+            other.normalize()
+        return super().splice(index, other)
+
+    def cursor(self, index=0):
+        """Return a Cursor on the node at index, or None if out of range"""
+        self.normalize()
+        return super().cursor(index)
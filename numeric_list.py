@@ -0,0 +1,404 @@
+import numpy as np
+
+from doubly_linked_list import Node, _EMPTY
+
+# Smallest buffer allocated when the list grows
+MIN_CAPACITY = 16
+# Value kinds each list kind accepts; the values must also fit its range
+_STORABLE_KINDS = {"b": "b", "i": "biu", "u": "biu", "f": "biuf"}
+
+
+# ------------------------------
+# Doubly LinkedList of numbers stored in one NumPy array
+# ------------------------------
+class NumericDoublyLinkedList:
+    """Doubly linked list API over a contiguous NumPy array of numbers.
+
+    The values live in ``_data[_start:_stop]`` with free room kept at both
+    ends, so ``append``, ``prepend``, ``pop`` and ``pop_first`` are
+    amortized O(1). Whole-list methods (``partition_list``,
+    ``is_palindrome``, ``remove_duplicates``, ``reverse``, ``sort``,
+    ``swap_pairs``, ``binary_to_decimal``) and the reductions ``sum``,
+    ``min`` and ``max`` run as vectorized NumPy operations instead of
+    per-node Python loops. Inserts and removals in the middle shift the
+    shorter side of the list with one array copy.
+
+    All values share one ``dtype`` (float64 unless given; ``from_iterable``
+    and ``from_numpy`` infer it). A value outside the dtype's range raises
+    ValueError instead of wrapping around: 1.5 in an int64 list, 300 in an
+    int8 list, -1 in a uint8 list, or 1e300 in a float32 list. Float
+    lists round like NumPy does, so 0.1 in a float32 list or 2**60 + 1 in
+    a float64 list is stored as the nearest float.
+
+    There are no per-value nodes: ``get``, ``head``, ``tail``, the finder
+    methods and the removal methods build a detached ``Node`` holding the
+    value only when asked. Use ``set_value`` to change a value in place.
+    """
+
+    def __init__(self, value=_EMPTY, dtype=np.float64):
+        self._dtype = np.dtype(dtype)
+        if self._dtype.kind not in "biuf":
+            raise ValueError("NumericDoublyLinkedList needs a numeric dtype.")
+        self._data = np.empty(MIN_CAPACITY, self._dtype)
+        self._start = self._stop = MIN_CAPACITY // 2
+        self._version = 0
+        if value is not _EMPTY:
+            self.append(value)
+
+    # -------------------------------
+    # Properties: head, tail, length, dtype
+    # -------------------------------
+    @property
+    def head(self):
+        return Node(self._data[self._start].item()) if self._stop > self._start else None
+
+    @property
+    def tail(self):
+        return Node(self._data[self._stop - 1].item()) if self._stop > self._start else None
+
+    @property
+    def length(self):
+        return self._stop - self._start
+
+    @property
+    def version(self):
+        """Counter bumped by every change to the list's structure."""
+        return self._version
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    # -------------------------------
+    # Buffer management
+    # -------------------------------
+    def _view(self):
+        return self._data[self._start:self._stop]
+
+    def _array(self, values):
+        """Return values as a 1-D array of this list's dtype, or raise ValueError"""
+        values = np.asarray(values)
+        if values.ndim != 1 and values.size:
+            raise ValueError("Expected a flat sequence of numbers.")
+        values = values.reshape(-1)
+        if values.dtype == self._dtype or not values.size:
+            return values.astype(self._dtype, copy=False)
+        if values.dtype.kind not in _STORABLE_KINDS[self._dtype.kind]:
+            raise ValueError(f"Cannot store {values.dtype} values in a {self._dtype} list.")
+        with np.errstate(over="ignore", invalid="ignore"):
+            cast = values.astype(self._dtype)
+        if self._dtype.kind == "f":
+            lost = np.isinf(cast) & ~np.isinf(values)
+        else:
+            lost = cast != values
+        if lost.any():
+            raise ValueError(f"{values[lost][0]} is out of range for a {self._dtype} list.")
+        return cast
+
+    def _reserve(self, front, back):
+        """Make room for front more values before the list and back more after it"""
+        if self._start >= front and len(self._data) - self._stop >= back:
+            return
+        length = self._stop - self._start
+        capacity = max(MIN_CAPACITY, 2 * length, length + front + back)
+        data = np.empty(capacity, self._dtype)
+        start = front + (capacity - length - front - back) // 2
+        data[start:start + length] = self._view()
+        self._data = data
+        self._start = start
+        self._stop = start + length
+
+    def _replace(self, start, stop, values):
+        """Replace the values at indexes start..stop-1 with values (an array)"""
+        length = self._stop - self._start
+        growth = len(values) - (stop - start)
+        if start < length - stop:
+            # Fewer values before the range: shift the front part
+            self._reserve(max(growth, 0), 0)
+            front = self._data[self._start:self._start + start].copy()
+            self._start -= growth
+            self._data[self._start:self._start + start] = front
+        else:
+            self._reserve(0, max(growth, 0))
+            back = self._data[self._start + stop:self._stop].copy()
+            self._stop += growth
+            self._data[self._stop - len(back):self._stop] = back
+        self._data[self._start + start:self._start + start + len(values)] = values
+        self._version += 1
+
+    def _load(self, values):
+        """Replace the whole contents with values (an array of this dtype)"""
+        self._view()[:] = values
+        self._version += 1
+
+    def validate(self):
+        """Check the buffer bounds; return True or raise ValueError"""
+        if not 0 <= self._start <= self._stop <= len(self._data):
+            raise ValueError("List bounds lie outside the buffer.")
+        if self._data.dtype != self._dtype or self._data.ndim != 1:
+            raise ValueError("Buffer does not match the list's dtype.")
+        return True
+
+    # -------------------------------
+    # NumPy conversion
+    # -------------------------------
+    def to_numpy(self, dtype=None):
+        """Return a copy of the values as a NumPy array"""
+        return self._view().astype(self._dtype if dtype is None else dtype, copy=True)
+
+    @classmethod
+    def from_numpy(cls, array):
+        """Build a new list holding a copy of a 1-D NumPy array, keeping its dtype"""
+        array = np.asarray(array)
+        if array.ndim != 1:
+            raise ValueError("Expected a 1-D array.")
+        dll = cls(dtype=array.dtype)
+        dll._replace(0, 0, array)
+        return dll
+
+    @classmethod
+    def from_iterable(cls, iterable=(), dtype=None):
+        """Build a new list from iterable; dtype is inferred if not given"""
+        if dtype is None:
+            values = np.asarray(list(iterable))
+            if values.size == 0:
+                values = values.astype(np.float64)
+        else:
+            values = np.fromiter(iterable, dtype)
+        return cls.from_numpy(values)
+
+    # -------------------------------
+    # Iteration protocol
+    # -------------------------------
+    def __len__(self):
+        return self._stop - self._start
+
+    def __iter__(self):
+        """Yield the values from head to tail"""
+        return iter(self._view().tolist())
+
+    def __reversed__(self):
+        """Yield the values from tail to head"""
+        return iter(self._view()[::-1].tolist())
+
+    def __contains__(self, value):
+        try:
+            return bool(np.any(self._view() == value))
+        except (TypeError, ValueError):
+            return False
+
+    def values_slice(self, start=0, stop=None):
+        """Lazily yield the values at indexes start..stop-1 (slice semantics)"""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        yield from self._view()[start:stop].tolist()
+
+    # -------------------------------
+    # Core methods
+    # -------------------------------
+    def print_list(self):
+        """Print the linked list in a readable format."""
+        if self._stop == self._start:
+            print("empty list")
+        else:
+            values = [str(value) for value in self]
+            values.append("None")
+            print(" <-> ".join(values))
+
+    def make_empty(self):
+        """Reset the linked list to empty"""
+        self._start = self._stop = len(self._data) // 2
+        self._version += 1
+
+    def append(self, value):
+        """Add a value at the end"""
+        value = self._array([value])[0]
+        self._reserve(0, 1)
+        self._data[self._stop] = value
+        self._stop += 1
+        self._version += 1
+        return True
+
+    def extend(self, iterable):
+        """Add every value from iterable at the end with one array copy"""
+        values = self._array(list(iterable))
+        self._reserve(0, len(values))
+        self._data[self._stop:self._stop + len(values)] = values
+        self._stop += len(values)
+        self._version += 1
+        return True
+
+    def extendleft(self, iterable):
+        """Prepend every value from iterable (the values end up reversed)"""
+        values = self._array(list(iterable))
+        self._reserve(len(values), 0)
+        self._data[self._start - len(values):self._start] = values[::-1]
+        self._start -= len(values)
+        self._version += 1
+        return True
+
+    def pop(self):
+        """Remove the last value and return it in a detached Node"""
+        if self._stop == self._start:
+            return None
+        self._stop -= 1
+        self._version += 1
+        return Node(self._data[self._stop].item())
+
+    def prepend(self, value):
+        """Add a value at the beginning"""
+        value = self._array([value])[0]
+        self._reserve(1, 0)
+        self._start -= 1
+        self._data[self._start] = value
+        self._version += 1
+        return True
+
+    def pop_first(self):
+        """Remove the first value and return it in a detached Node"""
+        if self._stop == self._start:
+            return None
+        self._start += 1
+        self._version += 1
+        return Node(self._data[self._start - 1].item())
+
+    def get(self, index):
+        """Return a detached Node holding the value at the specified index"""
+        if index < 0 or index >= len(self):
+            return None
+        return Node(self._data[self._start + index].item())
+
+    def set_value(self, index, value):
+        """Set the value at the specified index"""
+        if index < 0 or index >= len(self):
+            return False
+        self._data[self._start + index] = self._array([value])[0]
+        return True
+
+    def insert(self, index, value):
+        """Insert a value at the specified index, shifting the shorter side"""
+        if index < 0 or index > len(self):
+            return False
+        self._replace(index, index, self._array([value]))
+        return True
+
+    def remove(self, index):
+        """Remove the value at the specified index and return it in a detached Node"""
+        if index < 0 or index >= len(self):
+            return None
+        node = self.get(index)
+        self._replace(index, index + 1, self._array([]))
+        return node
+
+    def insert_many(self, index, iterable):
+        """Insert every value from iterable starting at index with one shift"""
+        if index < 0 or index > len(self):
+            return False
+        self._replace(index, index, self._array(list(iterable)))
+        return True
+
+    def remove_range(self, start, stop):
+        """Remove the values at indexes start..stop-1 (slice semantics); return how many"""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return 0
+        self._replace(start, stop, self._array([]))
+        return stop - start
+
+    # -------------------------------
+    # Vectorized whole-list methods
+    # -------------------------------
+    def is_palindrome(self):
+        """Check if the list is a palindrome"""
+        view = self._view()
+        return bool(np.array_equal(view, view[::-1]))
+
+    def reverse(self):
+        """Reverse the entire linked list"""
+        self._load(self._view()[::-1].copy())
+
+    def partition_list(self, x):
+        """Partition list around value x (stable, like DoublyLinkedList)"""
+        view = self._view()
+        below = view < x
+        self._load(np.concatenate((view[below], view[~below])))
+
+    def sort(self, key=None, reverse=False):
+        """Sort the values in place; stable, key and reverse as in sorted()"""
+        if key is not None:
+            values = sorted(self._view().tolist(), key=key, reverse=reverse)
+            self._load(self._array(values))
+            return
+        if reverse:
+            # Reverse, stable-sort, reverse back: equal values keep their
+            # order, as with sorted(..., reverse=True)
+            self._load(np.sort(self._view()[::-1], kind="stable")[::-1])
+        else:
+            self._load(np.sort(self._view(), kind="stable"))
+
+    def reverse_between(self, start, end):
+        """Reverse sublist from index start to end (inclusive)"""
+        if len(self) <= 1 or start >= end:
+            return
+        part = self._view()[start:end + 1]
+        part[:] = part[::-1].copy()
+        self._version += 1
+
+    def swap_pairs(self):
+        """Swap adjacent values in pairs"""
+        view = self._view()
+        pairs = view[:len(view) - len(view) % 2].reshape(-1, 2)
+        pairs[:] = pairs[:, ::-1].copy()
+
+    def find_middle_node(self):
+        """Return a detached Node holding the middle value"""
+        return self.get(len(self) // 2)
+
+    def has_loop(self):
+        """An array has no links to loop through"""
+        return False
+
+    def find_kth_from_end(self, k):
+        """Find k-th value from the end"""
+        if k <= 0 or k > len(self):
+            return None
+        return self.get(len(self) - k)
+
+    def remove_duplicates(self):
+        """Remove duplicate values in the list, keeping first occurrences in order"""
+        view = self._view()
+        if len(view) <= 1:
+            return
+        _, first = np.unique(view, return_index=True)
+        if len(first) != len(view):
+            self._replace(0, len(view), view[np.sort(first)])
+
+    def binary_to_decimal(self):
+        """Convert binary representation to decimal"""
+        view = self._view()
+        if self._dtype.kind in "biu" and np.all((view == 0) | (view == 1)):
+            # Exact for any length: render the bits as one string of '0'/'1'
+            digits = (view.astype(np.uint8) + ord("0")).tobytes()
+            return int(digits, 2) if digits else 0
+        decimal = 0
+        for bit in view.tolist():
+            decimal = decimal * 2 + bit
+        return decimal
+
+    # -------------------------------
+    # Vectorized reductions
+    # -------------------------------
+    def sum(self):
+        """Return the sum of the values (0 for an empty list)"""
+        return self._view().sum().item()
+
+    def min(self):
+        """Return the smallest value, or None if the list is empty"""
+        if self._stop == self._start:
+            return None
+        return self._view().min().item()
+
+    def max(self):
+        """Return the largest value, or None if the list is empty"""
+        if self._stop == self._start:
+            return None
+        return self._view().max().item()
@@ -0,0 +1,111 @@
+"""Process-pool map, filter and reduce over the values of a linked list.
+
+The list is walked once, one batch of values at a time. Each batch is
+pickled to a worker of a ``concurrent.futures.ProcessPoolExecutor``, and
+the results come back in list order. The walk stays only a few batches
+ahead of the results, so the parent never holds a copy of every value.
+``fn`` and ``pred`` must be picklable (module-level functions, not
+lambdas), and so must the values. A list that fits in one batch is
+processed in this process, with no pool.
+
+Results are linked into a plain DoublyLinkedList whatever the class of
+the input: a sorted list would re-sort mapped values, and an intrusive
+list cannot link arbitrary results.
+"""
+import collections
+import functools
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from doubly_linked_list import DoublyLinkedList
+
+# Smallest batch chosen automatically; pickling dominates below this
+MIN_CHUNK = 1_000
+# Automatic batches per worker, so a slow batch does not idle the others
+BATCHES_PER_WORKER = 4
+# Batches submitted but not yet collected, per worker
+BATCHES_IN_FLIGHT = 2
+
+
+def _batches(values, chunk_size):
+    iterator = iter(values)
+    while True:
+        batch = list(itertools.islice(iterator, chunk_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _map_batch(fn, batch):
+    return [fn(value) for value in batch]
+
+
+def _filter_batch(pred, batch):
+    return [value for value in batch if pred(value)]
+
+
+def _reduce_batch(fn, batch):
+    return functools.reduce(fn, batch)
+
+
+def _ordered_results(pool, work, fn, batches, in_flight):
+    """Yield work(fn, batch) for each batch, run in pool, with at most in_flight pending"""
+    pending = collections.deque()
+    try:
+        for batch in batches:
+            pending.append(pool.submit(work, fn, batch))
+            if len(pending) >= in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _run(work, fn, dll, chunk_size, max_workers, executor):
+    """Return [work(fn, batch) for each batch of dll's values], in order"""
+    workers = max_workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK, -(-len(dll) // (workers * BATCHES_PER_WORKER)))
+    elif chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+    batches = _batches(dll, chunk_size)
+    if len(dll) <= chunk_size or (executor is None and workers == 1):
+        return [work(fn, batch) for batch in batches]
+    in_flight = workers * BATCHES_IN_FLIGHT
+    if executor is not None:
+        return list(_ordered_results(executor, work, fn, batches, in_flight))
+    with ProcessPoolExecutor(max_workers) as pool:
+        return list(_ordered_results(pool, work, fn, batches, in_flight))
+
+
+def _linked(results):
+    return DoublyLinkedList.from_iterable(itertools.chain.from_iterable(results))
+
+
+def parallel_map(dll, fn, chunk_size=None, max_workers=None, executor=None):
+    """Return a new DoublyLinkedList of fn(value) for every value of dll, in order.
+
+    chunk_size is the number of values per batch; by default each worker
+    gets about four batches of at least MIN_CHUNK values. Pass a running
+    executor to reuse its processes across calls.
+    """
+    return _linked(_run(_map_batch, fn, dll, chunk_size, max_workers, executor))
+
+
+def parallel_filter(dll, pred, chunk_size=None, max_workers=None, executor=None):
+    """Return a new DoublyLinkedList of the values of dll for which pred is true, in order"""
+    return _linked(_run(_filter_batch, pred, dll, chunk_size, max_workers, executor))
+
+
+def parallel_reduce(dll, fn, init, chunk_size=None, max_workers=None, executor=None):
+    """Fold dll's values with fn, starting from init.
+
+    Each batch is reduced in a worker and the partial results are folded
+    into init here, so fn must be associative, like + or max, for the
+    result to equal functools.reduce(fn, dll, init).
+    """
+    partials = _run(_reduce_batch, fn, dll, chunk_size, max_workers, executor)
+    return functools.reduce(fn, partials, init)
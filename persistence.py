@@ -0,0 +1,188 @@
+"""Binary files for linked lists, and a read-only memory-mapped view.
+
+File layout (all integers little-endian):
+
+    header   16 bytes: magic b"DLL1", typecode, 3 pad bytes, uint64 count
+    payload  typecode "q": count int64 values
+             typecode "d": count float64 values
+             typecode "p": (count + 1) uint64 offsets into the pickle
+                           section, then the pickled values back to back
+
+Lists holding only ints that fit in 64 bits, or only floats, are stored as
+a flat numeric array; anything else falls back to one pickle per value.
+"""
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+
+from doubly_linked_list import DoublyLinkedList, Node
+
+MAGIC = b"DLL1"
+HEADER = struct.Struct("<4sc3xQ")
+OFFSET = struct.Struct("<Q")
+# Numeric values decoded per copy of the mapped file during iteration
+ITER_BATCH = 4096
+
+
+def _numeric_array(values):
+    """Return values as array('q') or array('d'), or None if they are not numeric"""
+    kinds = set(map(type, values))
+    try:
+        if kinds <= {int}:
+            return array("q", values)
+        if kinds == {float}:
+            return array("d", values)
+    except OverflowError:
+        pass
+    return None
+
+
+def _little_endian(data):
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data
+
+
+def dump(dll, path):
+    """Write the values of dll (any iterable list) to path"""
+    values = list(dll)
+    data = _numeric_array(values)
+    with open(path, "wb") as f:
+        if data is not None:
+            f.write(HEADER.pack(MAGIC, data.typecode.encode(), len(values)))
+            f.write(_little_endian(data))
+            return
+        blobs = [pickle.dumps(value, pickle.HIGHEST_PROTOCOL) for value in values]
+        offsets = array("Q", [0])
+        total = 0
+        for blob in blobs:
+            total += len(blob)
+            offsets.append(total)
+        f.write(HEADER.pack(MAGIC, b"p", len(values)))
+        f.write(_little_endian(offsets))
+        f.writelines(blobs)
+
+
+def _read_header(buffer):
+    if len(buffer) < HEADER.size:
+        raise ValueError("Not a linked list file.")
+    magic, typecode, count = HEADER.unpack_from(buffer)
+    if magic != MAGIC or typecode not in (b"q", b"d", b"p"):
+        raise ValueError("Not a linked list file.")
+    return typecode.decode(), count
+
+
+def _check_size(buffer, typecode, count):
+    """Raise ValueError if buffer is too short for the count values its header promises"""
+    if typecode == "p":
+        table_end = HEADER.size + (count + 1) * OFFSET.size
+        if len(buffer) >= table_end:
+            last = OFFSET.unpack_from(buffer, table_end - OFFSET.size)[0]
+            if len(buffer) >= table_end + last:
+                return
+    elif len(buffer) >= HEADER.size + count * struct.calcsize("<" + typecode):
+        return
+    raise ValueError(f"Truncated linked list file: the header promises {count} values.")
+
+
+def load(path, cls=DoublyLinkedList):
+    """Read a file written by dump() into a new cls list.
+
+    Files of non-numeric values are unpickled, and unpickling can run
+    arbitrary code: only load files from a trusted source.
+    """
+    with open(path, "rb") as f:
+        buffer = f.read()
+    typecode, count = _read_header(buffer)
+    _check_size(buffer, typecode, count)
+    if typecode != "p":
+        data = array(typecode)
+        data.frombytes(buffer[HEADER.size:HEADER.size + count * data.itemsize])
+        return cls.from_iterable(_little_endian(data))
+    offsets = array("Q")
+    offsets.frombytes(buffer[HEADER.size:HEADER.size + (count + 1) * offsets.itemsize])
+    _little_endian(offsets)
+    view = memoryview(buffer)[HEADER.size + len(offsets) * offsets.itemsize:]
+    return cls.from_iterable(pickle.loads(view[offsets[i]:offsets[i + 1]])
+                             for i in range(count))
+
+
+# ------------------------------
+# Read-only memory-mapped view of a dumped list
+# ------------------------------
+class MappedList:
+    """Read-only list backed by a memory-mapped file written by dump().
+
+    Values are decoded on access, so opening a file of any size is O(1) and
+    ``get``, ``find_kth_from_end`` and ``len`` are O(1); iteration decodes
+    one value at a time. Like ``UnrolledDoublyLinkedList``, ``get`` and
+    ``find_kth_from_end`` return a detached ``Node`` holding the value.
+    Pickled values are unpickled as they are read, as in ``load()``, so
+    only open trusted files.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._typecode, self._length = _read_header(self._mmap)
+            _check_size(self._mmap, self._typecode, self._length)
+        except ValueError:
+            self._mmap.close()
+            raise
+        if self._typecode == "p":
+            self._data = HEADER.size + (self._length + 1) * OFFSET.size
+        else:
+            self._item = struct.Struct("<" + self._typecode)
+            self._data = HEADER.size
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def length(self):
+        return self._length
+
+    def __len__(self):
+        return self._length
+
+    def _value(self, index):
+        if self._typecode != "p":
+            return self._item.unpack_from(self._mmap, self._data + index * self._item.size)[0]
+        start, end = struct.unpack_from("<2Q", self._mmap, HEADER.size + index * OFFSET.size)
+        return pickle.loads(self._mmap[self._data + start:self._data + end])
+
+    def __iter__(self):
+        """Yield the values from head to tail"""
+        if self._typecode != "p":
+            # Decode from copies, not memoryviews: a paused iterator must
+            # not hold an export of the map, or close() raises BufferError
+            size = self._item.size
+            end = self._data + self._length * size
+            for start in range(self._data, end, ITER_BATCH * size):
+                batch = self._mmap[start:min(start + ITER_BATCH * size, end)]
+                for (value,) in self._item.iter_unpack(batch):
+                    yield value
+            return
+        for index in range(self._length):
+            yield self._value(index)
+
+    def get(self, index):
+        """Return a detached Node holding the value at the specified index"""
+        if index < 0 or index >= self._length:
+            return None
+        return Node(self._value(index))
+
+    def find_kth_from_end(self, k):
+        """Find k-th value from the end"""
+        if k <= 0 or k > self._length:
+            return None
+        return Node(self._value(self._length - k))
@@ -0,0 +1,375 @@
+from doubly_linked_list import Node
+
+
+# ------------------------------
+# Immutable AVL tree node, ordered by position
+# ------------------------------
+class _Tree:
+    __slots__ = ("value", "left", "right", "size", "height")
+
+    def __init__(self, left, value, right):
+        self.value = value
+        self.left = left
+        self.right = right
+        self.size = (left.size if left else 0) + (right.size if right else 0) + 1
+        self.height = max(left.height if left else 0, right.height if right else 0) + 1
+
+
+def _size(tree):
+    return tree.size if tree else 0
+
+
+def _height(tree):
+    return tree.height if tree else 0
+
+
+def _balance(left, value, right):
+    """Build a node, rotating once or twice if the heights differ by 2"""
+    lh = _height(left)
+    rh = _height(right)
+    if lh > rh + 1:
+        if _height(left.left) >= _height(left.right):
+            return _Tree(left.left, left.value, _Tree(left.right, value, right))
+        pivot = left.right
+        return _Tree(_Tree(left.left, left.value, pivot.left), pivot.value,
+                     _Tree(pivot.right, value, right))
+    if rh > lh + 1:
+        if _height(right.right) >= _height(right.left):
+            return _Tree(_Tree(left, value, right.left), right.value, right.right)
+        pivot = right.left
+        return _Tree(_Tree(left, value, pivot.left), pivot.value,
+                     _Tree(pivot.right, right.value, right.right))
+    return _Tree(left, value, right)
+
+
+def _join(left, value, right):
+    """Concatenate left, value, right in O(|height difference|)"""
+    lh = _height(left)
+    rh = _height(right)
+    if lh > rh + 1:
+        return _balance(left.left, left.value, _join(left.right, value, right))
+    if rh > lh + 1:
+        return _balance(_join(left, value, right.left), right.value, right.right)
+    return _Tree(left, value, right)
+
+
+def _concat(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    left, last = _remove(left, left.size - 1)
+    return _join(left, last, right)
+
+
+def _split(tree, index):
+    """Return (first index values, the rest) as two trees"""
+    if tree is None:
+        return None, None
+    left_size = _size(tree.left)
+    if index <= left_size:
+        left, right = _split(tree.left, index)
+        return left, _join(right, tree.value, tree.right)
+    left, right = _split(tree.right, index - left_size - 1)
+    return _join(tree.left, tree.value, left), right
+
+
+def _build(values, start, stop):
+    """Build a perfectly balanced tree from values[start:stop] in O(n)"""
+    if start >= stop:
+        return None
+    mid = (start + stop) // 2
+    return _Tree(_build(values, start, mid), values[mid], _build(values, mid + 1, stop))
+
+
+def _insert(tree, index, value):
+    if tree is None:
+        return _Tree(None, value, None)
+    left_size = _size(tree.left)
+    if index <= left_size:
+        return _balance(_insert(tree.left, index, value), tree.value, tree.right)
+    return _balance(tree.left, tree.value, _insert(tree.right, index - left_size - 1, value))
+
+
+def _remove(tree, index):
+    """Return (tree without the value at index, that value)"""
+    left_size = _size(tree.left)
+    if index < left_size:
+        left, value = _remove(tree.left, index)
+        return _balance(left, tree.value, tree.right), value
+    if index > left_size:
+        right, value = _remove(tree.right, index - left_size - 1)
+        return _balance(tree.left, tree.value, right), value
+    if tree.right is None:
+        return tree.left, tree.value
+    right, first = _remove(tree.right, 0)
+    return _balance(tree.left, first, right), tree.value
+
+
+def _set(tree, index, value):
+    left_size = _size(tree.left)
+    if index < left_size:
+        return _Tree(_set(tree.left, index, value), tree.value, tree.right)
+    if index > left_size:
+        return _Tree(tree.left, tree.value, _set(tree.right, index - left_size - 1, value))
+    return _Tree(tree.left, value, tree.right)
+
+
+# ------------------------------
+# Persistent list with O(1) snapshots
+# ------------------------------
+class PersistentList:
+    """Sequence with the read API of DoublyLinkedList and O(1) snapshots.
+
+    Values sit in an immutable balanced (AVL) tree ordered by position,
+    where each tree node records the size of its subtree. An update never
+    changes a tree node: it copies the O(log n) nodes on the path to the
+    change and shares everything else. ``snapshot()`` therefore just
+    hands the current root to a new list in O(1), and later updates to
+    either list never show up in the other.
+
+    ``get``, ``set_value``, ``insert``, ``remove`` and the end operations
+    are O(log n). ``extend``, ``insert_many``, ``remove_range``,
+    ``concat`` and ``split_at`` split and join trees in O(k + log n).
+    Iteration is O(n). Like ``MappedList``, ``get``, the finder methods
+    and the removal methods return a detached ``Node`` holding the value.
+    """
+
+    def __init__(self, iterable=()):
+        values = list(iterable)
+        self._root = _build(values, 0, len(values))
+
+    @classmethod
+    def from_iterable(cls, iterable=()):
+        """Build a new list from iterable in O(n)"""
+        return cls(iterable)
+
+    def snapshot(self):
+        """Return an independent copy in O(1); the two share all tree nodes"""
+        copy = PersistentList.__new__(type(self))
+        copy._root = self._root
+        return copy
+
+    # -------------------------------
+    # Properties: head, tail, length
+    # -------------------------------
+    @property
+    def head(self):
+        return self.get(0)
+
+    @property
+    def tail(self):
+        return self.get(self.length - 1)
+
+    @property
+    def length(self):
+        return _size(self._root)
+
+    def validate(self):
+        """Check sizes, heights and AVL balance in O(n); return True or raise ValueError"""
+        stack = [(self._root, False)]
+        while stack:
+            tree, children_done = stack.pop()
+            if tree is None:
+                continue
+            if not children_done:
+                stack.append((tree, True))
+                stack.append((tree.left, False))
+                stack.append((tree.right, False))
+                continue
+            if tree.size != _size(tree.left) + _size(tree.right) + 1:
+                raise ValueError("Subtree size does not match its children.")
+            if tree.height != max(_height(tree.left), _height(tree.right)) + 1:
+                raise ValueError("Subtree height does not match its children.")
+            if abs(_height(tree.left) - _height(tree.right)) > 1:
+                raise ValueError("Tree is out of balance.")
+        return True
+
+    # -------------------------------
+    # Iteration protocol
+    # -------------------------------
+    def __len__(self):
+        return _size(self._root)
+
+    def _walk(self, forward):
+        stack = []
+        tree = self._root
+        while stack or tree is not None:
+            while tree is not None:
+                stack.append(tree)
+                tree = tree.left if forward else tree.right
+            tree = stack.pop()
+            yield tree.value
+            tree = tree.right if forward else tree.left
+
+    def __iter__(self):
+        """Yield the values from head to tail"""
+        return self._walk(True)
+
+    def __reversed__(self):
+        """Yield the values from tail to head"""
+        return self._walk(False)
+
+    def __contains__(self, value):
+        for item in self:
+            if item is value or item == value:
+                return True
+        return False
+
+    def values_slice(self, start=0, stop=None):
+        """Lazily yield the values at indexes start..stop-1 (slice semantics)"""
+        start, stop, _ = slice(start, stop).indices(self.length)
+        for index in range(start, stop):
+            yield self._value(index)
+
+    # -------------------------------
+    # Read methods
+    # -------------------------------
+    def print_list(self):
+        """Print the linked list in a readable format."""
+        if self._root is None:
+            print("empty list")
+        else:
+            values = [str(value) for value in self]
+            values.append("None")
+            print(" <-> ".join(values))
+
+    def _value(self, index):
+        tree = self._root
+        while True:
+            left_size = _size(tree.left)
+            if index < left_size:
+                tree = tree.left
+            elif index > left_size:
+                index -= left_size + 1
+                tree = tree.right
+            else:
+                return tree.value
+
+    def get(self, index):
+        """Return a detached Node holding the value at the specified index"""
+        if index < 0 or index >= self.length:
+            return None
+        return Node(self._value(index))
+
+    def find_middle_node(self):
+        """Return a detached Node holding the middle value"""
+        return self.get(self.length // 2)
+
+    def find_kth_from_end(self, k):
+        """Find k-th value from the end"""
+        if k <= 0 or k > self.length:
+            return None
+        return self.get(self.length - k)
+
+    def is_palindrome(self):
+        """Check if the list is a palindrome"""
+        for _, left, right in zip(range(self.length // 2), self, reversed(self)):
+            if left != right:
+                return False
+        return True
+
+    def has_loop(self):
+        """A tree has no links to loop through"""
+        return False
+
+    # -------------------------------
+    # Updates in O(log n), never touching shared nodes
+    # -------------------------------
+    def make_empty(self):
+        """Reset the list to empty (snapshots keep their values)"""
+        self._root = None
+
+    def append(self, value):
+        """Add a value at the end"""
+        self._root = _insert(self._root, self.length, value)
+        return True
+
+    def prepend(self, value):
+        """Add a value at the beginning"""
+        self._root = _insert(self._root, 0, value)
+        return True
+
+    def insert(self, index, value):
+        """Insert a value at the specified index"""
+        if index < 0 or index > self.length:
+            return False
+        self._root = _insert(self._root, index, value)
+        return True
+
+    def set_value(self, index, value):
+        """Set the value at the specified index"""
+        if index < 0 or index >= self.length:
+            return False
+        self._root = _set(self._root, index, value)
+        return True
+
+    def remove(self, index):
+        """Remove the value at the specified index and return it in a detached Node"""
+        if index < 0 or index >= self.length:
+            return None
+        self._root, value = _remove(self._root, index)
+        return Node(value)
+
+    def pop(self):
+        """Remove the last value and return it in a detached Node"""
+        return self.remove(self.length - 1)
+
+    def pop_first(self):
+        """Remove the first value and return it in a detached Node"""
+        return self.remove(0)
+
+    # -------------------------------
+    # Batch updates by splitting and joining trees
+    # -------------------------------
+    def extend(self, iterable):
+        """Add every value from iterable at the end"""
+        values = list(iterable)
+        self._root = _concat(self._root, _build(values, 0, len(values)))
+        return True
+
+    def extendleft(self, iterable):
+        """Prepend every value from iterable (the values end up reversed)"""
+        values = list(iterable)
+        values.reverse()
+        self._root = _concat(_build(values, 0, len(values)), self._root)
+        return True
+
+    def insert_many(self, index, iterable):
+        """Insert every value from iterable starting at index"""
+        if index < 0 or index > self.length:
+            return False
+        values = list(iterable)
+        left, right = _split(self._root, index)
+        self._root = _concat(_concat(left, _build(values, 0, len(values))), right)
+        return True
+
+    def remove_range(self, start, stop):
+        """Remove the values at indexes start..stop-1 (slice semantics); return how many"""
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start >= stop:
+            return 0
+        left, rest = _split(self._root, start)
+        _, right = _split(rest, stop - start)
+        self._root = _concat(left, right)
+        return stop - start
+
+    def concat(self, other):
+        """Move all of other's values to the end of this list; other ends up empty"""
+        if other is self:
+            raise ValueError("Cannot concat a list with itself.")
+        self._root = _concat(self._root, other._root)
+        other._root = None
+        return True
+
+    def split_at(self, index):
+        """Split off the values from index onwards into a new list.
+
+        This list keeps the first index values. Returns (self, right), or
+        None if index is out of range.
+        """
+        if index < 0 or index > self.length:
+            return None
+        right = type(self)()
+        self._root, right._root = _split(self._root, index)
+        return self, right
@@ -0,0 +1,629 @@
+from array import array
+
+from doubly_linked_list import Node, _EMPTY
+
+# Slot index meaning "no node" in the next/prev arrays
+NIL = -1
+
+
+# ------------------------------
+# Handle to a live slot of a pooled list
+# ------------------------------
+class PoolNode:
+    """Node-like view of one slot; reads and writes go to the pool arrays."""
+    __slots__ = ("_pool", "_slot")
+
+    def __init__(self, pool, slot):
+        self._pool = pool
+        self._slot = slot
+
+    @property
+    def value(self):
+        return self._pool._values[self._slot]
+
+    @value.setter
+    def value(self, value):
+        self._pool._values[self._slot] = value
+
+    @property
+    def next(self):
+        return self._pool._handle(self._pool._next[self._slot])
+
+    @property
+    def prev(self):
+        return self._pool._handle(self._pool._prev[self._slot])
+
+    def __eq__(self, other):
+        return (isinstance(other, PoolNode)
+                and self._pool is other._pool and self._slot == other._slot)
+
+    def __hash__(self):
+        return hash((id(self._pool), self._slot))
+
+
+# ------------------------------
+# Doubly LinkedList stored in parallel arrays
+# ------------------------------
+class PooledDoublyLinkedList:
+    """Doubly linked list whose nodes live in preallocated parallel arrays.
+
+    Values sit in one Python list and the links in two ``array('q')``
+    columns of slot indices, so an element costs one list slot plus two
+    machine integers instead of a whole ``Node`` object. Slots freed by
+    ``pop``, ``pop_first`` and ``remove`` go on a free-list (threaded
+    through the ``next`` column) and are reused by later inserts.
+
+    ``get``, ``head``, ``tail`` and the finder methods return ``PoolNode``
+    handles onto live slots. Removal methods return a detached ``Node``
+    holding the value, because the slot itself is recycled.
+    """
+
+    def __init__(self, value=_EMPTY, capacity=16):
+        self._reset(capacity)
+        if value is _EMPTY:
+            return
+        slot = self._alloc(value)
+        self._head = slot
+        self._tail = slot
+        self._length = 1
+
+    # -------------------------------
+    # Pool management
+    # -------------------------------
+    def _reset(self, capacity):
+        capacity = max(capacity, 1)
+        self._values = [None] * capacity
+        self._next = array("q", range(1, capacity + 1))
+        self._next[capacity - 1] = NIL
+        self._prev = array("q", [NIL]) * capacity
+        self._free = 0
+        self._head = NIL
+        self._tail = NIL
+        self._length = 0
+
+    def _grow(self):
+        old = len(self._values)
+        new = old * 2
+        self._values.extend([None] * old)
+        self._next.extend(range(old + 1, new + 1))
+        self._next[new - 1] = self._free
+        self._prev.extend(array("q", [NIL]) * old)
+        self._free = old
+
+    def _alloc(self, value):
+        if self._free == NIL:
+            self._grow()
+        slot = self._free
+        self._free = self._next[slot]
+        self._values[slot] = value
+        self._next[slot] = NIL
+        self._prev[slot] = NIL
+        return slot
+
+    def _release(self, slot):
+        self._values[slot] = None
+        self._prev[slot] = NIL
+        self._next[slot] = self._free
+        self._free = slot
+
+    def _alloc_run(self, iterable):
+        """Allocate a detached chain of slots for iterable's values; return (first, last, count).
+
+        If iterable raises, the slots taken so far go back on the free-list
+        and the list is left untouched.
+        """
+        nxt = self._next
+        prv = self._prev
+        first = last = NIL
+        count = 0
+        try:
+            for value in iterable:
+                slot = self._alloc(value)
+                # _grow() extends nxt and prv in place, so the local names stay valid
+                if last == NIL:
+                    first = slot
+                else:
+                    nxt[last] = slot
+                    prv[slot] = last
+                last = slot
+                count += 1
+        except BaseException:
+            while first != NIL:
+                following = nxt[first]
+                self._release(first)
+                first = following
+            raise
+        return first, last, count
+
+    def _link_run(self, before, first, last, count):
+        """Splice the chain first..last of count slots in after before (NIL means at the front)"""
+        nxt = self._next
+        prv = self._prev
+        after = self._head if before == NIL else nxt[before]
+        prv[first] = before
+        if before == NIL:
+            self._head = first
+        else:
+            nxt[before] = first
+        nxt[last] = after
+        if after == NIL:
+            self._tail = last
+        else:
+            prv[after] = last
+        self._length += count
+
+    def _handle(self, slot):
+        return None if slot == NIL else PoolNode(self, slot)
+
+    def _slot_at(self, index):
+        if index < self._length / 2:
+            slot = self._head
+            nxt = self._next
+            for _ in range(index):
+                slot = nxt[slot]
+        else:
+            slot = self._tail
+            prv = self._prev
+            for _ in range(self._length - 1, index, -1):
+                slot = prv[slot]
+        return slot
+
+    @property
+    def capacity(self):
+        return len(self._values)
+
+    # -------------------------------
+    # Properties: head, tail, length
+    # -------------------------------
+    @property
+    def head(self):
+        return self._handle(self._head)
+
+    @property
+    def tail(self):
+        return self._handle(self._tail)
+
+    @property
+    def length(self):
+        return self._length
+
+    def validate(self):
+        """Check links, ends, length and the free-list in O(capacity); return True or raise ValueError"""
+        nxt = self._next
+        prv = self._prev
+        live = set()
+        previous = NIL
+        slot = self._head
+        while slot != NIL:
+            if prv[slot] != previous:
+                raise ValueError(f"Broken prev link after index {len(live) - 1}.")
+            live.add(slot)
+            if len(live) > self._length:
+                raise ValueError("More nodes than length, or a cycle.")
+            previous = slot
+            slot = nxt[slot]
+        if previous != self._tail:
+            raise ValueError("Last slot reached from head is not the tail.")
+        if len(live) != self._length:
+            raise ValueError(f"Length is {self._length} but the list has {len(live)} nodes.")
+        free = 0
+        slot = self._free
+        while slot != NIL:
+            if slot in live:
+                raise ValueError(f"Slot {slot} is both free and in the list.")
+            free += 1
+            if free > len(self._values):
+                raise ValueError("Free-list has a cycle.")
+            slot = nxt[slot]
+        if free + len(live) != len(self._values):
+            raise ValueError("Some slots are neither free nor in the list.")
+        return True
+
+    # -------------------------------
+    # Iteration protocol
+    # -------------------------------
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        """Yield the values from head to tail"""
+        values = self._values
+        nxt = self._next
+        slot = self._head
+        while slot != NIL:
+            yield values[slot]
+            slot = nxt[slot]
+
+    def __reversed__(self):
+        """Yield the values from tail to head"""
+        values = self._values
+        prv = self._prev
+        slot = self._tail
+        while slot != NIL:
+            yield values[slot]
+            slot = prv[slot]
+
+    def __contains__(self, value):
+        for item in self:
+            if item is value or item == value:
+                return True
+        return False
+
+    def iter_nodes(self, reverse=False):
+        """Yield PoolNode handles from head to tail, or tail to head if reverse"""
+        links = self._prev if reverse else self._next
+        slot = self._tail if reverse else self._head
+        while slot != NIL:
+            yield PoolNode(self, slot)
+            slot = links[slot]
+
+    def values_slice(self, start=0, stop=None):
+        """Lazily yield the values at indexes start..stop-1 (slice semantics)"""
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start >= stop:
+            return
+        values = self._values
+        nxt = self._next
+        slot = self._slot_at(start)
+        for _ in range(stop - start):
+            yield values[slot]
+            slot = nxt[slot]
+
+    # -------------------------------
+    # Core methods
+    # -------------------------------
+    def print_list(self):
+        """Print the linked list in a readable format."""
+        if self._head == NIL:
+            print("empty list")
+        else:
+            values = [str(value) for value in self]
+            values.append("None")
+            print(" <-> ".join(values))
+
+    def make_empty(self):
+        """Reset the linked list to empty, keeping the pool capacity"""
+        self._reset(len(self._values))
+
+    def append(self, value):
+        """Add a node at the end"""
+        slot = self._alloc(value)
+        if self._length == 0:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+            self._prev[slot] = self._tail
+        self._tail = slot
+        self._length += 1
+        return True
+
+    def extend(self, iterable):
+        """Add every value from iterable at the end"""
+        first, last, count = self._alloc_run(iterable)
+        if count:
+            self._link_run(self._tail, first, last, count)
+        return True
+
+    def extendleft(self, iterable):
+        """Prepend every value from iterable (the values end up reversed)"""
+        for value in iterable:
+            self.prepend(value)
+        return True
+
+    @classmethod
+    def from_iterable(cls, iterable=(), capacity=16):
+        """Build a new pooled list from iterable"""
+        if hasattr(iterable, "__len__"):
+            capacity = max(capacity, len(iterable))
+        dll = cls(capacity=capacity)
+        dll.extend(iterable)
+        return dll
+
+    def pop(self):
+        """Remove the last node and return it as a detached Node"""
+        if self._length == 0:
+            return None
+        slot = self._tail
+        if self._length == 1:
+            self._head = NIL
+            self._tail = NIL
+        else:
+            self._tail = self._prev[slot]
+            self._next[self._tail] = NIL
+        self._length -= 1
+        node = Node(self._values[slot])
+        self._release(slot)
+        return node
+
+    def prepend(self, value):
+        """Add a node at the beginning"""
+        slot = self._alloc(value)
+        if self._length == 0:
+            self._tail = slot
+        else:
+            self._prev[self._head] = slot
+            self._next[slot] = self._head
+        self._head = slot
+        self._length += 1
+        return True
+
+    def pop_first(self):
+        """Remove the first node and return it as a detached Node"""
+        if self._length == 0:
+            return None
+        slot = self._head
+        if self._length == 1:
+            self._head = NIL
+            self._tail = NIL
+        else:
+            self._head = self._next[slot]
+            self._prev[self._head] = NIL
+        self._length -= 1
+        node = Node(self._values[slot])
+        self._release(slot)
+        return node
+
+    def get(self, index):
+        """Return a handle to the node at the specified index"""
+        if index < 0 or index >= self._length:
+            return None
+        return PoolNode(self, self._slot_at(index))
+
+    def set_value(self, index, value):
+        """Set the value at the specified index"""
+        if index < 0 or index >= self._length:
+            return False
+        self._values[self._slot_at(index)] = value
+        return True
+
+    def insert(self, index, value):
+        """Insert a node at the specified index"""
+        if index < 0 or index > self._length:
+            return False
+        if index == 0:
+            return self.prepend(value)
+        if index == self._length:
+            return self.append(value)
+        before = self._slot_at(index - 1)
+        after = self._next[before]
+        slot = self._alloc(value)
+        self._prev[slot] = before
+        self._next[slot] = after
+        self._next[before] = slot
+        self._prev[after] = slot
+        self._length += 1
+        return True
+
+    def remove(self, index):
+        """Remove the node at the specified index and return it detached"""
+        if index < 0 or index >= self._length:
+            return None
+        if index == 0:
+            return self.pop_first()
+        if index == self._length - 1:
+            return self.pop()
+        slot = self._slot_at(index)
+        before = self._prev[slot]
+        after = self._next[slot]
+        self._next[before] = after
+        self._prev[after] = before
+        self._length -= 1
+        node = Node(self._values[slot])
+        self._release(slot)
+        return node
+
+    def insert_many(self, index, iterable):
+        """Insert every value from iterable starting at index, with one walk"""
+        if index < 0 or index > self._length:
+            return False
+        first, last, count = self._alloc_run(iterable)
+        if count:
+            self._link_run(self._slot_at(index - 1) if index else NIL, first, last, count)
+        return True
+
+    def remove_range(self, start, stop):
+        """Remove the nodes at indexes start..stop-1 (slice semantics); return how many"""
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start >= stop:
+            return 0
+        nxt = self._next
+        prv = self._prev
+        slot = self._slot_at(start)
+        before = prv[slot]
+        for _ in range(stop - start):
+            following = nxt[slot]
+            self._release(slot)
+            slot = following
+        if before == NIL:
+            self._head = slot
+        else:
+            nxt[before] = slot
+        if slot == NIL:
+            self._tail = before
+        else:
+            prv[slot] = before
+        self._length -= stop - start
+        return stop - start
+
+    def is_palindrome(self):
+        """Check if the list is a palindrome"""
+        values = self._values
+        left = self._head
+        right = self._tail
+        for _ in range(self._length // 2):
+            if values[left] != values[right]:
+                return False
+            left = self._next[left]
+            right = self._prev[right]
+        return True
+
+    def reverse(self):
+        """Reverse the entire linked list"""
+        nxt = self._next
+        prv = self._prev
+        slot = self._head
+        while slot != NIL:
+            nxt[slot], prv[slot] = prv[slot], nxt[slot]
+            slot = prv[slot]
+        self._head, self._tail = self._tail, self._head
+
+    def partition_list(self, x):
+        """Partition list around value x"""
+        if self._head == NIL:
+            return
+        values = self._values
+        nxt = self._next
+        prv = self._prev
+        low_head = low_tail = high_head = high_tail = NIL
+        slot = self._head
+        while slot != NIL:
+            following = nxt[slot]
+            if values[slot] < x:
+                if low_tail == NIL:
+                    low_head = slot
+                else:
+                    nxt[low_tail] = slot
+                prv[slot] = low_tail
+                low_tail = slot
+            else:
+                if high_tail == NIL:
+                    high_head = slot
+                else:
+                    nxt[high_tail] = slot
+                prv[slot] = high_tail
+                high_tail = slot
+            slot = following
+        if low_tail == NIL:
+            self._head = high_head
+            self._tail = high_tail
+        elif high_tail == NIL:
+            self._head = low_head
+            self._tail = low_tail
+            nxt[low_tail] = NIL
+        else:
+            nxt[low_tail] = high_head
+            prv[high_head] = low_tail
+            self._head = low_head
+            self._tail = high_tail
+        nxt[self._tail] = NIL
+
+    def sort(self, key=None, reverse=False):
+        """Sort in place, relinking the slots; stable, key and reverse as in sorted()"""
+        if self._length < 2:
+            return
+        values = self._values
+        nxt = self._next
+        prv = self._prev
+        order = []
+        slot = self._head
+        while slot != NIL:
+            order.append(slot)
+            slot = nxt[slot]
+        if key is None:
+            order.sort(key=values.__getitem__, reverse=reverse)
+        else:
+            order.sort(key=lambda slot: key(values[slot]), reverse=reverse)
+        previous = NIL
+        for slot in order:
+            prv[slot] = previous
+            if previous != NIL:
+                nxt[previous] = slot
+            previous = slot
+        nxt[previous] = NIL
+        self._head = order[0]
+        self._tail = previous
+
+    def reverse_between(self, start, end):
+        """Reverse sublist from index start to end (inclusive); end is clamped to the last index"""
+        end = min(end, self._length - 1)
+        if start < 0 or start >= end:
+            return
+        nxt = self._next
+        prv = self._prev
+        first = self._slot_at(start)
+        last = first
+        for _ in range(end - start):
+            last = nxt[last]
+        before = prv[first]
+        after = nxt[last]
+        slot = first
+        while slot != after:
+            nxt[slot], prv[slot] = prv[slot], nxt[slot]
+            slot = prv[slot]
+        prv[last] = before
+        nxt[first] = after
+        if before == NIL:
+            self._head = last
+        else:
+            nxt[before] = last
+        if after == NIL:
+            self._tail = first
+        else:
+            prv[after] = first
+
+    def swap_pairs(self):
+        """Swap adjacent node values in pairs"""
+        values = self._values
+        nxt = self._next
+        slot = self._head
+        while slot != NIL and nxt[slot] != NIL:
+            other = nxt[slot]
+            values[slot], values[other] = values[other], values[slot]
+            slot = nxt[other]
+
+    def find_middle_node(self):
+        """Return a handle to the middle node"""
+        if self._length == 0:
+            return None
+        return PoolNode(self, self._slot_at(self._length // 2))
+
+    def has_loop(self):
+        """Check if the list has a loop"""
+        nxt = self._next
+        slow = fast = self._head
+        while fast != NIL and nxt[fast] != NIL:
+            slow = nxt[slow]
+            fast = nxt[nxt[fast]]
+            if slow == fast:
+                return True
+        return False
+
+    def find_kth_from_end(self, k):
+        """Find k-th node from the end"""
+        if k <= 0 or k > self._length:
+            return None
+        return PoolNode(self, self._slot_at(self._length - k))
+
+    def remove_duplicates(self):
+        """Remove duplicate values in the list"""
+        seen = set()
+        values = self._values
+        nxt = self._next
+        prv = self._prev
+        slot = self._head
+        while slot != NIL:
+            following = nxt[slot]
+            value = values[slot]
+            if value in seen:
+                before = prv[slot]
+                nxt[before] = following
+                if following == NIL:
+                    self._tail = before
+                else:
+                    prv[following] = before
+                self._length -= 1
+                self._release(slot)
+            else:
+                seen.add(value)
+            slot = following
+
+    def binary_to_decimal(self):
+        """Convert binary representation to decimal"""
+        decimal = 0
+        values = self._values
+        nxt = self._next
+        slot = self._head
+        while slot != NIL:
+            decimal = decimal * 2 + values[slot]
+            slot = nxt[slot]
+        return decimal
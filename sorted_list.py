@@ -0,0 +1,192 @@
+from doubly_linked_list import Cursor, DoublyLinkedList, Node, _merge_chains
+from indexed_list import IndexedDoublyLinkedList
+
+
+class OrderError(TypeError):
+    """Raised by SortedDoublyLinkedList methods that would break the sort order"""
+
+
+def _breaks_order(name):
+    def method(self, *args, **kwargs):
+        raise OrderError(
+            f"{name}() would break the sort order of a SortedDoublyLinkedList; "
+            "use insert_sorted()")
+    method.__name__ = name
+    return method
+
+
+# ------------------------------
+# Cursor that can move and remove but not place values
+# ------------------------------
+class _SortedCursor(Cursor):
+    __slots__ = ()
+
+    value = property(Cursor.value.fget, _breaks_order("value"))
+    insert_after = _breaks_order("insert_after")
+    insert_before = _breaks_order("insert_before")
+
+
+# ------------------------------
+# Doubly LinkedList kept in ascending order
+# ------------------------------
+class SortedDoublyLinkedList(IndexedDoublyLinkedList):
+    """IndexedDoublyLinkedList whose values are always in ascending order.
+
+    The skip-list lanes are searched by value as well as by position, so
+    ``bisect_left``, ``bisect_right``, ``insert_sorted`` and ``in`` run in
+    O(log n) expected time. A value that belongs at the end (the common
+    case for timelines) is appended in O(1). ``irange(lo, hi)`` lazily
+    yields a range of values and ``merge(other)`` takes the nodes of
+    another sorted list in O(n + m).
+
+    Methods that place values at a caller-chosen position or reorder the
+    list (``append``, ``insert``, ``set_value``, ``reverse``, ...) raise
+    OrderError, a TypeError, and so do a cursor's inserts and value
+    setter. Removals, ``get`` and the finder methods work as
+    in the base class.
+    """
+
+    def validate(self):
+        """Also check that the values are in ascending order"""
+        super().validate()
+        node = self.head
+        index = 0
+        while node is not None and node.next is not None:
+            if node.next.value < node.value:
+                raise ValueError(f"Values out of order after index {index}.")
+            node = node.next
+            index += 1
+        return True
+
+    # -------------------------------
+    # Searching by value
+    # -------------------------------
+    def _bisect(self, value, right):
+        """Return (index, node) of the first node whose value is > value
+        (right) or >= value (left); node is None past the end."""
+        self._ensure_index()
+        lane = self._header
+        position = -1
+        for level in range(self._level - 1, -1, -1):
+            following = lane.next[level]
+            if right:
+                while following is not None and not value < following.node.value:
+                    position += lane.span[level]
+                    lane = following
+                    following = lane.next[level]
+            else:
+                while following is not None and following.node.value < value:
+                    position += lane.span[level]
+                    lane = following
+                    following = lane.next[level]
+        node = self.head if lane is self._header else lane.node.next
+        position += 1
+        if right:
+            while node is not None and not value < node.value:
+                node = node.next
+                position += 1
+        else:
+            while node is not None and node.value < value:
+                node = node.next
+                position += 1
+        return position, node
+
+    def bisect_left(self, value):
+        """Return the index of the first value >= value"""
+        return self._bisect(value, False)[0]
+
+    def bisect_right(self, value):
+        """Return the index just past the last value <= value"""
+        return self._bisect(value, True)[0]
+
+    def __contains__(self, value):
+        node = self._bisect(value, False)[1]
+        return node is not None and node.value == value
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        """Lazily yield the values between lo and hi (None means unbounded)"""
+        if lo is None:
+            node = self.head
+        else:
+            node = self._bisect(lo, not inclusive[0])[1]
+        while node is not None:
+            if hi is not None and (hi < node.value or not inclusive[1] and not node.value < hi):
+                return
+            yield node.value
+            node = node.next
+
+    # -------------------------------
+    # Adding values in order
+    # -------------------------------
+    def insert_sorted(self, value):
+        """Insert value after any equal values, keeping the list sorted"""
+        tail = self.tail
+        if tail is None or not value < tail.value:
+            return IndexedDoublyLinkedList.append(self, value)
+        index = self.bisect_right(value)
+        return IndexedDoublyLinkedList.insert(self, index, value)
+
+    def extend(self, iterable):
+        """Add every value from iterable, keeping the list sorted"""
+        values = sorted(iterable)
+        if not values:
+            return True
+        if self.length == 0 or not values[0] < self.tail.value:
+            return IndexedDoublyLinkedList.extend(self, values)
+        return self.merge(DoublyLinkedList.from_iterable(values))
+
+    def cursor(self, index=0):
+        """Return a cursor that can move and remove, or None if index is out of range"""
+        node = self.get(index)
+        if node is None:
+            return None
+        return _SortedCursor(self, node, index)
+
+    def merge(self, other):
+        """Move the nodes of another sorted list into this one in O(n + m).
+
+        Equal values keep this list's nodes first. other ends up empty.
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list with itself.")
+        if other.length == 0:
+            return True
+        node = other.head
+        while node.next is not None:
+            if node.next.value < node.value:
+                raise OrderError("merge() needs the other list in ascending order.")
+            node = node.next
+        count = self.length + other.length
+        # Both chains are relinked in place, so snapshots take their copies now
+        self._detach_views()
+        other._detach_views()
+        left = self.head
+        right = other.head
+        other.make_empty()
+        for chain in (left, right):
+            node = chain
+            while node is not None:
+                node.prev = node.value
+                node = node.next
+        out = Node(None)
+        try:
+            _merge_chains(out, left, right, False)
+        finally:
+            previous = None
+            node = out.next
+            while node is not None:
+                node.prev = previous
+                previous = node
+                node = node.next
+            self.head = out.next
+            self.tail = previous
+            self.length = count
+        return True
+
+
+for _name in ("append", "prepend", "insert", "insert_many", "insert_after",
+              "insert_before", "set_value", "extendleft", "concat",
+              "splice", "move_to_front", "move_to_back", "reverse",
+              "partition_list", "reverse_between", "swap_pairs", "sort"):
+    setattr(SortedDoublyLinkedList, _name, _breaks_order(_name))
+del _name
@@ -0,0 +1,456 @@
+import bisect
+import pickle
+import tempfile
+
+from caches import LRUCache
+from doubly_linked_list import Node
+
+# Default values per chunk and chunks kept in memory
+CHUNK_SIZE = 4096
+RESIDENT_CHUNKS = 8
+
+
+# ------------------------------
+# Chunk of values, in memory or paged out to the spill file
+# ------------------------------
+class _Chunk:
+    __slots__ = ("values", "count", "next", "prev", "offset", "nbytes", "slot", "dirty")
+
+    def __init__(self):
+        self.values = []       # None while paged out
+        self.count = 0
+        self.next = None
+        self.prev = None
+        self.offset = None     # where the chunk's slot starts in the file
+        self.nbytes = 0        # size of the pickled values in the slot
+        self.slot = 0          # bytes reserved for the chunk in the file
+        self.dirty = True      # values differ from the copy in the file
+
+
+# ------------------------------
+# Doubly LinkedList that spills cold chunks to disk
+# ------------------------------
+class SpillingDoublyLinkedList:
+    """Doubly linked list of fixed-size chunks, most of them kept on disk.
+
+    At most ``resident_chunks`` chunks hold their values in memory; the
+    least recently used one is pickled to a spill file (a temporary file
+    unless ``path`` is given) when another has to be paged in. A chunk whose
+    values did not change since it was last written is dropped without
+    rewriting it. Iteration pages in the next ``readahead`` chunks ahead of
+    the one being read.
+
+    ``reverse()`` is O(1): it flips which physical end is the front, so
+    ``append`` and ``pop_first`` keep their cost after a reverse. ``get`` and
+    the removal methods return a detached ``Node`` holding the value.
+
+    File space is reused: the slots of emptied chunks, and of chunks that
+    outgrew their slot and moved, go on a free list. A page-out takes the
+    smallest free slot that fits. Free slots that touch are merged, and
+    free space at the end of the file is truncated away, so a list of
+    steady size keeps a file of steady size.
+
+    ``stats`` reports page-ins, page-outs (chunks written), drops (clean
+    chunks released without a write), readahead page-ins, and the spill
+    file's size and free bytes.
+    """
+
+    def __init__(self, path=None, chunk_size=CHUNK_SIZE,
+                 resident_chunks=RESIDENT_CHUNKS, readahead=2):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive.")
+        if readahead < 0 or resident_chunks <= readahead:
+            raise ValueError("Resident chunks must exceed the readahead.")
+        self._chunk_size = chunk_size
+        self._readahead = readahead
+        if path is None:
+            self._file = tempfile.TemporaryFile()
+        else:
+            self._file = open(path, "w+b")
+        self._file_end = 0
+        # Free slots: (size, offset) pairs sorted for best fit, plus maps
+        # from start and end offsets to find neighbours to merge with
+        self._free = []
+        self._free_starts = {}
+        self._free_ends = {}
+        self._resident = LRUCache(resident_chunks, on_evict=self._page_out)
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._reversed = False
+        self._stats = {"page_ins": 0, "page_outs": 0, "drops": 0, "readahead": 0}
+
+    def close(self):
+        """Close the spill file; the list cannot be used afterwards"""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # -------------------------------
+    # Properties: length, stats
+    # -------------------------------
+    @property
+    def length(self):
+        return self._length
+
+    @property
+    def stats(self):
+        stats = dict(self._stats)
+        stats["resident_chunks"] = len(self._resident)
+        stats["chunks"] = self._chunk_count()
+        stats["file_bytes"] = self._file_end
+        stats["free_bytes"] = sum(size for size, _ in self._free)
+        return stats
+
+    def validate(self):
+        """Check chunk links, counts and file slots without paging in; return True or raise ValueError"""
+        if self._head is not None and self._head.prev is not None:
+            raise ValueError("Head chunk has a prev link.")
+        total = 0
+        previous = None
+        chunk = self._head
+        while chunk is not None:
+            if chunk.prev is not previous:
+                raise ValueError("Broken prev link between chunks.")
+            if not 0 < chunk.count <= self._chunk_size:
+                raise ValueError(f"Chunk holds {chunk.count} values.")
+            if chunk.values is not None:
+                if len(chunk.values) != chunk.count:
+                    raise ValueError("Resident chunk's values do not match its count.")
+                if chunk not in self._resident:
+                    raise ValueError("Resident chunk is missing from the LRU.")
+            elif (chunk.offset is None or chunk.nbytes > chunk.slot
+                  or chunk.offset + chunk.slot > self._file_end):
+                raise ValueError("Paged-out chunk has no valid slot in the spill file.")
+            total += chunk.count
+            if total > self._length:
+                raise ValueError("More values than length, or a cycle.")
+            previous = chunk
+            chunk = chunk.next
+        if previous is not self._tail:
+            raise ValueError("Last chunk reached from head is not the tail.")
+        if total != self._length:
+            raise ValueError(f"Length is {self._length} but the chunks hold {total}.")
+        self._validate_slots()
+        return True
+
+    def _validate_slots(self):
+        """Check that chunk slots and free slots tile no byte twice and fit the file"""
+        if sorted((size, offset) for offset, size in self._free_starts.items()) != self._free:
+            raise ValueError("Free list is out of step with its start offsets.")
+        if {offset + size: offset for size, offset in self._free} != self._free_ends:
+            raise ValueError("Free list is out of step with its end offsets.")
+        spans = [(offset, size, True) for size, offset in self._free]
+        chunk = self._head
+        while chunk is not None:
+            if chunk.offset is not None:
+                spans.append((chunk.offset, chunk.slot, False))
+            chunk = chunk.next
+        spans.sort()
+        end = 0
+        free_before = False
+        for offset, size, free in spans:
+            if size <= 0 or offset < end:
+                raise ValueError(f"Spill file slot at {offset} overlaps another.")
+            if free and free_before and offset == end:
+                raise ValueError(f"Free slot at {offset} was not merged with its neighbour.")
+            end = offset + size
+            free_before = free
+        if end > self._file_end or free_before:
+            raise ValueError("Spill file slots do not end at the end of the file.")
+
+    def _chunk_count(self):
+        count = 0
+        chunk = self._head
+        while chunk:
+            count += 1
+            chunk = chunk.next
+        return count
+
+    # -------------------------------
+    # Paging
+    # -------------------------------
+    def _take_slot(self, size):
+        """Return the offset of size bytes of file space, reusing free space first"""
+        index = bisect.bisect_left(self._free, (size, -1))
+        if index == len(self._free):
+            offset = self._file_end
+            self._file_end += size
+            return offset
+        slot, offset = self._free.pop(index)
+        del self._free_starts[offset]
+        del self._free_ends[offset + slot]
+        if slot > size:
+            self._add_free(offset + size, slot - size)
+        return offset
+
+    def _add_free(self, offset, size):
+        bisect.insort(self._free, (size, offset))
+        self._free_starts[offset] = size
+        self._free_ends[offset + size] = offset
+
+    def _remove_free(self, offset):
+        size = self._free_starts.pop(offset)
+        del self._free_ends[offset + size]
+        del self._free[bisect.bisect_left(self._free, (size, offset))]
+        return size
+
+    def _release_slot(self, chunk):
+        """Put chunk's file slot on the free list, merged with free neighbours"""
+        if chunk.offset is None:
+            return
+        offset, size = chunk.offset, chunk.slot
+        chunk.offset = None
+        chunk.slot = chunk.nbytes = 0
+        if offset in self._free_ends:
+            start = self._free_ends[offset]
+            size += self._remove_free(start)
+            offset = start
+        if offset + size in self._free_starts:
+            size += self._remove_free(offset + size)
+        if offset + size == self._file_end:
+            self._file_end = offset
+            self._file.truncate(offset)
+        else:
+            self._add_free(offset, size)
+
+    def _page_out(self, chunk, _):
+        if chunk.dirty:
+            data = pickle.dumps(chunk.values, pickle.HIGHEST_PROTOCOL)
+            if chunk.offset is None or len(data) > chunk.slot:
+                self._release_slot(chunk)
+                chunk.offset = self._take_slot(len(data))
+                chunk.slot = len(data)
+            self._file.seek(chunk.offset)
+            self._file.write(data)
+            chunk.nbytes = len(data)
+            chunk.dirty = False
+            self._stats["page_outs"] += 1
+        else:
+            self._stats["drops"] += 1
+        chunk.values = None
+
+    def _load(self, chunk):
+        """Return chunk's values, paging them in if needed"""
+        if chunk.values is None:
+            self._file.seek(chunk.offset)
+            chunk.values = pickle.loads(self._file.read(chunk.nbytes))
+            self._stats["page_ins"] += 1
+            self._resident.put(chunk, None)
+        else:
+            self._resident.get(chunk)
+        return chunk.values
+
+    def _edit(self, chunk):
+        """Return chunk's values for changing them"""
+        values = self._load(chunk)
+        chunk.dirty = True
+        return values
+
+    def _new_chunk(self, before):
+        """Link an empty resident chunk after before (None means at the front)"""
+        chunk = _Chunk()
+        after = self._head if before is None else before.next
+        chunk.prev = before
+        chunk.next = after
+        if before is None:
+            self._head = chunk
+        else:
+            before.next = chunk
+        if after is None:
+            self._tail = chunk
+        else:
+            after.prev = chunk
+        self._resident.put(chunk, None)
+        return chunk
+
+    def _drop_chunk(self, chunk):
+        if chunk.prev is None:
+            self._head = chunk.next
+        else:
+            chunk.prev.next = chunk.next
+        if chunk.next is None:
+            self._tail = chunk.prev
+        else:
+            chunk.next.prev = chunk.prev
+        self._resident.remove(chunk)
+        self._release_slot(chunk)
+
+    # -------------------------------
+    # Physical ends (the logical front is the tail after reverse())
+    # -------------------------------
+    def _push_back(self, value):
+        chunk = self._tail
+        if chunk is None or chunk.count >= self._chunk_size:
+            chunk = self._new_chunk(chunk)
+        self._edit(chunk).append(value)
+        chunk.count += 1
+        self._length += 1
+
+    def _push_front(self, value):
+        chunk = self._head
+        if chunk is None or chunk.count >= self._chunk_size:
+            chunk = self._new_chunk(None)
+        self._edit(chunk).insert(0, value)
+        chunk.count += 1
+        self._length += 1
+
+    def _pop_back(self):
+        chunk = self._tail
+        value = self._edit(chunk).pop()
+        self._removed_from(chunk)
+        return value
+
+    def _pop_front(self):
+        chunk = self._head
+        value = self._edit(chunk).pop(0)
+        self._removed_from(chunk)
+        return value
+
+    def _removed_from(self, chunk):
+        chunk.count -= 1
+        self._length -= 1
+        if chunk.count == 0:
+            self._drop_chunk(chunk)
+
+    def _locate(self, index):
+        """Return (chunk, offset) for a physical index"""
+        if index < self._length / 2:
+            chunk = self._head
+            while index >= chunk.count:
+                index -= chunk.count
+                chunk = chunk.next
+            return chunk, index
+        index = self._length - 1 - index
+        chunk = self._tail
+        while index >= chunk.count:
+            index -= chunk.count
+            chunk = chunk.prev
+        return chunk, chunk.count - 1 - index
+
+    def _physical(self, index):
+        return self._length - 1 - index if self._reversed else index
+
+    # -------------------------------
+    # Iteration with readahead
+    # -------------------------------
+    def __len__(self):
+        return self._length
+
+    def _chunks(self, forward):
+        """Yield a copy of each chunk's values in order, paging in the next few ahead"""
+        chunk = self._head if forward else self._tail
+        while chunk is not None:
+            values = self._load(chunk)[:]
+            ahead = chunk.next if forward else chunk.prev
+            for _ in range(self._readahead):
+                if ahead is None:
+                    break
+                if ahead.values is None:
+                    self._stats["readahead"] += 1
+                self._load(ahead)
+                ahead = ahead.next if forward else ahead.prev
+            yield values
+            chunk = chunk.next if forward else chunk.prev
+
+    def __iter__(self):
+        """Yield the values from front to back"""
+        forward = not self._reversed
+        for values in self._chunks(forward):
+            yield from (values if forward else reversed(values))
+
+    def __reversed__(self):
+        """Yield the values from back to front"""
+        forward = self._reversed
+        for values in self._chunks(forward):
+            yield from (values if forward else reversed(values))
+
+    # -------------------------------
+    # Core methods
+    # -------------------------------
+    def print_list(self):
+        """Print the linked list in a readable format."""
+        if self._length == 0:
+            print("empty list")
+        else:
+            values = [str(value) for value in self]
+            values.append("None")
+            print(" <-> ".join(values))
+
+    def make_empty(self):
+        """Reset the linked list to empty and truncate the spill file"""
+        chunk = self._head
+        while chunk:
+            self._resident.remove(chunk)
+            chunk = chunk.next
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._file.truncate(0)
+        self._file_end = 0
+        self._free = []
+        self._free_starts = {}
+        self._free_ends = {}
+
+    def append(self, value):
+        """Add a value at the end"""
+        if self._reversed:
+            self._push_front(value)
+        else:
+            self._push_back(value)
+        return True
+
+    def extend(self, iterable):
+        """Add every value from iterable at the end"""
+        for value in iterable:
+            self.append(value)
+        return True
+
+    def prepend(self, value):
+        """Add a value at the beginning"""
+        if self._reversed:
+            self._push_back(value)
+        else:
+            self._push_front(value)
+        return True
+
+    def pop(self):
+        """Remove the last value and return it in a detached Node"""
+        if self._length == 0:
+            return None
+        return Node(self._pop_front() if self._reversed else self._pop_back())
+
+    def pop_first(self):
+        """Remove the first value and return it in a detached Node"""
+        if self._length == 0:
+            return None
+        return Node(self._pop_back() if self._reversed else self._pop_front())
+
+    def get(self, index):
+        """Return a detached Node holding the value at the specified index"""
+        if index < 0 or index >= self._length:
+            return None
+        chunk, offset = self._locate(self._physical(index))
+        return Node(self._load(chunk)[offset])
+
+    def set_value(self, index, value):
+        """Set the value at the specified index"""
+        if index < 0 or index >= self._length:
+            return False
+        chunk, offset = self._locate(self._physical(index))
+        self._edit(chunk)[offset] = value
+        return True
+
+    def reverse(self):
+        """Reverse the entire linked list in O(1)"""
+        self._reversed = not self._reversed
+
+    def find_kth_from_end(self, k):
+        """Find k-th value from the end"""
+        if k <= 0 or k > self._length:
+            return None
+        return self.get(self._length - k)
@@ -1,5 +1,34 @@
-from doubly_linked_list import DoublyLinkedList
+import asyncio
+import multiprocessing
+import operator
+import os
+import tempfile
+import threading
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+    from numeric_list import NumericDoublyLinkedList
+except ImportError:  # NumPy is optional
+    np = None
+
+from async_list import AsyncDoublyLinkedList
+from caches import LFUCache, LRUCache
+from concurrent_list import ConcurrentDoublyLinkedList
+from doubly_linked_list import DoublyLinkedList, set_debug
+import fuzz
+from hashed_list import HashedDoublyLinkedList
 from helpers import print_title, check, check_list
+from indexed_list import IndexedDoublyLinkedList
+from intrusive_list import IntrusiveDoublyLinkedList, IntrusiveNode
+from lazy_reverse_list import LazyReverseDoublyLinkedList
+from persistence import MappedList
+from persistent_list import PersistentList
+from pooled_list import PooledDoublyLinkedList
+from sorted_list import OrderError, SortedDoublyLinkedList
+from spilling_list import SpillingDoublyLinkedList
+from unrolled_list import UnrolledDoublyLinkedList
 
 # ------------------------------
 # Example usage and tests
@@ -258,4 +287,927 @@ dll.append(1)
 dll.append(0)
 dll.print_list()
 decimal = dll.binary_to_decimal()
-check(6, decimal, "Binary 110 to Decimal")
\ No newline at end of file
+check(6, decimal, "Binary 110 to Decimal")
+# --------------------------------------------------
+
+print_title("SLOTTED NODE TEST")
+dll = DoublyLinkedList(1)
+check(False, hasattr(dll.head, "__dict__"), "Node has no per-instance __dict__")
+
+# --------------------------------------------------
+
+print_title("POOLED LIST TEST")
+pdll = PooledDoublyLinkedList(1, capacity=2)
+pdll.append(2)
+pdll.append(3)
+pdll.prepend(0)
+pdll.insert(2, 99)
+pdll.print_list()
+check_list(pdll, [0, 1, 99, 2, 3], "Pooled list after append/prepend/insert")
+check(8, pdll.capacity, "Pool grew by doubling")
+
+removed = pdll.remove(2)
+check(99, removed.value, "Removed value is returned detached")
+check(0, pdll.pop_first().value, "Pooled pop_first")
+check(3, pdll.pop().value, "Pooled pop")
+check_list(pdll, [1, 2], "Pooled list after removals")
+
+pdll.append(4)
+pdll.append(5)
+check(8, pdll.capacity, "Freed slots are recycled before growing")
+pdll.get(0).value = 10
+check_list(pdll, [10, 2, 4, 5], "Write through a PoolNode handle")
+
+pdll.reverse()
+check_list(pdll, [5, 4, 2, 10], "Pooled reverse")
+pdll.reverse_between(1, 3)
+check_list(pdll, [5, 10, 2, 4], "Pooled reverse_between")
+check(4, pdll.tail.value, "Pooled tail after reverse_between")
+opdll = PooledDoublyLinkedList.from_iterable([0, 1, 2, 3])
+opdll.reverse_between(1, 10)
+check_list(opdll, [0, 3, 2, 1], "Pooled reverse_between clamps an end past the tail")
+check((1, True), (opdll.tail.value, opdll.validate()), "Pooled tail after a clamped reverse_between")
+pdll.partition_list(5)
+check_list(pdll, [2, 4, 5, 10], "Pooled partition_list")
+pdll.swap_pairs()
+check_list(pdll, [4, 2, 10, 5], "Pooled swap_pairs")
+check(10, pdll.find_middle_node().value, "Pooled find_middle_node")
+check(10, pdll.find_kth_from_end(2).value, "Pooled find_kth_from_end")
+
+pdll = PooledDoublyLinkedList(1)
+for value in [2, 1, 3, 2]:
+    pdll.append(value)
+pdll.remove_duplicates()
+check_list(pdll, [1, 2, 3], "Pooled remove_duplicates")
+check(3, pdll.length, "Pooled length after remove_duplicates")
+
+# --------------------------------------------------
+
+print_title("EMPTY CONSTRUCTOR & EXTEND TEST")
+dll = DoublyLinkedList()
+check(0, dll.length, "Empty constructor length")
+check(None, dll.head, "Empty constructor head")
+dll.extend([1, 2, 3])
+dll.extend([])
+dll.extend(iter([4, 5]))
+check_list(dll, [1, 2, 3, 4, 5], "List after extend")
+check(5, dll.length, "Length after extend")
+check(4, dll.tail.prev.value, "Tail prev link after extend")
+
+dll.extendleft([0, -1])
+check_list(dll, [-1, 0, 1, 2, 3, 4, 5], "List after extendleft")
+check(None, dll.head.prev, "Head prev after extendleft")
+
+dll = DoublyLinkedList.from_iterable(range(4))
+check_list(dll, [0, 1, 2, 3], "from_iterable")
+check(3, dll.tail.value, "from_iterable tail")
+check(0, DoublyLinkedList.from_iterable().length, "from_iterable() is empty")
+check(None, DoublyLinkedList(None).head.value, "None can still be stored")
+
+pdll = PooledDoublyLinkedList.from_iterable(range(3))
+pdll.extendleft([10, 11])
+check_list(pdll, [11, 10, 0, 1, 2], "Pooled from_iterable and extendleft")
+
+def values_then_error():
+    yield from range(40)
+    raise KeyError("iterable failed")
+
+for method, args in (("extend", ()), ("insert_many", (1,))):
+    pdll = PooledDoublyLinkedList.from_iterable(range(3), capacity=4)
+    try:
+        getattr(pdll, method)(*args, values_then_error())
+        check("KeyError", "no error", f"Pooled {method} passes on the iterable's error")
+    except KeyError:
+        check_list(pdll, [0, 1, 2], f"Pooled {method} leaves the list unchanged when the iterable fails")
+        check(True, pdll.validate(), f"Pooled {method} returns the taken slots to the free-list")
+
+# --------------------------------------------------
+
+print_title("BULK LOAD SPEED TEST")
+n = 1_000_000
+
+def load_with_append():
+    dll = DoublyLinkedList()
+    for value in range(n):
+        dll.append(value)
+
+def load_with_from_iterable():
+    DoublyLinkedList.from_iterable(range(n))
+
+# gc.enable() in setup: timeit turns the collector off by default
+append_time = min(timeit.repeat(load_with_append, "gc.enable()", number=1, repeat=2))
+bulk_time = min(timeit.repeat(load_with_from_iterable, "gc.enable()", number=1, repeat=2))
+print(f"append loop: {append_time:.3f}s, from_iterable: {bulk_time:.3f}s")
+check(True, append_time / bulk_time >= 2, "from_iterable at least 2x faster")
+
+# --------------------------------------------------
+
+print_title("TAIL AFTER PARTITION & REVERSE BETWEEN TEST")
+dll = DoublyLinkedList.from_iterable([1, 2, 3])
+dll.partition_list(5)
+check(3, dll.tail.value, "Tail when every value is below x")
+dll.reverse_between(1, 2)
+check(2, dll.tail.value, "Tail when the reversed range ends the list")
+
+# --------------------------------------------------
+
+print_title("INDEXED LIST TEST")
+idll = IndexedDoublyLinkedList.from_iterable(range(1000))
+check(0, idll.get(0).value, "Indexed get first")
+check(537, idll.get(537).value, "Indexed get middle")
+check(999, idll.get(999).value, "Indexed get last")
+check(None, idll.get(1000), "Indexed get out of range")
+
+idll.insert(500, "x")
+idll.prepend("first")
+idll.set_value(10, "ten")
+check("x", idll.get(501).value, "Indexed get after insert")
+check("ten", idll.get(10).value, "Indexed set_value")
+check(499, idll.remove(500).value, "Indexed remove returns node")
+check("x", idll.get(500).value, "Indexed get after remove")
+check("first", idll.pop_first().value, "Indexed pop_first")
+check(999, idll.pop().value, "Indexed pop")
+check(999, idll.length, "Indexed length")
+
+idll.reverse()
+check(998, idll.get(0).value, "Indexed get after reverse")
+check(0, idll.get(998).value, "Indexed get last after reverse")
+
+idll = IndexedDoublyLinkedList.from_iterable([3, 8, 5, 10, 2, 1])
+idll.partition_list(5)
+check([3, 2, 1, 8, 5, 10], [idll.get(i).value for i in range(6)], "Indexed get after partition_list")
+idll.reverse_between(1, 4)
+check([3, 5, 8, 1, 2, 10], [idll.get(i).value for i in range(6)], "Indexed get after reverse_between")
+idll.append(7)
+check(7, idll.get(6).value, "Indexed append after rebuild")
+
+# --------------------------------------------------
+
+print_title("FINGER GET TEST")
+dll = DoublyLinkedList.from_iterable(range(10))
+check([3, 4, 6, 5, 9, 0], [dll.get(i).value for i in [3, 4, 6, 5, 9, 0]], "Mixed-order get")
+dll.insert(5, "x")
+check("x", dll.get(5).value, "get after insert")
+check(5, dll.get(6).value, "get next to the inserted node")
+dll.remove(5)
+check(5, dll.get(5).value, "get after remove")
+dll.reverse()
+check(4, dll.get(5).value, "get after reverse")
+
+n = 20_000
+dll = DoublyLinkedList.from_iterable(range(n))
+start = timeit.default_timer()
+total = 0
+for i in range(n):
+    total += dll.get(i).value
+elapsed = timeit.default_timer() - start
+print(f"sequential get over {n:,} nodes: {elapsed:.3f}s")
+check(n * (n - 1) // 2, total, "Sequential get values")
+check(True, elapsed < 1.0, "Sequential get is O(1) per call")
+
+# --------------------------------------------------
+
+print_title("CURSOR TEST")
+dll = DoublyLinkedList.from_iterable([1, 2, 3])
+cur = dll.cursor(1)
+check(2, cur.value, "Cursor starts on its index")
+cur.insert_after(25)
+cur.insert_before(15)
+check_list(dll, [1, 15, 2, 25, 3], "List after cursor inserts")
+check(2, cur.index, "Cursor index follows insert_before")
+check(True, cur.move_next(), "move_next inside the list")
+check(25, cur.remove_here().value, "remove_here returns the node")
+check(3, cur.value, "Cursor moves to the next node after removal")
+check(False, cur.move_next(), "move_next at the end")
+cur.remove_here()
+check(2, cur.value, "Cursor moves back after removing the tail")
+check(2, dll.tail.value, "Tail after removing through the cursor")
+check_list(dll, [1, 15, 2], "List after cursor removals")
+
+dll.append(4)
+try:
+    cur.move_next()
+    stale = False
+except RuntimeError:
+    stale = True
+check(True, stale, "Cursor is invalidated by changes elsewhere")
+check(None, dll.cursor(10), "Cursor out of range")
+
+# --------------------------------------------------
+
+print_title("UNROLLED LIST TEST")
+udll = UnrolledDoublyLinkedList(1, capacity=4)
+udll.extend([2, 3, 4, 5, 6])
+udll.prepend(0)
+udll.insert(3, 99)
+udll.print_list()
+check([0, 1, 2, 99, 3, 4, 5, 6], [udll.get(i).value for i in range(udll.length)],
+      "Unrolled list after extend/prepend/insert")
+check(99, udll.remove(3).value, "Unrolled remove returns the value")
+check(6, udll.pop().value, "Unrolled pop")
+check(0, udll.pop_first().value, "Unrolled pop_first")
+check(5, udll.length, "Unrolled length")
+
+udll.reverse()
+check([5, 4, 3, 2, 1], [udll.get(i).value for i in range(5)], "Unrolled reverse")
+udll.reverse_between(1, 3)
+check([5, 2, 3, 4, 1], [udll.get(i).value for i in range(5)], "Unrolled reverse_between")
+udll.swap_pairs()
+check([2, 5, 4, 3, 1], [udll.get(i).value for i in range(5)], "Unrolled swap_pairs")
+udll.partition_list(4)
+check([2, 3, 1, 5, 4], [udll.get(i).value for i in range(5)], "Unrolled partition_list")
+check(1, udll.find_middle_node().value, "Unrolled find_middle_node")
+check(5, udll.find_kth_from_end(2).value, "Unrolled find_kth_from_end")
+
+udll = UnrolledDoublyLinkedList.from_iterable([1, 2, 1, 3, 2], capacity=2)
+udll.remove_duplicates()
+check([1, 2, 3], [udll.get(i).value for i in range(udll.length)], "Unrolled remove_duplicates")
+check(True, UnrolledDoublyLinkedList.from_iterable([1, 2, 1]).is_palindrome(), "Unrolled is_palindrome")
+check(6, UnrolledDoublyLinkedList.from_iterable([1, 1, 0]).binary_to_decimal(), "Unrolled binary_to_decimal")
+
+# --------------------------------------------------
+
+print_title("ITERATION PROTOCOL TEST")
+dll = DoublyLinkedList.from_iterable([1, 2, 3, 4, 5])
+check([1, 2, 3, 4, 5], list(dll), "iter yields values head to tail")
+check([5, 4, 3, 2, 1], list(reversed(dll)), "reversed yields values tail to head")
+check(5, len(dll), "len")
+check(True, 3 in dll, "in finds a value")
+check(False, 9 in dll, "in misses a value")
+check(False, bool(DoublyLinkedList()), "Empty list is falsy")
+check([1, 2, 3, 4, 5], [node.value for node in dll.iter_nodes()], "iter_nodes")
+check([5, 4, 3, 2, 1], [node.value for node in dll.iter_nodes(reverse=True)], "iter_nodes reverse")
+check([2, 3, 4], list(dll.values_slice(1, 4)), "values_slice middle")
+check([4, 5], list(dll.values_slice(3)), "values_slice to the end")
+check([4, 5], list(dll.values_slice(-2)), "values_slice negative start")
+check([], list(dll.values_slice(4, 2)), "values_slice empty range")
+
+for variant in (PooledDoublyLinkedList, UnrolledDoublyLinkedList, IndexedDoublyLinkedList):
+    name = variant.__name__
+    other = variant.from_iterable([1, 2, 3, 4, 5])
+    check([1, 2, 3, 4, 5], list(other), f"{name} iter")
+    check([5, 4, 3, 2, 1], list(reversed(other)), f"{name} reversed")
+    check((5, True), (len(other), 4 in other), f"{name} len and in")
+    check([2, 3, 4], list(other.values_slice(1, 4)), f"{name} values_slice")
+
+# --------------------------------------------------
+
+print_title("CONCAT, SPLIT & SPLICE TEST")
+left = DoublyLinkedList.from_iterable([1, 2])
+right = DoublyLinkedList.from_iterable([3, 4])
+left.concat(right)
+check_list(left, [1, 2, 3, 4], "List after concat")
+check((4, 0, None), (left.length, right.length, right.head), "concat empties the other list")
+check(2, left.tail.prev.prev.value, "prev links across the seam")
+
+empty = DoublyLinkedList()
+empty.concat(left)
+check_list(empty, [1, 2, 3, 4], "concat into an empty list")
+
+dll, tail_part = DoublyLinkedList.from_iterable(range(6)).split_at(2)
+check_list(dll, [0, 1], "Left part after split_at")
+check_list(tail_part, [2, 3, 4, 5], "Right part after split_at")
+check((2, 4), (dll.length, tail_part.length), "Lengths after split_at")
+check((None, None), (dll.tail.next, tail_part.head.prev), "Split ends are unlinked")
+dll, rest = DoublyLinkedList.from_iterable([1, 2]).split_at(0)
+check(([], [1, 2]), (list(dll), list(rest)), "split_at(0) moves everything")
+check(None, DoublyLinkedList.from_iterable([1]).split_at(5), "split_at out of range")
+
+dll = DoublyLinkedList.from_iterable([1, 5])
+dll.splice(1, DoublyLinkedList.from_iterable([2, 3, 4]))
+check_list(dll, [1, 2, 3, 4, 5], "splice in the middle")
+dll.splice(0, DoublyLinkedList.from_iterable([0]))
+check_list(dll, [0, 1, 2, 3, 4, 5], "splice at the front")
+check(4, dll.get(5).prev.value, "prev links after splice")
+
+idll = IndexedDoublyLinkedList.from_iterable(range(10))
+idll, irest = idll.split_at(4)
+idll.splice(2, irest)
+check([0, 1, 4, 5, 6, 7, 8, 9, 2, 3], [idll.get(i).value for i in range(10)], "Indexed get after split and splice")
+
+# --------------------------------------------------
+
+print_title("NODE HANDLE TEST")
+dll = DoublyLinkedList.from_iterable([1, 2, 3, 4])
+middle = dll.get(2)
+dll.move_to_front(middle)
+check_list(dll, [3, 1, 2, 4], "move_to_front")
+dll.move_to_back(dll.head)
+check_list(dll, [1, 2, 4, 3], "move_to_back")
+check(4, dll.tail.prev.value, "prev links after move_to_back")
+check(1, dll.unlink(dll.head).value, "unlink head")
+dll.unlink(dll.tail)
+check_list(dll, [2, 4], "List after unlink")
+check((2, 4), (dll.head.value, dll.tail.value), "Head and tail after unlink")
+
+# --------------------------------------------------
+
+print_title("LRU CACHE TEST")
+evicted = []
+lru = LRUCache(2, on_evict=lambda key, value: evicted.append((key, value)))
+lru.put("a", 1)
+lru.put("b", 2)
+check(1, lru.get("a"), "LRU get hit")
+lru.put("c", 3)
+check([("b", 2)], evicted, "LRU evicts the least recently used key")
+check(None, lru.get("b"), "LRU get miss")
+check(["c", "a"], lru.keys(), "LRU order, most recent first")
+lru.put("a", 10)
+check(10, lru.get("a"), "LRU update")
+check((2, 1), (lru.hits, lru.misses), "LRU hit/miss counters")
+check(3, lru.remove("c"), "LRU remove")
+check(1, len(lru), "LRU size")
+
+# --------------------------------------------------
+
+print_title("LFU CACHE TEST")
+evicted = []
+lfu = LFUCache(2, on_evict=lambda key, value: evicted.append(key))
+lfu.put("a", 1)
+lfu.put("b", 2)
+lfu.get("a")
+lfu.put("c", 3)
+check(["b"], evicted, "LFU evicts the least frequently used key")
+check(2, lfu.frequency("a"), "LFU frequency")
+lfu.get("c")
+lfu.put("d", 4)
+check(["b", "a"], evicted, "LFU breaks count ties by recency")
+check(None, lfu.get("b"), "LFU get miss")
+check((2, 1), (lfu.hits, lfu.misses), "LFU hit/miss counters")
+check(3, lfu.remove("c"), "LFU remove")
+lfu.put("e", 5)
+lfu.put("f", 6)
+check("d", evicted[-1], "LFU eviction after remove")
+
+# --------------------------------------------------
+
+print_title("HASHED LIST TEST")
+hdll = HashedDoublyLinkedList.from_iterable([1, 2, 1, 3])
+check(2, hdll.find(2).value, "find returns a node holding the value")
+check(None, hdll.find(9), "find misses")
+check(2, hdll.count(1), "count")
+check(True, 3 in hdll, "in uses the index")
+hdll.set_value(1, 5)
+check((0, 1), (hdll.count(2), hdll.count(5)), "set_value re-indexes the node")
+hdll.insert(2, 5)
+hdll.prepend(1)
+check(3, hdll.count(1), "insert and prepend are indexed")
+check(3, hdll.remove_value(3).value, "remove_value")
+check_list(hdll, [1, 1, 5, 5, 1], "List after remove_value")
+hdll.remove_duplicates()
+check_list(hdll, [1, 5], "Incremental remove_duplicates keeps first occurrences")
+check((1, 1), (hdll.count(1), hdll.count(5)), "Counts after remove_duplicates")
+hdll.swap_pairs()
+check_list(hdll, [5, 1], "swap_pairs")
+check(5, hdll.find(5).value, "find after swap_pairs")
+
+cur = hdll.cursor(0)
+cur.insert_after(7)
+check(1, hdll.count(7), "Index catches up after a cursor edit")
+hdll.pop()
+hdll.pop_first()
+check((0, 0, 1), (hdll.count(1), hdll.count(5), hdll.count(7)), "pop and pop_first are indexed")
+hdll = HashedDoublyLinkedList.from_iterable([1, 2])
+hdll.cursor(0).value = 7
+check((1, 0, True, None), (hdll.count(7), hdll.count(1), 7 in hdll, hdll.find(1)),
+      "A cursor's value setter re-indexes the node")
+check(True, hdll.validate(), "validate after a cursor value edit")
+
+# --------------------------------------------------
+
+print_title("CONCURRENT LIST TEST")
+cdll = ConcurrentDoublyLinkedList(capacity=3)
+cdll.append(2)
+cdll.prepend(1)
+cdll.append(3)
+check([1, 2, 3], list(cdll), "append and prepend")
+check(False, cdll.append(4), "append on a full list does not wait by default")
+check(False, cdll.append(4, timeout=0.01), "append times out on a full list")
+check(1, cdll.pop_first().value, "pop_first")
+check(3, cdll.pop().value, "pop")
+check(2, cdll.pop(timeout=0.01).value, "pop with a timeout")
+check(None, cdll.pop_first(), "pop_first on an empty list does not wait by default")
+check(None, cdll.pop(timeout=0.01), "pop times out on an empty list")
+
+received = []
+cdll = ConcurrentDoublyLinkedList(capacity=8)
+def consume():
+    for _ in range(2000):
+        received.append(cdll.pop_first(timeout=None).value)
+consumer = threading.Thread(target=consume)
+consumer.start()
+for value in range(2000):
+    cdll.append(value, timeout=None)
+consumer.join()
+check(list(range(2000)), received, "Producer and consumer threads keep FIFO order")
+check(0, len(cdll), "Length after the threads finish")
+
+received = []
+cdll = ConcurrentDoublyLinkedList(capacity=2)
+def produce(add):
+    for value in range(2000):
+        add(value, timeout=None)
+def drain(remove):
+    for _ in range(2000):
+        received.append(remove(timeout=None).value)
+workers = [threading.Thread(target=produce, args=(cdll.append,)),
+           threading.Thread(target=produce, args=(cdll.prepend,)),
+           threading.Thread(target=drain, args=(cdll.pop,)),
+           threading.Thread(target=drain, args=(cdll.pop_first,))]
+for worker in workers:
+    worker.start()
+for worker in workers:
+    worker.join()
+check(sorted(list(range(2000)) * 2), sorted(received), "Threads at both ends lose and repeat no value")
+check(True, cdll.validate(), "validate after threads at both ends")
+
+# --------------------------------------------------
+
+print_title("ASYNC LIST TEST")
+
+async def async_list_test():
+    adll = AsyncDoublyLinkedList(capacity=2)
+    await adll.put(2)
+    await adll.put_first(1)
+    check([1, 2], list(adll), "put and put_first")
+    check(False, adll.put_nowait(3), "put_nowait on a full list")
+    waiting_put = asyncio.create_task(adll.put(3))
+    await asyncio.sleep(0)
+    check(False, waiting_put.done(), "put waits while the list is full")
+    check(1, (await adll.pop_first()).value, "pop_first")
+    check(True, await waiting_put, "put finishes once there is room")
+    check(3, (await adll.pop()).value, "pop")
+    await adll.insert(0, 0)
+    check([0, 2], list(adll), "insert jumps the queue")
+    adll.pop_first_nowait()
+    adll.pop_nowait()
+    check(None, adll.pop_first_nowait(), "pop_first_nowait on an empty list")
+
+    first = asyncio.create_task(adll.pop_first())
+    second = asyncio.create_task(adll.pop_first())
+    await asyncio.sleep(0)
+    adll.put_nowait("x")
+    first.cancel()
+    check("x", (await second).value, "A cancelled waiter passes its value on")
+    check(True, first.cancelled(), "The cancelled waiter is cancelled")
+
+asyncio.run(async_list_test())
+
+# --------------------------------------------------
+
+print_title("DUMP, LOAD & MAPPED VIEW TEST")
+with tempfile.TemporaryDirectory() as folder:
+    path = os.path.join(folder, "list.dll")
+    for values, message in (([3, 1, 2], "ints"), ([0.5, 1.5], "floats"),
+                            (["a", None, (1, 2), 2 ** 70], "pickled values"),
+                            ([], "empty list")):
+        DoublyLinkedList.from_iterable(values).dump(path)
+        check_list(DoublyLinkedList.load(path), values, f"Round trip of {message}")
+        with MappedList(path) as view:
+            check(values, list(view), f"Mapped view of {message}")
+    check(IndexedDoublyLinkedList, type(IndexedDoublyLinkedList.load(path)),
+          "load builds the calling class")
+    DoublyLinkedList.from_iterable(range(100)).dump(path)
+    with MappedList(path) as view:
+        check((100, 42, 97, None), (len(view), view.get(42).value,
+              view.find_kth_from_end(3).value, view.get(100)),
+              "Mapped view get and find_kth_from_end")
+    for values, message in ((range(10000), "ints"), (["a", "b", "c"], "pickled values")):
+        DoublyLinkedList.from_iterable(values).dump(path)
+        view = MappedList(path)
+        iterator = iter(view)
+        next(iterator)
+        try:
+            view.close()
+            check(True, True, f"Closing a mapped view of {message} mid-iteration")
+        except BufferError:
+            check("closed", "BufferError", f"Closing a mapped view of {message} mid-iteration")
+    for values, message in ((range(100), "ints"), ([str(v) for v in range(100)], "pickled values")):
+        DoublyLinkedList.from_iterable(values).dump(path)
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) // 2)
+        for reader in (DoublyLinkedList.load, MappedList):
+            try:
+                reader(path)
+                check("ValueError", "no error", f"{reader.__qualname__} rejects a truncated file of {message}")
+            except ValueError:
+                check(True, True, f"{reader.__qualname__} rejects a truncated file of {message}")
+
+# --------------------------------------------------
+
+print_title("SPILLING LIST TEST")
+with SpillingDoublyLinkedList(chunk_size=4, resident_chunks=2, readahead=1) as sdll:
+    sdll.extend(range(20))
+    check((20, 2, 5), (sdll.length, sdll.stats["resident_chunks"], sdll.stats["chunks"]),
+          "Only the resident budget stays in memory")
+    check(3, sdll.stats["page_outs"], "Cold chunks were paged out")
+    check(list(range(20)), list(sdll), "Iteration pages the chunks back in")
+    check(True, sdll.stats["readahead"] > 0, "Iteration reads ahead")
+    check(13, sdll.get(13).value, "get")
+    sdll.set_value(0, -1)
+    check(-1, sdll.pop_first().value, "set_value and pop_first")
+    sdll.reverse()
+    check((19, 1), (sdll.pop_first().value, sdll.pop().value), "reverse is O(1) and flips the ends")
+    sdll.append(100)
+    sdll.prepend(200)
+    check([200] + list(range(18, 1, -1)) + [100], list(sdll), "append and prepend after reverse")
+
+with SpillingDoublyLinkedList(chunk_size=16, resident_chunks=3, readahead=1) as sdll:
+    sdll.extend(range(1000))
+    for value in range(1000):
+        sdll.append(value)
+        sdll.pop_first()
+    warm = sdll.stats["file_bytes"]
+    for value in range(10000):
+        sdll.append(value)
+        sdll.pop_first()
+    check(True, 0 < sdll.stats["file_bytes"] <= 2 * warm,
+          "Spill file stays bounded under append + pop_first churn")
+    check(True, sdll.validate(), "validate: chunk slots and free slots do not overlap")
+    check(list(range(9000, 10000)), list(sdll), "Values survive reusing freed slots")
+    sdll.make_empty()
+    check((0, 0), (sdll.stats["file_bytes"], sdll.stats["free_bytes"]), "make_empty frees the whole file")
+
+# --------------------------------------------------
+
+print_title("SORT TEST")
+dll = DoublyLinkedList.from_iterable([3, 1, 2, 5, 4])
+nodes = list(dll.iter_nodes())
+dll.sort()
+check_list(dll, [1, 2, 3, 4, 5], "sort")
+check(sorted(map(id, nodes)), sorted(map(id, dll.iter_nodes())), "sort relinks the same nodes")
+check([5, 4, 3, 2, 1], list(reversed(dll)), "prev links after sort")
+check((1, 5), (dll.head.value, dll.tail.value), "Head and tail after sort")
+pairs = [(1, "a"), (0, "b"), (1, "c"), (0, "d")]
+dll = DoublyLinkedList.from_iterable(pairs)
+dll.sort(key=lambda pair: pair[0])
+check_list(dll, [(0, "b"), (0, "d"), (1, "a"), (1, "c")], "sort is stable")
+dll.sort(key=lambda pair: pair[0], reverse=True)
+check_list(dll, [(1, "a"), (1, "c"), (0, "b"), (0, "d")], "reverse sort is stable")
+dll = DoublyLinkedList.from_iterable([2, "x", 1])
+try:
+    dll.sort()
+except TypeError:
+    pass
+check(["1", "2", "x"], sorted(map(str, dll)), "A failed sort keeps every node")
+for cls in (PooledDoublyLinkedList, UnrolledDoublyLinkedList, HashedDoublyLinkedList):
+    variant = cls.from_iterable([3, 1, 2])
+    variant.sort(reverse=True)
+    check_list(variant, [3, 2, 1], f"{cls.__name__} sort")
+
+# --------------------------------------------------
+
+print_title("SORTED LIST TEST")
+sdll = SortedDoublyLinkedList.from_iterable([5, 1, 3])
+sdll.insert_sorted(4)
+sdll.insert_sorted(0)
+sdll.insert_sorted(9)
+check_list(sdll, [0, 1, 3, 4, 5, 9], "insert_sorted keeps the order")
+check((2, 3), (sdll.bisect_left(3), sdll.bisect_right(3)), "bisect_left and bisect_right")
+check((True, False), (4 in sdll, 2 in sdll), "in searches by value")
+check([3, 4, 5], list(sdll.irange(2, 5)), "irange")
+check([4], list(sdll.irange(3, 5, inclusive=(False, False))), "irange with open ends")
+other = SortedDoublyLinkedList.from_iterable([2, 4, 10])
+sdll.merge(other)
+check_list(sdll, [0, 1, 2, 3, 4, 4, 5, 9, 10], "merge")
+check(0, other.length, "merge empties the other list")
+check(4, sdll.get(5).value, "get after merge")
+try:
+    sdll.append(1)
+    check("OrderError", "no error", "append is rejected")
+except OrderError as error:
+    check(True, isinstance(error, TypeError), "append is rejected with an OrderError, a TypeError")
+small_sorted = SortedDoublyLinkedList.from_iterable([1, 2, 3])
+sorted_cursor = small_sorted.cursor(0)
+for name, edit in (("insert_after", lambda: sorted_cursor.insert_after(100)),
+                   ("insert_before", lambda: sorted_cursor.insert_before(100)),
+                   ("value setter", lambda: setattr(sorted_cursor, "value", 100))):
+    try:
+        edit()
+        check("OrderError", "no error", f"Cursor {name} is rejected on a sorted list")
+    except OrderError:
+        check(True, True, f"Cursor {name} is rejected on a sorted list")
+check(1, sorted_cursor.remove_here().value, "A sorted list's cursor can still remove")
+check_list(small_sorted, [2, 3], "Sorted list after a cursor removal")
+try:
+    sdll.merge(DoublyLinkedList.from_iterable([7, 2]))
+    check("OrderError", "no error", "merge rejects an unsorted list")
+except OrderError:
+    check(True, sdll.validate(), "merge rejects an unsorted list and leaves this one sorted")
+
+# --------------------------------------------------
+
+print_title("NODE-RELATIVE & BATCHED MUTATION TEST")
+dll = DoublyLinkedList.from_iterable([1, 2, 5])
+node = dll.get(1)
+check(3, dll.insert_after(node, 3).value, "insert_after returns the new node")
+dll.insert_before(node, 0)
+check_list(dll, [1, 0, 2, 3, 5], "insert_before and insert_after")
+check(0, dll.remove_node(node.prev).value, "remove_node")
+check(True, dll.insert_many(3, [4, 4.5]), "insert_many")
+check_list(dll, [1, 2, 3, 4, 4.5, 5], "List after insert_many")
+check(False, dll.insert_many(9, [7]), "insert_many out of range")
+check(2, dll.remove_range(3, 5), "remove_range returns the count")
+check_list(dll, [1, 2, 3, 5], "List after remove_range")
+check(2, dll.remove_range(-2, None), "remove_range with slice semantics")
+check((2, 2), (dll.tail.value, dll.length), "Tail and length after remove_range")
+for cls in (PooledDoublyLinkedList, UnrolledDoublyLinkedList, HashedDoublyLinkedList):
+    variant = cls.from_iterable([1, 5])
+    variant.insert_many(1, [2, 3, 4])
+    variant.remove_range(0, 2)
+    check_list(variant, [3, 4, 5], f"{cls.__name__} insert_many and remove_range")
+udll = UnrolledDoublyLinkedList.from_iterable(range(20), capacity=4)
+udll.insert_many(6, range(100, 111))
+check_list(udll, list(range(6)) + list(range(100, 111)) + list(range(6, 20)),
+           "Unrolled insert_many splits the target block")
+check(11, udll.remove_range(3, 14), "Unrolled remove_range across several blocks")
+check_list(udll, [0, 1, 2, 108, 109, 110] + list(range(6, 20)), "Unrolled list after remove_range")
+check(True, udll.validate(), "Unrolled blocks stay within capacity after the edits")
+
+# --------------------------------------------------
+
+print_title("SLOTS & DEBUG MODE TEST")
+dll = DoublyLinkedList.from_iterable([1, 2, 3])
+check(False, hasattr(dll, "__dict__"), "DoublyLinkedList has no per-instance __dict__")
+set_debug(True)
+try:
+    dll.append(4)
+    check_list(dll, [1, 2, 3, 4], "Checked append on a healthy list")
+    dll.get(2).prev = None
+    try:
+        dll.pop()
+        check("ValueError", "no error", "Debug mode catches a broken prev link")
+    except ValueError:
+        check(True, True, "Debug mode catches a broken prev link")
+finally:
+    set_debug(False)
+check(False, hasattr(DoublyLinkedList.append, "__wrapped__"), "set_debug(False) restores the methods")
+
+# --------------------------------------------------
+
+print_title("VALIDATE & FUZZ TEST")
+dll = DoublyLinkedList.from_iterable([1, 2, 3, 4])
+check(True, dll.validate(), "validate() on a healthy list")
+dll.get(2).prev = dll.head
+try:
+    dll.validate()
+    check("ValueError", "no error", "validate() catches a broken prev link")
+except ValueError:
+    check(True, True, "validate() catches a broken prev link")
+dll = IndexedDoublyLinkedList.from_iterable(range(50))
+dll._last_pos[0] += 1
+try:
+    dll.validate()
+    check("ValueError", "no error", "validate() catches a stale skip-list lane")
+except ValueError:
+    check(True, True, "validate() catches a stale skip-list lane")
+for cls in fuzz.CLASSES.values():
+    check(True, fuzz.fuzz(cls, seed=1, steps=300), f"Fuzz {cls.__name__} against a list model")
+clist = ConcurrentDoublyLinkedList(capacity=8)
+for i in range(5):
+    clist.append(i)
+clist.pop_first()
+alist = AsyncDoublyLinkedList(capacity=4)
+alist.put_nowait(1)
+with SpillingDoublyLinkedList(chunk_size=4, resident_chunks=3, readahead=1) as slist:
+    slist.extend(range(100))
+    slist.pop_first()
+    check(True, clist.validate() and alist.validate() and slist.validate(),
+          "validate() on the concurrent, asyncio and spilling lists")
+set_debug(True)
+try:
+    for cls in fuzz.CLASSES.values():
+        check(True, fuzz.fuzz(cls, seed=2, steps=300), f"Fuzz {cls.__name__} in debug mode")
+    dll = HashedDoublyLinkedList.from_iterable([1, 2, 3, 9])
+    dll.swap_pairs()
+    check_list(dll, [2, 1, 9, 3], "Debug mode validates only after the outermost call")
+finally:
+    set_debug(False)
+
+# --------------------------------------------------
+
+print_title("NUMPY CONVERSION & NUMERIC LIST TEST")
+if np is None:
+    print("NumPy is not installed; skipped.")
+else:
+    dll = DoublyLinkedList.from_iterable([3, 1, 2])
+    array = dll.to_numpy(np.int64)
+    check("int64 [3, 1, 2]", f"{array.dtype} {array.tolist()}", "to_numpy(int64) preallocates the dtype")
+    check_list(DoublyLinkedList.from_numpy(np.arange(4)), [0, 1, 2, 3], "from_numpy builds one node per element")
+    numbers = NumericDoublyLinkedList.from_iterable([4, 1, 3, 1, 2, 4])
+    check("int64", str(numbers.dtype), "from_iterable infers the dtype")
+    numbers.prepend(0)
+    numbers.append(5)
+    numbers.insert(3, 9)
+    check_list(numbers, [0, 4, 1, 9, 3, 1, 2, 4, 5], "append, prepend and insert")
+    check(9, numbers.remove(3).value, "remove returns a detached Node")
+    check((20, 0, 5), (numbers.sum(), numbers.min(), numbers.max()), "sum, min and max")
+    numbers.partition_list(3)
+    check_list(numbers, [0, 1, 1, 2, 4, 3, 4, 5], "Vectorized partition_list is stable")
+    numbers.remove_duplicates()
+    check_list(numbers, [0, 1, 2, 4, 3, 5], "Vectorized remove_duplicates keeps first occurrences")
+    check(False, numbers.is_palindrome(), "Vectorized is_palindrome")
+    bits = NumericDoublyLinkedList.from_iterable([1, 0, 1, 1] * 20)
+    check(int("1011" * 20, 2), bits.binary_to_decimal(), "Vectorized binary_to_decimal beyond 64 bits")
+    try:
+        numbers.append(1.5)
+        check("ValueError", "no error", "A float does not fit an int64 list")
+    except ValueError:
+        check(True, True, "A float does not fit an int64 list")
+    small = NumericDoublyLinkedList(dtype=np.int8)
+    try:
+        small.append(300)
+        check("ValueError", "no error", "300 does not wrap around in an int8 list")
+    except ValueError:
+        check(True, True, "300 does not wrap around in an int8 list")
+    try:
+        small.extend([1, 2, -129])
+        check("ValueError", "no error", "-129 does not wrap around in an int8 list")
+    except ValueError:
+        check_list(small, [], "-129 does not wrap around in an int8 list, and nothing is added")
+    unsigned = NumericDoublyLinkedList(dtype=np.uint8)
+    unsigned.extend([0, 255])
+    check_list(unsigned, [0, 255], "Python ints that fit are stored in a uint8 list")
+    try:
+        unsigned.append(-1)
+        check("ValueError", "no error", "A negative value does not fit a uint8 list")
+    except ValueError:
+        check_list(unsigned, [0, 255], "A negative value does not fit a uint8 list")
+    signed_zeros = NumericDoublyLinkedList.from_iterable([0.0, -0.0, 1.0])
+    signed_zeros.sort(reverse=True)
+    check([repr(v) for v in sorted([0.0, -0.0, 1.0], reverse=True)], [repr(v) for v in signed_zeros],
+          "Vectorized sort(reverse=True) is stable like sorted()")
+
+# --------------------------------------------------
+
+print_title("LAZY REVERSE TEST")
+dll = LazyReverseDoublyLinkedList.from_iterable([1, 2, 3, 4])
+version = dll.version
+dll.reverse()
+check(True, dll.is_reversed, "reverse() only flips the orientation flag")
+check(True, dll.version > version, "reverse() still bumps the version")
+check_list(dll, [4, 3, 2, 1], "Iteration reads through the flag")
+dll.append(0)
+dll.prepend(5)
+check_list(dll, [5, 4, 3, 2, 1, 0], "append and prepend on a reversed list")
+check((5, 0, 3), (dll.head.value, dll.tail.value, dll.get(2).value), "head, tail and get")
+dll.insert(1, 9)
+check(2, dll.remove(4).value, "remove counts from the logical head")
+dll.reverse_between(0, 2)
+check_list(dll, [4, 9, 5, 3, 1, 0], "insert, remove and reverse_between without normalizing")
+check(True, dll.is_reversed, "Mirrored methods keep the flag")
+dll.partition_list(4)
+check(False, dll.is_reversed, "partition_list normalizes first")
+check_list(dll, [3, 1, 0, 4, 9, 5], "partition_list after normalizing")
+dll = LazyReverseDoublyLinkedList.from_iterable([1, 2, 3, 4])
+dll.reverse()
+dll.insert_many(1, [10, 11])
+check_list(dll, [4, 10, 11, 3, 2, 1], "insert_many on a reversed list")
+check(3, dll.remove_range(1, 4), "remove_range on a reversed list")
+check((True, True), (dll.is_reversed, dll.validate()), "Reversed batch edits keep the flag and the links")
+check_list(dll, [4, 2, 1], "List after remove_range on a reversed list")
+
+def lazy_values_then_error():
+    yield 10
+    yield 11
+    raise KeyError("iterable failed")
+
+try:
+    dll.insert_many(1, lazy_values_then_error())
+    check("KeyError", "no error", "Reversed insert_many passes on the iterable's error")
+except KeyError:
+    check_list(dll, [4, 2, 1], "Reversed insert_many leaves the list unchanged when the iterable fails")
+
+# --------------------------------------------------
+
+print_title("PERSISTENT LIST TEST")
+plist = PersistentList(range(1, 6))
+snapshot = plist.snapshot()
+plist.append(6)
+plist.set_value(0, 0)
+check(2, plist.remove(1).value, "remove returns a detached Node")
+check_list(plist, [0, 3, 4, 5, 6], "Updates apply to the list")
+check_list(snapshot, [1, 2, 3, 4, 5], "The snapshot keeps its values")
+snapshot.prepend(9)
+check_list(plist, [0, 3, 4, 5, 6], "Updating the snapshot leaves the list alone")
+check((4, 5, 3), (plist.find_middle_node().value, plist.find_kth_from_end(2).value, plist.get(1).value),
+      "find_middle_node, find_kth_from_end and get")
+check(True, PersistentList("racecar").is_palindrome(), "is_palindrome")
+plist.insert_many(1, [1, 2])
+check(3, plist.remove_range(-3, None), "remove_range with slice semantics")
+check_list(plist, [0, 1, 2, 3], "insert_many and remove_range split and join trees")
+big = PersistentList(range(100_000))
+copy = big.snapshot()
+for i in range(0, 100_000, 7):
+    big.set_value(i, -i)
+check(True, big.validate() and copy.validate(), "Trees stay balanced after many updates")
+check(list(range(100_000)), list(copy), "A snapshot survives 14k updates to the list")
+
+print_title("SNAPSHOT VIEW TEST")
+dll = DoublyLinkedList.from_iterable(range(1, 7))
+view = dll.snapshot()
+reader = iter(view)
+check([1, 2], [next(reader), next(reader)], "Read the first two values of the snapshot")
+dll.append(7)
+dll.prepend(0)
+check(6, view.shared, "Appending and prepending leave every node shared")
+dll.pop_first()
+dll.pop_first()
+dll.pop()
+dll.set_value(1, 30)
+check(5, view.shared, "Removing from an end copies just the removed value")
+dll.reverse()
+check(0, view.shared, "Relinking the middle copies the rest once")
+check([3, 4, 5, 6], list(reader), "An iterator started before the edits keeps going")
+check_list(view, [1, 2, 3, 4, 5, 6], "The snapshot keeps its values")
+check_list(dll, [6, 5, 4, 30, 2], "The list has all the edits")
+check((4, 6, 3), (view.find_middle_node().value, view.tail.value, view.get(2).value),
+      "find_middle_node, tail and get return detached Nodes")
+lazy = LazyReverseDoublyLinkedList.from_iterable("abc")
+lazy.reverse()
+view = lazy.snapshot()
+lazy.pop()
+check(["c", "b", "a"], list(view), "A snapshot follows the lazy orientation")
+dll = DoublyLinkedList.from_iterable(range(5))
+try:
+    for value in dll:
+        if value == 2:
+            dll.remove(3)
+    check("RuntimeError", "no error", "Iterating while the list changes raises")
+except RuntimeError:
+    check(True, True, "Iterating while the list changes raises")
+for value in dll.snapshot():
+    if value == 2:
+        dll.remove(2)
+check_list(dll, [0, 1, 4], "Iterating a snapshot while the list changes is safe")
+
+print_title("PARALLEL MAP / FILTER / REDUCE TEST")
+# Fork workers: under spawn or forkserver every worker would re-run this
+# whole script on import. Without fork the batches run in this process.
+if "fork" in multiprocessing.get_all_start_methods():
+    pool = ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("fork"))
+else:
+    pool = None
+dll = DoublyLinkedList.from_iterable(range(-50, 50))
+check_list(dll.parallel_map(abs, chunk_size=7, max_workers=2, executor=pool),
+           [abs(v) for v in range(-50, 50)], "parallel_map keeps the order across batches")
+check_list(dll.parallel_filter(bool, chunk_size=7, max_workers=2, executor=pool),
+           [v for v in range(-50, 50) if v], "parallel_filter keeps the order across batches")
+check(sum(range(-50, 50)) + 1000,
+      dll.parallel_reduce(operator.add, 1000, chunk_size=7, max_workers=2, executor=pool),
+      "parallel_reduce folds the batch results into init")
+check_list(dll.parallel_map(abs, chunk_size=1, max_workers=1, executor=pool),
+           [abs(v) for v in range(-50, 50)], "Batches beyond the in-flight limit keep their order")
+if pool is not None:
+    pool.shutdown()
+check(5, DoublyLinkedList().parallel_reduce(operator.add, 5), "Reducing an empty list gives init")
+check(DoublyLinkedList, type(HashedDoublyLinkedList.from_iterable("ab").parallel_map(str.upper)),
+      "The result is a plain DoublyLinkedList")
+check_list(SortedDoublyLinkedList.from_iterable([1, 2, 3]).parallel_map(operator.neg), [-1, -2, -3],
+           "Mapping a sorted list keeps the mapped order")
+try:
+    dll.parallel_map(abs, chunk_size=0)
+    check("ValueError", "no error", "chunk_size 0 is rejected")
+except ValueError:
+    check(True, True, "chunk_size 0 is rejected")
+
+print_title("INTRUSIVE LIST TEST")
+
+
+class Task(IntrusiveNode):
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+tasks = [Task(name) for name in "abcdef"]
+ilist = IntrusiveDoublyLinkedList.from_iterable(tasks[:4])
+check(True, ilist.get(2) is tasks[2] and ilist.pop() is tasks[3], "The list links and returns the objects themselves")
+check(True, ilist.unlink(tasks[1]) is tasks[1] and tasks[1].owner is None, "unlink(obj) removes an object in O(1)")
+check(["a", "c"], [task.name for task in ilist], "Iteration yields the objects")
+try:
+    ilist.append(tasks[0])
+    check("ValueError", "no error", "An object can be in one list at a time")
+except ValueError:
+    check(True, True, "An object can be in one list at a time")
+other = IntrusiveDoublyLinkedList.from_iterable(tasks[4:])
+ilist.splice(1, other)
+ilist.insert(0, tasks[1])
+ilist.swap_pairs()
+check(["a", "b", "f", "e", "c"], [task.name for task in ilist], "splice, insert and swap_pairs relink objects")
+check(True, tasks[4].owner is ilist and other.length == 0, "Spliced objects change owner")
+check(True, ilist.validate(), "validate() checks every owner")
+ilist.make_empty()
+check((None, None), (tasks[0].owner, tasks[0].next), "make_empty unlinks every object")
+ilist = IntrusiveDoublyLinkedList.from_iterable(tasks[:2])
+icursor = ilist.cursor(0)
+icursor.value = tasks[2]
+check(["c", "b"], [task.name for task in ilist], "A cursor's value setter replaces the object")
+check((None, True, True), (tasks[0].owner, icursor.value is tasks[2], ilist.validate()),
+      "The old object is unlinked and the cursor moves onto the new one")
+other = IntrusiveDoublyLinkedList.from_iterable(tasks[3:5])
+ilist.splice(ilist.length, other)
+check((["c", "b", "d", "e"], True), ([task.name for task in ilist], tasks[4].owner is ilist),
+      "splice at the end moves objects to this list")
+ilist.make_empty()
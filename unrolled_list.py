@@ -0,0 +1,514 @@
+from itertools import islice
+
+from doubly_linked_list import Node, _EMPTY
+
+# Default number of values per block
+BLOCK_CAPACITY = 64
+
+
+# ------------------------------
+# Block of values for the unrolled list
+# ------------------------------
+class _Block:
+    __slots__ = ("values", "next", "prev")
+
+    def __init__(self, values):
+        self.values = values
+        self.next = None
+        self.prev = None
+
+
+# ------------------------------
+# Unrolled Doubly LinkedList
+# ------------------------------
+class UnrolledDoublyLinkedList:
+    """Doubly linked list of blocks, each holding up to `capacity` values.
+
+    Scans run over plain Python lists inside each block, so methods such as
+    ``is_palindrome``, ``remove_duplicates`` and ``binary_to_decimal`` touch
+    one pointer per block instead of one ``Node`` per value, and each value
+    costs about one list slot instead of a whole node.
+
+    A full block is split in half on insert; a block that drops below a
+    quarter full is merged with its neighbour when they fit together.
+
+    The public API matches ``DoublyLinkedList``, except that there are no
+    per-value nodes to hand out: ``get``, ``head``, ``tail``, the finder
+    methods and the removal methods return a detached ``Node`` holding the
+    value. Use ``set_value`` to change a value in place.
+    """
+
+    def __init__(self, value=_EMPTY, capacity=BLOCK_CAPACITY):
+        if capacity < 2:
+            raise ValueError("Block capacity must be at least 2.")
+        self._capacity = capacity
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._version = 0
+        if value is not _EMPTY:
+            self.append(value)
+
+    # -------------------------------
+    # Properties: head, tail, length
+    # -------------------------------
+    @property
+    def head(self):
+        return Node(self._head.values[0]) if self._head else None
+
+    @property
+    def tail(self):
+        return Node(self._tail.values[-1]) if self._tail else None
+
+    @property
+    def length(self):
+        return self._length
+
+    @property
+    def version(self):
+        """Counter bumped by every change to the list's structure."""
+        return self._version
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    # -------------------------------
+    # Block management
+    # -------------------------------
+    def _link_block_after(self, before, block):
+        """Link block after before (None means at the front)"""
+        if before is None:
+            after = self._head
+            self._head = block
+        else:
+            after = before.next
+            before.next = block
+        block.prev = before
+        block.next = after
+        if after is None:
+            self._tail = block
+        else:
+            after.prev = block
+
+    def _unlink_block(self, block):
+        if block.prev is None:
+            self._head = block.next
+        else:
+            block.prev.next = block.next
+        if block.next is None:
+            self._tail = block.prev
+        else:
+            block.next.prev = block.prev
+
+    def _locate(self, index):
+        """Return (block, offset) for the value at index"""
+        if index < self._length / 2:
+            block = self._head
+            while index >= len(block.values):
+                index -= len(block.values)
+                block = block.next
+            return block, index
+        index = self._length - 1 - index
+        block = self._tail
+        while index >= len(block.values):
+            index -= len(block.values)
+            block = block.prev
+        return block, len(block.values) - 1 - index
+
+    def _rebalance(self, block):
+        """Merge a block that ran low into a neighbour, or drop it if empty"""
+        if not block.values:
+            self._unlink_block(block)
+            return
+        if len(block.values) >= self._capacity // 4:
+            return
+        for neighbour in (block.prev, block.next):
+            if neighbour and len(neighbour.values) + len(block.values) <= self._capacity:
+                if neighbour is block.prev:
+                    neighbour.values.extend(block.values)
+                else:
+                    neighbour.values[:0] = block.values
+                self._unlink_block(block)
+                return
+
+    def _values(self):
+        """Return every value as one flat Python list"""
+        values = []
+        block = self._head
+        while block:
+            values.extend(block.values)
+            block = block.next
+        return values
+
+    def _load(self, values):
+        """Replace the contents with values, packed into full blocks"""
+        self._head = None
+        self._tail = None
+        capacity = self._capacity
+        for start in range(0, len(values), capacity):
+            self._link_block_after(self._tail, _Block(values[start:start + capacity]))
+        self._length = len(values)
+        self._version += 1
+
+    def _write_back(self, values):
+        """Overwrite the values in place, keeping the current block layout"""
+        block = self._head
+        start = 0
+        while block:
+            end = start + len(block.values)
+            block.values[:] = values[start:end]
+            start = end
+            block = block.next
+
+    def validate(self):
+        """Check block links, ends, block sizes and length; return True or raise ValueError"""
+        count = 0
+        previous = None
+        block = self._head
+        while block is not None:
+            if block.prev is not previous:
+                raise ValueError("Broken prev link between blocks.")
+            if not 0 < len(block.values) <= self._capacity:
+                raise ValueError(f"Block holds {len(block.values)} values.")
+            count += len(block.values)
+            if count > self._length:
+                raise ValueError("More values than length, or a cycle.")
+            previous = block
+            block = block.next
+        if previous is not self._tail:
+            raise ValueError("Last block reached from head is not the tail.")
+        if count != self._length:
+            raise ValueError(f"Length is {self._length} but the list has {count} values.")
+        return True
+
+    # -------------------------------
+    # Iteration protocol
+    # -------------------------------
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        """Yield the values from head to tail"""
+        block = self._head
+        while block is not None:
+            yield from block.values
+            block = block.next
+
+    def __reversed__(self):
+        """Yield the values from tail to head"""
+        block = self._tail
+        while block is not None:
+            yield from reversed(block.values)
+            block = block.prev
+
+    def __contains__(self, value):
+        block = self._head
+        while block is not None:
+            if value in block.values:
+                return True
+            block = block.next
+        return False
+
+    def values_slice(self, start=0, stop=None):
+        """Lazily yield the values at indexes start..stop-1 (slice semantics)"""
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start >= stop:
+            return
+        block, offset = self._locate(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = block.values[offset:offset + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            block = block.next
+            offset = 0
+
+    # -------------------------------
+    # Core methods
+    # -------------------------------
+    def print_list(self):
+        """Print the linked list in a readable format."""
+        if self._head is None:
+            print("empty list")
+        else:
+            values = [str(value) for value in self._values()]
+            values.append("None")
+            print(" <-> ".join(values))
+
+    def make_empty(self):
+        """Reset the linked list to empty"""
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._version += 1
+
+    def append(self, value):
+        """Add a value at the end"""
+        tail = self._tail
+        if tail is None or len(tail.values) >= self._capacity:
+            self._link_block_after(tail, _Block([value]))
+        else:
+            tail.values.append(value)
+        self._length += 1
+        self._version += 1
+        return True
+
+    def extend(self, iterable):
+        """Add every value from iterable at the end, a block at a time"""
+        values = iter(iterable)
+        capacity = self._capacity
+        tail = self._tail
+        if tail is not None and len(tail.values) < capacity:
+            before = len(tail.values)
+            tail.values.extend(islice(values, capacity - before))
+            self._length += len(tail.values) - before
+        while True:
+            chunk = list(islice(values, capacity))
+            if not chunk:
+                break
+            self._link_block_after(self._tail, _Block(chunk))
+            self._length += len(chunk)
+        self._version += 1
+        return True
+
+    def extendleft(self, iterable):
+        """Prepend every value from iterable (the values end up reversed)"""
+        values = list(iterable)
+        values.reverse()
+        capacity = self._capacity
+        before = None
+        for start in range(0, len(values), capacity):
+            block = _Block(values[start:start + capacity])
+            self._link_block_after(before, block)
+            before = block
+        self._length += len(values)
+        self._version += 1
+        return True
+
+    @classmethod
+    def from_iterable(cls, iterable=(), capacity=BLOCK_CAPACITY):
+        """Build a new unrolled list from iterable"""
+        dll = cls(capacity=capacity)
+        dll.extend(iterable)
+        return dll
+
+    def pop(self):
+        """Remove the last value and return it in a detached Node"""
+        if self._length == 0:
+            return None
+        tail = self._tail
+        value = tail.values.pop()
+        if not tail.values:
+            self._unlink_block(tail)
+        self._length -= 1
+        self._version += 1
+        return Node(value)
+
+    def prepend(self, value):
+        """Add a value at the beginning"""
+        head = self._head
+        if head is None or len(head.values) >= self._capacity:
+            self._link_block_after(None, _Block([value]))
+        else:
+            head.values.insert(0, value)
+        self._length += 1
+        self._version += 1
+        return True
+
+    def pop_first(self):
+        """Remove the first value and return it in a detached Node"""
+        if self._length == 0:
+            return None
+        head = self._head
+        value = head.values.pop(0)
+        if not head.values:
+            self._unlink_block(head)
+        self._length -= 1
+        self._version += 1
+        return Node(value)
+
+    def get(self, index):
+        """Return a detached Node holding the value at the specified index"""
+        if index < 0 or index >= self._length:
+            return None
+        block, offset = self._locate(index)
+        return Node(block.values[offset])
+
+    def set_value(self, index, value):
+        """Set the value at the specified index"""
+        if index < 0 or index >= self._length:
+            return False
+        block, offset = self._locate(index)
+        block.values[offset] = value
+        return True
+
+    def insert(self, index, value):
+        """Insert a value at the specified index"""
+        if index < 0 or index > self._length:
+            return False
+        if index == self._length:
+            return self.append(value)
+        block, offset = self._locate(index)
+        if len(block.values) >= self._capacity:
+            half = len(block.values) // 2
+            right = _Block(block.values[half:])
+            del block.values[half:]
+            self._link_block_after(block, right)
+            if offset >= half:
+                block = right
+                offset -= half
+        block.values.insert(offset, value)
+        self._length += 1
+        self._version += 1
+        return True
+
+    def remove(self, index):
+        """Remove the value at the specified index and return it in a detached Node"""
+        if index < 0 or index >= self._length:
+            return None
+        block, offset = self._locate(index)
+        value = block.values.pop(offset)
+        self._rebalance(block)
+        self._length -= 1
+        self._version += 1
+        return Node(value)
+
+    def insert_many(self, index, iterable):
+        """Insert every value from iterable starting at index, splitting only the target block"""
+        if index < 0 or index > self._length:
+            return False
+        values = list(iterable)
+        if not values:
+            return True
+        if index == self._length:
+            return self.extend(values)
+        block, offset = self._locate(index)
+        # Cut the block at offset; the new values and the cut-off part
+        # refill it and then spill into new full blocks linked after it
+        run = values + block.values[offset:]
+        del block.values[offset:]
+        capacity = self._capacity
+        room = capacity - len(block.values)
+        block.values.extend(run[:room])
+        before = block
+        for start in range(room, len(run), capacity):
+            following = _Block(run[start:start + capacity])
+            self._link_block_after(before, following)
+            before = following
+        if before is not block:
+            self._rebalance(before)
+        self._length += len(values)
+        self._version += 1
+        return True
+
+    def remove_range(self, start, stop):
+        """Remove the values at indexes start..stop-1 (slice semantics); return how many"""
+        start, stop, _ = slice(start, stop).indices(self._length)
+        if start >= stop:
+            return 0
+        first, offset = self._locate(start)
+        block = first
+        remaining = stop - start
+        while remaining:
+            taken = min(remaining, len(block.values) - offset)
+            del block.values[offset:offset + taken]
+            remaining -= taken
+            following = block.next
+            if not block.values:
+                self._unlink_block(block)
+            last = block
+            block = following
+            offset = 0
+        # Only the blocks at the two edges of the cut can have run low
+        if last is not first and last.values:
+            self._rebalance(last)
+        if first.values:
+            self._rebalance(first)
+        self._length -= stop - start
+        self._version += 1
+        return stop - start
+
+    def is_palindrome(self):
+        """Check if the list is a palindrome"""
+        values = self._values()
+        return values == values[::-1]
+
+    def reverse(self):
+        """Reverse the entire linked list"""
+        block = self._head
+        while block:
+            block.values.reverse()
+            block.prev, block.next = block.next, block.prev
+            block = block.prev
+        self._head, self._tail = self._tail, self._head
+        self._version += 1
+
+    def partition_list(self, x):
+        """Partition list around value x"""
+        values = self._values()
+        self._load([v for v in values if v < x] + [v for v in values if not v < x])
+
+    def sort(self, key=None, reverse=False):
+        """Sort the values in place; stable, key and reverse as in sorted()"""
+        values = self._values()
+        values.sort(key=key, reverse=reverse)
+        self._write_back(values)
+        self._version += 1
+
+    def reverse_between(self, start, end):
+        """Reverse sublist from index start to end (inclusive)"""
+        if self._length <= 1 or start >= end:
+            return
+        values = self._values()
+        values[start:end + 1] = values[start:end + 1][::-1]
+        self._write_back(values)
+        self._version += 1
+
+    def swap_pairs(self):
+        """Swap adjacent values in pairs"""
+        values = self._values()
+        even = self._length - self._length % 2
+        values[0:even:2], values[1:even:2] = values[1:even:2], values[0:even:2]
+        self._write_back(values)
+
+    def find_middle_node(self):
+        """Return a detached Node holding the middle value"""
+        return self.get(self._length // 2)
+
+    def has_loop(self):
+        """Check if the block chain has a loop"""
+        slow = fast = self._head
+        while fast and fast.next:
+            slow = slow.next
+            fast = fast.next.next
+            if slow is fast:
+                return True
+        return False
+
+    def find_kth_from_end(self, k):
+        """Find k-th value from the end"""
+        if k <= 0 or k > self._length:
+            return None
+        return self.get(self._length - k)
+
+    def remove_duplicates(self):
+        """Remove duplicate values in the list"""
+        seen = set()
+        unique = []
+        for value in self._values():
+            if value not in seen:
+                seen.add(value)
+                unique.append(value)
+        if len(unique) != self._length:
+            self._load(unique)
+
+    def binary_to_decimal(self):
+        """Convert binary representation to decimal"""
+        decimal = 0
+        block = self._head
+        while block:
+            for bit in block.values:
+                decimal = decimal * 2 + bit
+            block = block.next
+        return decimal